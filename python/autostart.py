@@ -3,6 +3,10 @@
 Heat Reuse Tool - Automatic Startup
 
 This module automatically loads all data and displays the interface.
+
+The UI package (ipywidgets, IPython, matplotlib) is only loaded inside a
+Jupyter kernel; plain scripts get the data, physics and core functions,
+and UI functions are registered on first lookup.
 """
 
 import os
@@ -23,6 +27,13 @@ MODULE_PRIORITIES = {
     'ui': 4,        # User interface (lowest priority for function conflicts)
 }
 
+# Modules that pull in the GUI stack; discovered up front only in a kernel
+UI_MODULES = ('ui',)
+
+def running_in_notebook():
+    """True inside a Jupyter kernel (checked without importing IPython)."""
+    return 'ipykernel' in sys.modules
+
 # =============================================================================
 # CSV DATA LOADING
 # =============================================================================
@@ -55,10 +66,20 @@ def load_csv_data():
 # MODULE DISCOVERY
 # =============================================================================
 
-def discover_modules():
-    """Discover and load all Python modules quietly."""
+def discover_modules(module_names=None):
+    """
+    Discover and load Python modules quietly.
+
+    Args:
+        module_names: Modules to discover (default: all of MODULE_PRIORITIES,
+                      without UI_MODULES outside a Jupyter kernel)
+    """
     global _function_registry, _module_registry
     
+    if module_names is None:
+        module_names = [name for name in MODULE_PRIORITIES
+                        if running_in_notebook() or name not in UI_MODULES]
+    
     current_dir = Path.cwd()
     python_dir = current_dir / "python"
     
@@ -71,7 +92,7 @@ def discover_modules():
         sys.path.insert(0, python_dir_str)
     
     # Discover modules in priority order
-    for module_name in sorted(MODULE_PRIORITIES.keys(), key=lambda x: MODULE_PRIORITIES[x]):
+    for module_name in sorted(module_names, key=lambda x: MODULE_PRIORITIES[x]):
         module_path = python_dir / module_name
         
         if module_path.exists() and module_path.is_dir():
@@ -244,6 +265,12 @@ def function_help(func_name):
 
 def __getattr__(name):
     """Dynamic attribute access to make registered functions available directly."""
+    if name not in _function_registry and not name.startswith('_'):
+        # UI functions are registered on first lookup outside a kernel
+        missing = [module for module in UI_MODULES if module not in _module_registry]
+        if missing:
+            discover_modules(missing)
+    
     if name in _function_registry:
         return _function_registry[name]['function']
     
@@ -260,7 +287,8 @@ load_csv_data()
 discover_modules()
 
 # Display interface
-display_interface()
+if running_in_notebook():
+    display_interface()
 
 # Export utility functions
 __all__ = [
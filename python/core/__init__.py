@@ -12,12 +12,32 @@ from .original_calculations import (
     get_MW_divd,
     quick_power_calculation
 )
+from .economics import (
+    get_lifecycle_economics,
+    evaluate_design_economics,
+    rank_designs
+)
+from .uncertainty import (
+    run_cost_monte_carlo,
+    run_monte_carlo_scenarios
+)
+from .surrogate import (
+    estimate_allhx_data,
+    get_allhx_surrogate
+)
 
 # Make functions available when importing from core
 __all__ = [
     'get_MW',
     'get_MW_divd', 
-    'quick_power_calculation'
+    'quick_power_calculation',
+    'get_lifecycle_economics',
+    'evaluate_design_economics',
+    'rank_designs',
+    'run_cost_monte_carlo',
+    'run_monte_carlo_scenarios',
+    'estimate_allhx_data',
+    'get_allhx_surrogate'
 ]
 
 __version__ = "1.0.0"
\ No newline at end of file
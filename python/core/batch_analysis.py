@@ -0,0 +1,219 @@
+"""
+Batch system analysis.
+
+Evaluates many parameter sets in one call and returns a flat results table
+with a stable column schema (ANALYSIS_COLUMNS). Each distinct operating
+point is analysed once; scenarios that only differ in cost overrides
+(pipe unit cost, pipe length) are derived from it with vectorized math.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, List, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.original_calculations import get_complete_system_analysis, combine_system_costs
+
+# =============================================================================
+# RESULT SCHEMA
+# =============================================================================
+
+# Input parameters of every scenario
+INPUT_COLUMNS = ['power', 't1', 'temp_diff', 'approach']
+
+# Optional per-scenario cost overrides (absolute values)
+OVERRIDE_COLUMNS = ['pipe_cost_per_meter', 'total_pipe_length']
+
+# Keys of analysis['costs'] carried into the flat schema
+COST_COLUMNS = [
+    'pipe_cost_per_meter', 'total_pipe_length', 'total_pipe_cost',
+    'control_valve_cost', 'isolation_valve_cost', 'total_valve_cost',
+    'hx_cost', 'pump_cost', 'installation_cost', 'total_cost',
+]
+
+# Flat result schema - one row per scenario, same order in every table
+ANALYSIS_COLUMNS = INPUT_COLUMNS + [
+    'status',
+    'power_mw', 't1_celsius', 't2_celsius', 't3_celsius', 't4_celsius',
+    'f1_flow', 'f2_flow',
+    'pipe_size', 'room_size',
+] + COST_COLUMNS
+
+NUMERIC_RESULT_COLUMNS = [c for c in ANALYSIS_COLUMNS if c not in INPUT_COLUMNS + ['status']]
+
+
+def flatten_analysis(analysis: Optional[Dict[str, Any]], parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Flatten a complete system analysis into one row of ANALYSIS_COLUMNS.
+
+    Args:
+        analysis: Result of get_complete_system_analysis (None for a failed lookup)
+        parameters: Input parameters; taken from the analysis when omitted
+
+    Returns:
+        Dictionary with exactly the ANALYSIS_COLUMNS keys
+    """
+    row = {column: np.nan for column in ANALYSIS_COLUMNS}
+
+    if parameters:
+        for column in INPUT_COLUMNS:
+            row[column] = parameters.get(column, np.nan)
+
+    if not analysis:
+        row['status'] = 'no_data'
+        return row
+
+    system = analysis['system']
+    sizing = analysis['sizing']
+    costs = analysis['costs']
+
+    if not parameters:
+        row.update({
+            'power': system['power'],
+            't1': system['T1'],
+            'temp_diff': system.get('temp_diff', system['T2'] - system['T1']),
+            'approach': system.get('approach', np.nan),
+        })
+
+    row.update({
+        'status': 'success',
+        'power_mw': system['power'],
+        't1_celsius': system['T1'],
+        't2_celsius': system['T2'],
+        't3_celsius': system['T3'],
+        't4_celsius': system['T4'],
+        'f1_flow': system['F1'],
+        'f2_flow': system['F2'],
+        'pipe_size': sizing['primary_pipe_size'],
+        'room_size': sizing['room_size'],
+    })
+    for column in COST_COLUMNS:
+        row[column] = costs[column]
+
+    return {column: (float(value) if column in NUMERIC_RESULT_COLUMNS else value)
+            for column, value in row.items()}
+
+def analysis_from_row(row) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the analysis sections used for display from one results row.
+
+    Inverse of flatten_analysis for the system, sizing and costs values it
+    keeps, so charts can be drawn from a results table without rerunning
+    the analysis.
+
+    Args:
+        row: Mapping (dict or Series) with ANALYSIS_COLUMNS
+
+    Returns:
+        Analysis dictionary with 'system', 'sizing' and 'costs', or None if
+        the row is not a successful result
+    """
+    if row.get('status') != 'success':
+        return None
+
+    system = {
+        'power': row['power_mw'],
+        'F1': row['f1_flow'],
+        'F2': row['f2_flow'],
+        'T1': row['t1_celsius'],
+        'T2': row['t2_celsius'],
+        'T3': row['t3_celsius'],
+        'T4': row['t4_celsius'],
+        'hx_cost': row['hx_cost'],
+        'approach': row['approach'],
+        'temp_diff': row['temp_diff'],
+    }
+    sizing = {
+        'primary_pipe_size': row['pipe_size'],
+        'room_size': row['room_size'],
+    }
+    costs = {column: row[column] for column in COST_COLUMNS}
+
+    return {'system': system, 'sizing': sizing, 'costs': costs}
+
+# =============================================================================
+# BATCH ENGINE
+# =============================================================================
+
+def _analyse_point(key: Tuple[float, float, float, float]) -> Dict[str, Any]:
+    """Analyse one operating point and flatten it (process-pool worker)."""
+    power, t1, temp_diff, approach = key
+    analysis = get_complete_system_analysis(power, t1, temp_diff, approach)
+    return flatten_analysis(analysis, dict(zip(INPUT_COLUMNS, key)))
+
+
+def run_batch_analysis(parameter_sets, max_workers: Optional[int] = 1,
+                       progress_callback=None) -> pd.DataFrame:
+    """
+    Run the complete system analysis for many parameter sets.
+
+    Args:
+        parameter_sets: List of dicts or DataFrame with columns power, t1,
+                        temp_diff and approach, plus optional overrides
+                        pipe_cost_per_meter and total_pipe_length
+        max_workers: Worker processes for distinct operating points
+                     (1 = run in this process, None = one per CPU)
+        progress_callback: Optional callable(done, total) called as each
+                           distinct operating point completes
+
+    Returns:
+        DataFrame with ANALYSIS_COLUMNS, one row per parameter set, in input order
+    """
+    params = pd.DataFrame(parameter_sets).reset_index(drop=True)
+    missing = [c for c in INPUT_COLUMNS if c not in params.columns]
+    if missing:
+        raise ValueError(f"❌ Parameter sets missing columns: {missing}")
+
+    if params.empty:
+        return pd.DataFrame(columns=ANALYSIS_COLUMNS)
+
+    # Analyse each distinct operating point once
+    keys = list(params[INPUT_COLUMNS].itertuples(index=False, name=None))
+    unique_keys = list(dict.fromkeys(keys))
+
+    point_rows = {}
+    if max_workers == 1 or len(unique_keys) <= 1:
+        for done, key in enumerate(unique_keys, start=1):
+            point_rows[key] = _analyse_point(key)
+            if progress_callback:
+                progress_callback(done, len(unique_keys))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for done, (key, row) in enumerate(zip(unique_keys, executor.map(_analyse_point, unique_keys)), start=1):
+                point_rows[key] = row
+                if progress_callback:
+                    progress_callback(done, len(unique_keys))
+
+    results = pd.DataFrame([point_rows[key] for key in keys], columns=ANALYSIS_COLUMNS)
+
+    # Apply cost overrides as vectorized recalculation
+    overrides = [c for c in OVERRIDE_COLUMNS if c in params.columns]
+    if overrides:
+        for column in overrides:
+            given = params[column].notna()
+            results.loc[given, column] = params.loc[given, column].astype(float)
+
+        results['total_pipe_cost'] = results['pipe_cost_per_meter'] * results['total_pipe_length']
+        results['total_cost'] = combine_system_costs(
+            results['pipe_cost_per_meter'], results['total_pipe_length'],
+            results['control_valve_cost'], results['isolation_valve_cost'],
+            results['hx_cost'], results['pump_cost'], results['installation_cost']
+        )
+
+    return results
+
+
+def build_parameter_grid(**values) -> pd.DataFrame:
+    """
+    Build the full factorial grid of parameter sets.
+
+    Args:
+        **values: Lists of values per input, e.g. power=[1, 2], t1=[20, 30]
+
+    Returns:
+        DataFrame with one row per combination
+    """
+    names = list(values.keys())
+    grids = np.meshgrid(*[np.asarray(values[name]) for name in names], indexing='ij')
+    return pd.DataFrame({name: grid.ravel() for name, grid in zip(names, grids)})
@@ -0,0 +1,471 @@
+"""
+Lifecycle economics for heat reuse systems.
+
+This module extends the CAPEX breakdown produced by calculate_system_costs
+with operating costs (pump energy, maintenance) and heat-sale revenue, and
+computes NPV, IRR, LCOH and payback.
+
+Every calculation works on NumPy arrays: pass one value per design and a
+vector of discount rates to evaluate thousands of designs across a
+discount-rate sweep in a single call.
+"""
+
+from typing import Dict, Optional, List, Any, Union
+
+import numpy as np
+import pandas as pd
+
+from physics.fluid_mechanics import pump_power_required
+from physics.units import liters_per_minute_to_m3_per_second
+from data.loader import get_csv_data, is_csv_loaded
+
+# =============================================================================
+# ECONOMIC ASSUMPTIONS - Easy to modify for different markets
+# =============================================================================
+
+ECONOMIC_ASSUMPTIONS = {
+    # CAPEX placeholders used by calculate_system_costs
+    'pump_cost_per_mw': 5000,              # € per MW of heat capacity
+    'installation_cost': 10000,            # € lump sum
+
+    # Project horizon
+    'lifetime_years': 20,
+    'discount_rate': 0.08,
+
+    # Operation
+    'operating_hours_per_year': 8000,      # h/year
+    'heat_utilization': 0.6,               # fraction of rated heat actually sold
+
+    # Prices
+    'heat_price_eur_per_mwh': 30.0,        # €/MWh heat sold to the consumer
+    'electricity_price_eur_per_mwh': 150.0,  # €/MWh for pump electricity
+    'escalation_rate': 0.02,               # yearly escalation of prices and O&M costs
+
+    # OPEX
+    'maintenance_fraction_of_capex': 0.02,  # yearly maintenance as share of CAPEX
+    'pump_pressure_head_pa': 150000,       # loop pressure head per circuit [Pa]
+    'pump_efficiency': 0.75,
+    'motor_efficiency': 0.92,
+}
+
+# Metrics rank_designs can sort by -> True if higher is better
+RANKING_METRICS = {
+    'npv': True,
+    'irr': True,
+    'lcoh': False,
+    'simple_payback_years': False,
+    'discounted_payback_years': False,
+}
+
+# Fallback cost-per-MW curve when the MW price table is not loaded
+_FALLBACK_COST_PER_MW = [(1, 21000), (2, 19000), (3, 17300), (float('inf'), 16000)]
+
+
+def get_economic_assumptions(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Get economic assumptions with optional overrides applied.
+
+    Args:
+        overrides: Dictionary of assumption values to replace
+
+    Returns:
+        New dictionary of assumptions (ECONOMIC_ASSUMPTIONS is not modified)
+    """
+    assumptions = dict(ECONOMIC_ASSUMPTIONS)
+    if overrides:
+        unknown = set(overrides) - set(assumptions)
+        if unknown:
+            raise ValueError(f"Unknown economic assumptions: {sorted(unknown)}")
+        assumptions.update(overrides)
+    return assumptions
+
+# =============================================================================
+# OPEX AND REVENUE
+# =============================================================================
+
+def annual_pump_energy_mwh(flow_lpm, assumptions: Optional[Dict[str, Any]] = None):
+    """
+    Yearly pump electricity for one circulation loop.
+
+    Args:
+        flow_lpm: Loop flow rate in L/min (scalar or array)
+        assumptions: Economic assumptions (defaults to ECONOMIC_ASSUMPTIONS)
+
+    Returns:
+        Electricity use in MWh/year, same shape as flow_lpm
+    """
+    a = assumptions or ECONOMIC_ASSUMPTIONS
+    flow_m3s = liters_per_minute_to_m3_per_second(np.asarray(flow_lpm, dtype=float))
+    power = pump_power_required(
+        flow_m3s, a['pump_pressure_head_pa'],
+        efficiency=a['pump_efficiency'], motor_efficiency=a['motor_efficiency']
+    )
+    return power['electrical_power_w'] * a['operating_hours_per_year'] / 1e6
+
+
+def annual_heat_sold_mwh(power_mw, assumptions: Optional[Dict[str, Any]] = None):
+    """
+    Yearly heat delivered to the consumer.
+
+    Args:
+        power_mw: Rated heat capacity in MW (scalar or array)
+        assumptions: Economic assumptions (defaults to ECONOMIC_ASSUMPTIONS)
+
+    Returns:
+        Heat sold in MWh/year, same shape as power_mw
+    """
+    a = assumptions or ECONOMIC_ASSUMPTIONS
+    return np.asarray(power_mw, dtype=float) * a['operating_hours_per_year'] * a['heat_utilization']
+
+# =============================================================================
+# CASH FLOWS AND METRICS (VECTORIZED)
+# =============================================================================
+
+def _escalation_factors(lifetime_years: int, escalation: float) -> np.ndarray:
+    """Escalation multiplier for years 1..lifetime (year 1 = 1.0)."""
+    return (1.0 + escalation) ** np.arange(lifetime_years)
+
+
+def _discount_factors(discount_rates, lifetime_years: int) -> np.ndarray:
+    """Discount factors with shape (n_rates, lifetime_years + 1), year 0 = 1.0."""
+    rates = np.atleast_1d(np.asarray(discount_rates, dtype=float))
+    years = np.arange(lifetime_years + 1)
+    return (1.0 + rates[:, None]) ** -years[None, :]
+
+
+def build_cash_flows(capex, annual_revenue, annual_opex, lifetime_years: int,
+                     escalation: float = 0.0) -> np.ndarray:
+    """
+    Build yearly cash flows for one or many designs.
+
+    Year 0 holds the investment (-capex); years 1..lifetime hold
+    revenue - opex, escalated by `escalation` per year.
+
+    Args:
+        capex: Investment per design (scalar or array of n designs)
+        annual_revenue: First-year revenue per design
+        annual_opex: First-year operating cost per design
+        lifetime_years: Project lifetime in years
+        escalation: Yearly escalation applied to revenue and opex
+
+    Returns:
+        Array of shape (n_designs, lifetime_years + 1)
+    """
+    capex = np.atleast_1d(np.asarray(capex, dtype=float))
+    net = np.broadcast_to(np.asarray(annual_revenue, dtype=float) - np.asarray(annual_opex, dtype=float),
+                          capex.shape)
+
+    flows = np.empty((capex.size, lifetime_years + 1))
+    flows[:, 0] = -capex
+    flows[:, 1:] = net[:, None] * _escalation_factors(lifetime_years, escalation)[None, :]
+    return flows
+
+
+def calculate_npv(cash_flows, discount_rates) -> np.ndarray:
+    """
+    Net present value of cash flows for every discount rate.
+
+    Args:
+        cash_flows: Array of shape (n_designs, n_years + 1), year 0 first
+        discount_rates: Scalar or array of n_rates discount rates
+
+    Returns:
+        Array of shape (n_designs, n_rates)
+    """
+    flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    factors = _discount_factors(discount_rates, flows.shape[1] - 1)
+    return flows @ factors.T
+
+
+def calculate_irr(cash_flows, low: float = -0.99, high: float = 10.0,
+                  tol: float = 1e-7, max_iter: int = 200) -> np.ndarray:
+    """
+    Internal rate of return by vectorized bisection.
+
+    All designs are solved simultaneously. Designs whose NPV does not
+    change sign within [low, high] get NaN.
+
+    Args:
+        cash_flows: Array of shape (n_designs, n_years + 1), year 0 first
+        low: Lower bound of the rate search
+        high: Upper bound of the rate search
+        tol: Convergence tolerance on the rate
+        max_iter: Maximum bisection steps
+
+    Returns:
+        Array of shape (n_designs,) with IRR values
+    """
+    flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    years = np.arange(flows.shape[1])
+
+    def npv_at(rates):
+        return np.sum(flows * (1.0 + rates[:, None]) ** -years[None, :], axis=1)
+
+    lo = np.full(flows.shape[0], low)
+    hi = np.full(flows.shape[0], high)
+    npv_lo = npv_at(lo)
+    npv_hi = npv_at(hi)
+    solvable = np.sign(npv_lo) != np.sign(npv_hi)
+
+    for _ in range(max_iter):
+        mid = 0.5 * (lo + hi)
+        npv_mid = npv_at(mid)
+        same_side = np.sign(npv_mid) == np.sign(npv_lo)
+        lo = np.where(same_side, mid, lo)
+        npv_lo = np.where(same_side, npv_mid, npv_lo)
+        hi = np.where(same_side, hi, mid)
+        if np.all(hi - lo < tol):
+            break
+
+    return np.where(solvable, 0.5 * (lo + hi), np.nan)
+
+
+def calculate_lcoh(capex, annual_opex, annual_heat_mwh, discount_rates,
+                   lifetime_years: int, escalation: float = 0.0) -> np.ndarray:
+    """
+    Levelized cost of heat in €/MWh.
+
+    LCOH = (CAPEX + PV(OPEX)) / PV(heat delivered)
+
+    Args:
+        capex: Investment per design (scalar or array)
+        annual_opex: First-year operating cost per design
+        annual_heat_mwh: Heat delivered per year per design
+        discount_rates: Scalar or array of discount rates
+        lifetime_years: Project lifetime in years
+        escalation: Yearly escalation applied to opex
+
+    Returns:
+        Array of shape (n_designs, n_rates)
+    """
+    capex = np.atleast_1d(np.asarray(capex, dtype=float))
+    opex = np.broadcast_to(np.asarray(annual_opex, dtype=float), capex.shape)
+    heat = np.broadcast_to(np.asarray(annual_heat_mwh, dtype=float), capex.shape)
+
+    factors = _discount_factors(discount_rates, lifetime_years)[:, 1:]      # (n_rates, years)
+    escalated = factors * _escalation_factors(lifetime_years, escalation)[None, :]
+
+    pv_opex = opex[:, None] * escalated.sum(axis=1)[None, :]
+    pv_heat = heat[:, None] * factors.sum(axis=1)[None, :]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(pv_heat > 0, (capex[:, None] + pv_opex) / pv_heat, np.nan)
+
+
+def calculate_payback(cash_flows, discount_rate: Optional[float] = None) -> np.ndarray:
+    """
+    Payback period in years, interpolated within the break-even year.
+
+    Args:
+        cash_flows: Array of shape (n_designs, n_years + 1), year 0 first
+        discount_rate: If given, compute discounted payback at this rate
+
+    Returns:
+        Array of shape (n_designs,); NaN where the investment is never recovered
+    """
+    flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    if discount_rate is not None:
+        flows = flows * _discount_factors(discount_rate, flows.shape[1] - 1)
+
+    cumulative = np.cumsum(flows, axis=1)
+    recovered = cumulative >= 0
+    # First recovered year; year 0 only when there was no investment
+    first = np.argmax(recovered, axis=1)
+    never = ~recovered.any(axis=1)
+
+    rows = np.arange(flows.shape[0])
+    prev_year = np.maximum(first - 1, 0)
+    shortfall = -cumulative[rows, prev_year]
+    inflow = flows[rows, first]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = np.where(inflow > 0, shortfall / inflow, 0.0)
+    payback = np.where(first == 0, 0.0, prev_year + fraction)
+    return np.where(never, np.nan, payback)
+
+# =============================================================================
+# DESIGN-LEVEL ECONOMICS
+# =============================================================================
+
+def evaluate_design_economics(capex, power_mw, f1_flow, f2_flow,
+                              assumptions: Optional[Dict[str, Any]] = None,
+                              discount_rates=None) -> Dict[str, np.ndarray]:
+    """
+    Lifecycle economics for many designs at once.
+
+    Args:
+        capex: Total investment per design (array of n designs)
+        power_mw: Rated heat capacity per design in MW
+        f1_flow: TCS loop flow per design in L/min
+        f2_flow: FWS loop flow per design in L/min
+        assumptions: Economic assumption overrides
+        discount_rates: Discount rates to sweep (defaults to the assumed rate)
+
+    Returns:
+        Dictionary of arrays. Per-design arrays have shape (n,);
+        'npv' and 'lcoh' have shape (n, n_rates).
+    """
+    a = get_economic_assumptions(assumptions)
+    rates = np.atleast_1d(a['discount_rate'] if discount_rates is None else discount_rates).astype(float)
+    lifetime = int(a['lifetime_years'])
+
+    capex = np.atleast_1d(np.asarray(capex, dtype=float))
+    power_mw = np.broadcast_to(np.asarray(power_mw, dtype=float), capex.shape)
+
+    pump_mwh = annual_pump_energy_mwh(f1_flow, a) + annual_pump_energy_mwh(f2_flow, a)
+    pump_mwh = np.broadcast_to(pump_mwh, capex.shape)
+    heat_mwh = annual_heat_sold_mwh(power_mw, a)
+
+    energy_opex = pump_mwh * a['electricity_price_eur_per_mwh']
+    maintenance_opex = capex * a['maintenance_fraction_of_capex']
+    annual_opex = energy_opex + maintenance_opex
+    annual_revenue = heat_mwh * a['heat_price_eur_per_mwh']
+
+    flows = build_cash_flows(capex, annual_revenue, annual_opex, lifetime,
+                             escalation=a['escalation_rate'])
+
+    return {
+        'capex': capex,
+        'annual_heat_mwh': heat_mwh,
+        'annual_pump_energy_mwh': pump_mwh,
+        'annual_energy_opex': energy_opex,
+        'annual_maintenance_opex': maintenance_opex,
+        'annual_opex': annual_opex,
+        'annual_revenue': annual_revenue,
+        'discount_rates': rates,
+        'cash_flows': flows,
+        'npv': calculate_npv(flows, rates),
+        'irr': calculate_irr(flows),
+        'lcoh': calculate_lcoh(capex, annual_opex, heat_mwh, rates, lifetime, a['escalation_rate']),
+        'simple_payback_years': calculate_payback(flows),
+        'discounted_payback_years': calculate_payback(flows, a['discount_rate']),
+    }
+
+
+def get_lifecycle_economics(analysis: Dict[str, Any],
+                            assumptions: Optional[Dict[str, Any]] = None,
+                            discount_rates=None) -> Optional[Dict[str, Any]]:
+    """
+    Lifecycle economics for a single complete system analysis.
+
+    Args:
+        analysis: Result of get_complete_system_analysis
+        assumptions: Economic assumption overrides
+        discount_rates: Optional discount rates to sweep
+
+    Returns:
+        Dictionary with scalar metrics at the assumed discount rate plus the
+        NPV/LCOH sweep, or None if the analysis is missing
+    """
+    if not analysis:
+        return None
+
+    system = analysis['system']
+    costs = analysis['costs']
+    a = get_economic_assumptions(assumptions)
+    rates = np.atleast_1d(a['discount_rate'] if discount_rates is None else discount_rates).astype(float)
+    rates = np.unique(np.append(rates, a['discount_rate']))
+
+    result = evaluate_design_economics(
+        costs['total_cost'], system['power'], system['F1'], system['F2'],
+        assumptions=assumptions, discount_rates=rates
+    )
+    base = int(np.flatnonzero(rates == a['discount_rate'])[0])
+
+    return {
+        'capex': float(result['capex'][0]),
+        'annual_opex': float(result['annual_opex'][0]),
+        'annual_revenue': float(result['annual_revenue'][0]),
+        'annual_heat_mwh': float(result['annual_heat_mwh'][0]),
+        'annual_pump_energy_mwh': float(result['annual_pump_energy_mwh'][0]),
+        'discount_rate': a['discount_rate'],
+        'npv': float(result['npv'][0, base]),
+        'irr': float(result['irr'][0]),
+        'lcoh_eur_per_mwh': float(result['lcoh'][0, base]),
+        'simple_payback_years': float(result['simple_payback_years'][0]),
+        'discounted_payback_years': float(result['discounted_payback_years'][0]),
+        'npv_by_rate': dict(zip(rates.tolist(), result['npv'][0].tolist())),
+        'lcoh_by_rate': dict(zip(rates.tolist(), result['lcoh'][0].tolist())),
+        'cash_flows': result['cash_flows'][0].tolist(),
+    }
+
+
+def rank_designs(designs: Union[pd.DataFrame, List[Dict[str, Any]]],
+                 metric: str = 'npv',
+                 assumptions: Optional[Dict[str, Any]] = None,
+                 discount_rate: Optional[float] = None) -> pd.DataFrame:
+    """
+    Rank many designs by a lifecycle metric.
+
+    Args:
+        designs: DataFrame (or list of dicts) with columns total_cost,
+                 power_mw, f1_flow and f2_flow, or a list of complete analyses
+        metric: 'npv', 'irr', 'lcoh', 'simple_payback_years' or
+                'discounted_payback_years'
+        assumptions: Economic assumption overrides
+        discount_rate: Rate used for NPV/LCOH (defaults to the assumed rate)
+
+    Returns:
+        Copy of the designs table with metric columns, best design first
+    """
+    if metric not in RANKING_METRICS:
+        raise ValueError(f"Unknown ranking metric: {metric}. Use one of: {list(RANKING_METRICS)}")
+
+    if isinstance(designs, list) and designs and 'summary' in designs[0]:
+        designs = pd.DataFrame([
+            {
+                'power_mw': d['system']['power'],
+                'f1_flow': d['system']['F1'],
+                'f2_flow': d['system']['F2'],
+                'total_cost': d['costs']['total_cost'],
+            }
+            for d in designs
+        ])
+    table = pd.DataFrame(designs).reset_index(drop=True)
+
+    a = get_economic_assumptions(assumptions)
+    rate = a['discount_rate'] if discount_rate is None else discount_rate
+    result = evaluate_design_economics(
+        table['total_cost'].to_numpy(float), table['power_mw'].to_numpy(float),
+        table['f1_flow'].to_numpy(float), table['f2_flow'].to_numpy(float),
+        assumptions=assumptions, discount_rates=[rate]
+    )
+
+    table['npv'] = result['npv'][:, 0]
+    table['irr'] = result['irr']
+    table['lcoh'] = result['lcoh'][:, 0]
+    table['simple_payback_years'] = result['simple_payback_years']
+    table['discounted_payback_years'] = result['discounted_payback_years']
+
+    return table.sort_values(metric, ascending=not RANKING_METRICS[metric], na_position='last').reset_index(drop=True)
+
+# =============================================================================
+# COST PER MW PRICE CURVE
+# =============================================================================
+
+def estimate_cost_per_mw(target_mw: float) -> float:
+    """
+    Estimate cost per MW for a target power size.
+
+    Interpolates the MW price table (MW Price Data.csv) and falls back to a
+    coarse step curve when the table is not loaded.
+
+    Args:
+        target_mw: System size in MW
+
+    Returns:
+        Estimated cost per MW in €
+    """
+    if is_csv_loaded('MW PRICE DATA'):
+        price_df = get_csv_data('MW PRICE DATA')
+        mw = price_df['MW'].to_numpy(float)
+        price = price_df['Price'].to_numpy(float)
+        valid = mw > 0
+        if valid.any():
+            order = np.argsort(mw[valid])
+            mw, price = mw[valid][order], price[valid][order]
+            return float(np.interp(target_mw, mw, price / mw))
+
+    for limit, cost in _FALLBACK_COST_PER_MW:
+        if target_mw <= limit:
+            return cost
@@ -0,0 +1,250 @@
+"""
+Session analysis history.
+
+A bounded ring buffer of recent analyses. Entries are stored as flat
+columnar rows (the ANALYSIS_COLUMNS schema of core.batch_analysis, one
+preallocated numpy array per column) rather than nested analysis
+dictionaries, so the history has a fixed, small footprint. Pinned entries
+are never overwritten; the oldest unpinned entry makes room for a new one.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, List, Any
+
+import numpy as np
+import pandas as pd
+
+from core.batch_analysis import (INPUT_COLUMNS, ANALYSIS_COLUMNS, NUMERIC_RESULT_COLUMNS,
+                                 flatten_analysis, analysis_from_row)
+
+# Default number of entries kept
+HISTORY_CAPACITY = 50
+
+# Columns stored as float64 arrays (everything but status)
+HISTORY_VALUE_COLUMNS = INPUT_COLUMNS + NUMERIC_RESULT_COLUMNS
+
+# Table returned by AnalysisHistory.to_frame
+HISTORY_COLUMNS = ['entry_id', 'timestamp', 'pinned'] + ANALYSIS_COLUMNS
+
+# Rows of AnalysisHistory.compare, in order
+COMPARISON_ROWS = HISTORY_VALUE_COLUMNS + ['cost_per_mw']
+
+
+class AnalysisHistory:
+    """
+    Ring buffer of analysis results with pinning.
+
+    Example:
+        >>> history = AnalysisHistory(capacity=20)
+        >>> entry = history.add(get_complete_system_analysis(2, 30, 12, 3),
+        ...                     {'power': 2, 't1': 30, 'temp_diff': 12, 'approach': 3})
+        >>> history.pin(entry)
+        >>> history.compare([entry, other_entry])
+    """
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY):
+        """
+        Args:
+            capacity: Maximum number of entries (pinned ones included)
+        """
+        if capacity < 1:
+            raise ValueError("❌ History capacity must be at least 1")
+
+        self.capacity = capacity
+        self._values = {column: np.full(capacity, np.nan) for column in HISTORY_VALUE_COLUMNS}
+        self._status = np.empty(capacity, dtype=object)
+        self._entry_ids = np.full(capacity, -1, dtype=np.int64)  # -1 marks a free slot
+        self._timestamps = np.zeros(capacity)
+        self._pinned = np.zeros(capacity, dtype=bool)
+
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    def __len__(self) -> int:
+        return int((self._entry_ids >= 0).sum())
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def add(self, analysis: Optional[Dict[str, Any]], parameters: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """
+        Record an analysis.
+
+        Only successful analyses are kept. Recording the same result as the
+        most recent entry again only refreshes that entry's timestamp.
+
+        Args:
+            analysis: Result of get_complete_system_analysis
+            parameters: Input parameters (power, t1, temp_diff, approach)
+
+        Returns:
+            Entry id, or None if nothing was recorded
+        """
+        row = flatten_analysis(analysis, parameters)
+        if row['status'] != 'success':
+            return None
+
+        values = np.array([row[column] for column in HISTORY_VALUE_COLUMNS], dtype=float)
+
+        with self._lock:
+            latest = self._latest_slot()
+            if latest is not None and np.array_equal(self._row_values(latest), values, equal_nan=True):
+                self._timestamps[latest] = time.time()
+                return int(self._entry_ids[latest])
+
+            slot = self._free_slot()
+            if slot is None:
+                print(f"⚠️ History full: all {self.capacity} entries are pinned, analysis not recorded")
+                return None
+
+            entry_id = self._next_id
+            self._next_id += 1
+
+            for column, value in zip(HISTORY_VALUE_COLUMNS, values):
+                self._values[column][slot] = value
+            self._status[slot] = row['status']
+            self._entry_ids[slot] = entry_id
+            self._timestamps[slot] = time.time()
+            self._pinned[slot] = False
+
+        self._notify()
+        return entry_id
+
+    def _row_values(self, slot: int) -> np.ndarray:
+        return np.array([self._values[column][slot] for column in HISTORY_VALUE_COLUMNS])
+
+    def _latest_slot(self) -> Optional[int]:
+        if not (self._entry_ids >= 0).any():
+            return None
+        return int(np.argmax(self._entry_ids))
+
+    def _free_slot(self) -> Optional[int]:
+        """An empty slot, else the slot of the oldest unpinned entry."""
+        empty = np.flatnonzero(self._entry_ids < 0)
+        if len(empty):
+            return int(empty[0])
+
+        unpinned = np.flatnonzero(~self._pinned)
+        if not len(unpinned):
+            return None
+        return int(unpinned[np.argmin(self._entry_ids[unpinned])])
+
+    def _slot(self, entry_id: int) -> int:
+        slots = np.flatnonzero(self._entry_ids == entry_id)
+        if not len(slots):
+            raise KeyError(f"❌ No history entry #{entry_id}")
+        return int(slots[0])
+
+    # -------------------------------------------------------------------------
+    # Pinning
+    # -------------------------------------------------------------------------
+
+    def pin(self, entry_id: int) -> None:
+        """Keep an entry until it is unpinned."""
+        with self._lock:
+            self._pinned[self._slot(entry_id)] = True
+        self._notify()
+
+    def unpin(self, entry_id: int) -> None:
+        """Let an entry be overwritten again."""
+        with self._lock:
+            self._pinned[self._slot(entry_id)] = False
+        self._notify()
+
+    def pinned_ids(self) -> List[int]:
+        """Ids of pinned entries, oldest first."""
+        return sorted(int(i) for i in self._entry_ids[self._pinned & (self._entry_ids >= 0)])
+
+    def clear(self, keep_pinned: bool = True) -> None:
+        """Remove all entries (by default except pinned ones)."""
+        with self._lock:
+            drop = ~self._pinned if keep_pinned else np.ones(self.capacity, dtype=bool)
+            self._entry_ids[drop] = -1
+            self._pinned[drop] = False
+            for column in HISTORY_VALUE_COLUMNS:
+                self._values[column][drop] = np.nan
+            self._status[drop] = None
+        self._notify()
+
+    # -------------------------------------------------------------------------
+    # Views
+    # -------------------------------------------------------------------------
+
+    def entry_ids(self) -> List[int]:
+        """Ids of all entries, oldest first."""
+        return sorted(int(i) for i in self._entry_ids[self._entry_ids >= 0])
+
+    def to_frame(self, entry_ids: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        History as a table.
+
+        Args:
+            entry_ids: Entries to include (default: all)
+
+        Returns:
+            DataFrame with HISTORY_COLUMNS, oldest entry first
+        """
+        with self._lock:
+            if entry_ids is None:
+                slots = np.flatnonzero(self._entry_ids >= 0)
+            else:
+                slots = np.array([self._slot(entry_id) for entry_id in entry_ids], dtype=np.int64)
+            slots = slots[np.argsort(self._entry_ids[slots], kind='stable')]
+
+            frame = pd.DataFrame({
+                'entry_id': self._entry_ids[slots],
+                'timestamp': pd.to_datetime(self._timestamps[slots], unit='s'),
+                'pinned': self._pinned[slots],
+                'status': self._status[slots],
+                **{column: self._values[column][slots] for column in HISTORY_VALUE_COLUMNS},
+            })
+        return frame[HISTORY_COLUMNS]
+
+    def row(self, entry_id: int) -> Dict[str, Any]:
+        """One entry as a flat ANALYSIS_COLUMNS row (plus entry metadata)."""
+        return self.to_frame([entry_id]).iloc[0].to_dict()
+
+    def analysis(self, entry_id: int) -> Optional[Dict[str, Any]]:
+        """Analysis sections ('system', 'sizing', 'costs') of an entry, for charts."""
+        return analysis_from_row(self.row(entry_id))
+
+    def compare(self, entry_ids: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        Side-by-side comparison of entries.
+
+        Args:
+            entry_ids: Entries to compare (default: pinned entries)
+
+        Returns:
+            DataFrame with COMPARISON_ROWS as index and one column per entry
+            ('#<entry_id>')
+        """
+        entry_ids = self.pinned_ids() if entry_ids is None else entry_ids
+        frame = self.to_frame(entry_ids)
+        frame['cost_per_mw'] = frame['total_cost'] / frame['power_mw']
+
+        comparison = frame.set_index('entry_id')[COMPARISON_ROWS].T
+        comparison.columns = [f"#{entry_id}" for entry_id in comparison.columns]
+        return comparison
+
+    # -------------------------------------------------------------------------
+    # Change notification
+    # -------------------------------------------------------------------------
+
+    def add_listener(self, callback) -> None:
+        """Call callback(history) after every change."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"⚠️ History listener failed: {e}")
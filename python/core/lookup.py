@@ -5,14 +5,92 @@ This module contains all data lookup functions including the main
 lookup_allhx_data function ported from the Jupyter notebook.
 """
 
-from typing import Dict, Optional, Any, Union
+from typing import Dict, Optional, Any, Union, List
 import pandas as pd
 
 # Import the data module to access csv_data
-from data.loader import get_csv_data, is_csv_loaded
-from data.converter import universal_float_convert
+from data.loader import get_csv_data, is_csv_loaded, get_column_store, get_table_columns
 
-def lookup_allhx_data(power: float, t1: float, temp_diff: float, approach: float) -> Optional[Dict[str, Any]]:
+# Lookup inputs and the ALLHX columns they match
+ALLHX_GRID_COLUMNS = {
+    'power': 'wha',
+    't1': 'T1',
+    'temp_diff': 'itdt',
+    'approach': 'TCSapp'
+}
+
+def get_clean_allhx_data() -> Optional[pd.DataFrame]:
+    """
+    Get the ALLHX catalog rows.
+    
+    The loader types and cleans the table once (see data.schema): legend
+    rows are removed, numeric columns converted and rows without a valid
+    operating point dropped.
+    
+    Returns:
+        DataFrame of valid catalog rows, or None if ALLHX is not loaded
+        or has no valid rows
+    """
+    # Check if ALLHX data is loaded
+    if not is_csv_loaded('ALLHX'):
+        print("❌ Error: ALLHX.csv not loaded")
+        return None
+    
+    valid_df = get_csv_data('ALLHX')
+    
+    if len(valid_df) == 0:
+        print("❌ No valid data after conversion")
+        return None
+    
+    return valid_df
+
+def get_allhx_points(columns: List[str]) -> Optional[pd.DataFrame]:
+    """
+    Get selected ALLHX columns, keeping the first catalog row per operating point.
+    
+    Unlike get_clean_allhx_data, a catalog kept in a column store is not
+    materialized: only these columns are read, in chunks.
+    
+    Args:
+        columns: Catalog columns to return
+    
+    Returns:
+        DataFrame with one row per operating point, or None if ALLHX is
+        not loaded or has no valid rows
+    """
+    if not is_csv_loaded('ALLHX'):
+        print("❌ Error: ALLHX.csv not loaded")
+        return None
+    
+    points = get_table_columns('ALLHX', columns, first_per=list(ALLHX_GRID_COLUMNS.values()))
+    
+    if len(points) == 0:
+        print("❌ No valid data after conversion")
+        return None
+    
+    return points
+
+def get_allhx_grid() -> Dict[str, list]:
+    """
+    Get the discrete operating points covered by the ALLHX catalog.
+    
+    Returns:
+        Dictionary mapping each lookup input ('power', 't1', 'temp_diff',
+        'approach') to its sorted list of available values
+    """
+    # Large catalogs stay on disk; read the grid from their columns
+    store = get_column_store('ALLHX')
+    if store is not None:
+        return {name: store.unique(col).tolist() for name, col in ALLHX_GRID_COLUMNS.items()}
+    
+    valid_df = get_clean_allhx_data()
+    if valid_df is None:
+        return {name: [] for name in ALLHX_GRID_COLUMNS}
+    
+    return {name: sorted(valid_df[col].unique().tolist()) for name, col in ALLHX_GRID_COLUMNS.items()}
+
+def lookup_allhx_data(power: float, t1: float, temp_diff: float, approach: float,
+                      allow_estimate: bool = False) -> Optional[Dict[str, Any]]:
     """
     ALLHX lookup using proper data filtering and type consistency.
     
@@ -24,6 +102,8 @@ def lookup_allhx_data(power: float, t1: float, temp_diff: float, approach: float
         t1: Inlet temperature in °C
         temp_diff: Temperature difference in °C  
         approach: Approach value
+        allow_estimate: Fall back to the catalog surrogate (core.surrogate)
+                        when there is no exact match
     
     Returns:
         System data dictionary with keys: F1, F2, T3, T4, hx_cost
@@ -37,65 +117,36 @@ def lookup_allhx_data(power: float, t1: float, temp_diff: float, approach: float
     
     t2 = t1 + temp_diff
     
-    # Check if ALLHX data is loaded
-    if not is_csv_loaded('ALLHX'):
-        print("❌ Error: ALLHX.csv not loaded")
-        return None
-    
-    # Get the dataframe using the data module
-    df = get_csv_data('ALLHX')
-    if df is None:
-        return None
-    
-    # Make a copy to avoid modifying the original
-    df = df.copy()
-    
     # print(f"🔍 ALLHX lookup: Power={power}, T1={t1}, TempDiff={temp_diff}, T2={t2}, Approach={approach}")
     
-    # Clean data - remove header rows
-    df = df[df['wha'].astype(str).str.strip() != 'A']
-    df = df[df['wha'].astype(str).str.strip() != 'wha']
-    
-    # Convert to consistent numeric types using universal converter
-    numeric_columns = ['wha', 'T1', 'itdt', 'T2', 'TCSapp', 'F1', 'F2', 'T3', 'T4', 
-                       'FWSapp', 'costHX', 'areaHX', 'Hxweight', 'CO2_Footprint']
-    
-    for col in numeric_columns:
-        if col in df.columns:
-            df[col] = df[col].apply(lambda x: float(universal_float_convert(x)))
-    
-    # Remove invalid rows
-    valid_df = df[(df['wha'] > 0) & (df['T1'] > 0) & (df['itdt'] > 0) & (df['TCSapp'] > 0)]
-    
-    # print(f"📊 Valid data rows: {len(valid_df)}")
-    
-    if len(valid_df) == 0:
-        print("❌ No valid data after conversion")
-        return None
-    
-    # Debug: Show available combinations
-    power_values = sorted(valid_df['wha'].unique())
-    t1_values = sorted(valid_df['T1'].unique()) 
-    temp_diff_values = sorted(valid_df['itdt'].unique())
-    approach_values = sorted(valid_df['TCSapp'].unique())
-    
-    # print("Available combinations:")
-    # print(f"  Power (wha): {power_values}")
-    # print(f"  T1: {t1_values}")
-    # print(f"  TempDiff (itdt): {temp_diff_values}")
-    # print(f"  Approach (TCSapp): {approach_values}")
-    
-    # Find exact matches
-    matches = valid_df[
-        (valid_df['wha'] == power) & 
-        (valid_df['T1'] == t1) & 
-        (valid_df['itdt'] == temp_diff) & 
-        (valid_df['TCSapp'] == approach)
-    ]
+    store = get_column_store('ALLHX')
+    if store is not None:
+        # Large catalogs stay on disk; only the first matching row is read
+        rows = store.select(wha=power, T1=t1, itdt=temp_diff, TCSapp=approach)
+        matches = store.to_frame(rows[:1])
+    else:
+        valid_df = get_clean_allhx_data()
+        if valid_df is None:
+            return None
+        
+        # print(f"📊 Valid data rows: {len(valid_df)}")
+        
+        # Find exact matches
+        matches = valid_df[
+            (valid_df['wha'] == power) & 
+            (valid_df['T1'] == t1) & 
+            (valid_df['itdt'] == temp_diff) & 
+            (valid_df['TCSapp'] == approach)
+        ]
     
     # print(f"🎯 Exact matches found: {len(matches)}")
     
     if len(matches) == 0:
+        if allow_estimate:
+            from core.surrogate import estimate_allhx_data
+            estimate = estimate_allhx_data(power, t1, temp_diff, approach)
+            if estimate is not None:
+                return estimate
         print("❌ No exact match found")
         return None
     
@@ -143,8 +194,10 @@ def get_lookup_value(csv_name: str, lookup_value: Any, col_index_lookup: int = 0
     if df is None:
         return None
     
-    # Convert lookup column to numeric
-    lookup_col = df.iloc[:, col_index_lookup].apply(universal_float_convert)
+    # Lookup column is numeric for typed tables; coerce text key columns
+    lookup_col = df.iloc[:, col_index_lookup]
+    if not pd.api.types.is_numeric_dtype(lookup_col):
+        lookup_col = pd.to_numeric(lookup_col, errors='coerce')
     
     # Find first row where lookup column >= lookup_value
     matching_indices = lookup_col[lookup_col >= lookup_value].index
@@ -18,10 +18,10 @@ try:
 
     # Import data access functions
     from data.loader import get_csv_data, is_csv_loaded
-    from data.converter import universal_float_convert
 
     # Import lookup functions - now in separate module
     from core.lookup import lookup_allhx_data, get_lookup_value
+    from core.economics import ECONOMIC_ASSUMPTIONS
     
     import warnings
     warnings.filterwarnings('ignore', category=FutureWarning, module='pandas')
@@ -94,17 +94,11 @@ def get_PipeSize_Suggested(F1):
         if pipsz_df is None:
             return 0
         
-        pipsz_df = pipsz_df.copy()
         # print(f"🔍 CEILING lookup for pipe size: flow F1={F1_float}")
         # print(f"📊 PIPSZ data shape: {pipsz_df.shape}")
         
-        # Convert columns to numeric
-        pipsz_df = pipsz_df.astype(float)  # Convert DataFrame to float
-        pipsz_df.iloc[:, 0] = pipsz_df.iloc[:, 0].apply(universal_float_convert)  # Flow capacity
-        pipsz_df.iloc[:, 1] = pipsz_df.iloc[:, 1].apply(universal_float_convert)  # Pipe size
-        
-        # Remove invalid rows
-        valid_rows = pipsz_df.dropna()
+        # Columns are typed and invalid rows removed at load (data.schema)
+        valid_rows = pipsz_df
         
         # Sort by flow capacity to ensure we find the smallest adequate size
         valid_rows = valid_rows.sort_values(by=valid_rows.columns[0])
@@ -154,13 +148,7 @@ def get_PipeLength(F1, T1, T2):
         if room_df is None:
             return 0
             
-        # Convert to numeric and find appropriate length
-        room_df = room_df.copy()
-        room_df = room_df.astype(float)  # Convert DataFrame to float
-        room_df.iloc[:, 0] = room_df.iloc[:, 0].apply(universal_float_convert)  # Power capacity
-        room_df.iloc[:, 1] = room_df.iloc[:, 1].apply(universal_float_convert)  # Length
-        
-        # Find ceiling match
+        # Find ceiling match (columns typed at load)
         adequate_rows = room_df[room_df.iloc[:, 0] >= power_mw]
         
         if adequate_rows.empty:
@@ -201,13 +189,8 @@ def get_PipeCost_perMeter(flow_rate, pipe_type="sched40"):
         if pipcost_df is None:
             return 0
             
-        # Convert to numeric
-        pipcost_df = pipcost_df.copy()
-        pipcost_df.iloc[:, 0] = pipcost_df.iloc[:, 0].apply(universal_float_convert)  # Pipe size
-        
-        # Determine column index based on pipe type
+        # Determine column index based on pipe type (columns typed at load)
         col_index = 1 if pipe_type.lower() == "sched40" else 2
-        pipcost_df.iloc[:, col_index] = pipcost_df.iloc[:, col_index].apply(universal_float_convert)
         
         # Convert European DN size to match PIPCOST data format
         # Option 1: Try direct DN match first
@@ -321,13 +304,8 @@ def get_PipeCost_perMeter_Old(flow_rate, pipe_type="sched40"):
         if pipcost_df is None:
             return 0
             
-        # Convert to numeric
-        pipcost_df = pipcost_df.copy()
-        pipcost_df.iloc[:, 0] = pipcost_df.iloc[:, 0].apply(universal_float_convert)  # Pipe size
-        
-        # Determine column index based on pipe type
+        # Determine column index based on pipe type (columns typed at load)
         col_index = 1 if pipe_type.lower() == "sched40" else 2
-        pipcost_df.iloc[:, col_index] = pipcost_df.iloc[:, col_index].apply(universal_float_convert)
         
         # Find matching pipe size
         matching_rows = pipcost_df[pipcost_df.iloc[:, 0] >= pipe_size]
@@ -371,6 +349,21 @@ def get_PipeCost_Total(F1, T1, T2, pipe_type="sched40"):
 # DEFINE SYSTEM FUNCTIONS THAT USE  LOOKUPS
 # =============================================================================
 
+# Number of control valves and of isolation valves in a standard loop
+VALVES_PER_TYPE = 4
+
+def combine_system_costs(pipe_cost_per_meter, total_pipe_length, control_valve_cost,
+                         isolation_valve_cost, hx_cost, pump_cost, installation_cost):
+    """
+    Combine component costs into the total system cost.
+    
+    Works on scalars or NumPy arrays, so the same formula drives
+    calculate_system_costs and vectorized uncertainty analysis.
+    """
+    total_pipe_cost = pipe_cost_per_meter * total_pipe_length
+    total_valve_cost = (control_valve_cost + isolation_valve_cost) * VALVES_PER_TYPE
+    return total_pipe_cost + total_valve_cost + hx_cost + pump_cost + installation_cost
+
 def get_system_sizing(system_data):
     """
     CORRECTED: Now uses get_PipeSize_Suggested formula function and data module
@@ -387,12 +380,6 @@ def get_system_sizing(system_data):
     if is_csv_loaded('ROOM'):
         room_df = get_csv_data('ROOM')
         if room_df is not None:
-            room_df = room_df.copy()
-            # Convert columns to numeric
-            room_df = room_df.astype(float)  # Convert DataFrame to float
-            room_df.iloc[:, 0] = room_df.iloc[:, 0].apply(universal_float_convert)  # Power column
-            room_df.iloc[:, 1] = room_df.iloc[:, 1].apply(universal_float_convert)  # Room size column
-            
             for idx, row in room_df.iterrows():
                 power_val = row.iloc[0]
                 if power_val >= system_data['power']:
@@ -438,10 +425,6 @@ def calculate_system_costs(system_data, sizing_data):
     if is_csv_loaded('CVALV'):
         cvalv_df = get_csv_data('CVALV')
         if cvalv_df is not None:
-            cvalv_df = cvalv_df.copy()
-            # Convert cost column to numeric
-            cvalv_df.iloc[:, 1] = cvalv_df.iloc[:, 1].apply(universal_float_convert)
-            
             # Look for exact match on pipe size
             pipe_size_str = str(int(primary_pipe_size))
             for idx, row in cvalv_df.iterrows():
@@ -453,10 +436,6 @@ def calculate_system_costs(system_data, sizing_data):
     if is_csv_loaded('IVALV'):
         ivalv_df = get_csv_data('IVALV')
         if ivalv_df is not None:
-            ivalv_df = ivalv_df.copy()
-            # Convert cost column to numeric
-            ivalv_df.iloc[:, 1] = ivalv_df.iloc[:, 1].apply(universal_float_convert)
-            
             # Look for exact match on pipe size
             pipe_size_str = str(int(primary_pipe_size))
             for idx, row in ivalv_df.iterrows():
@@ -464,13 +443,16 @@ def calculate_system_costs(system_data, sizing_data):
                     isolation_valve_cost = row.iloc[1]
                     break
     
-    total_valve_cost = (control_valve_cost + isolation_valve_cost) * 4  # 4 of each type
+    total_valve_cost = (control_valve_cost + isolation_valve_cost) * VALVES_PER_TYPE
     
     # Other costs
     hx_cost = system_data['hx_cost']
-    pump_cost = system_data['power'] * 5000  # Estimated
-    installation_cost = 10000  # Placeholder
-    total_cost = total_pipe_cost + total_valve_cost + hx_cost + pump_cost + installation_cost
+    pump_cost = system_data['power'] * ECONOMIC_ASSUMPTIONS['pump_cost_per_mw']
+    installation_cost = ECONOMIC_ASSUMPTIONS['installation_cost']
+    total_cost = combine_system_costs(
+        pipe_cost_per_meter, total_pipe_length, control_valve_cost, isolation_valve_cost,
+        hx_cost, pump_cost, installation_cost
+    )
     
     cost_data = {
         'pipe_cost_per_meter': pipe_cost_per_meter,
@@ -0,0 +1,255 @@
+"""
+Result export.
+
+Writes analyses, session history and batch results to CSV, JSON Lines or
+Parquet with a fixed, flat column schema (ANALYSIS_COLUMNS, plus the entry
+columns for session history), so downstream pipelines can ingest every
+export the same way without reshaping nested analysis dictionaries.
+
+Rows are written as they are produced: CSV and JSON Lines one row at a
+time, Parquet in row groups of EXPORT_ROW_GROUP_ROWS. Parquet needs
+pyarrow. Rows go to a temporary file that replaces the target only once
+the export is complete, so a failed export leaves no truncated file.
+"""
+
+import csv
+import json
+import math
+import os
+from typing import Dict, Optional, List, Any, Iterable, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.batch_analysis import INPUT_COLUMNS, ANALYSIS_COLUMNS, NUMERIC_RESULT_COLUMNS, flatten_analysis
+from core.history import AnalysisHistory, HISTORY_COLUMNS
+
+# Export format -> file extension
+EXPORT_FORMATS = {
+    'csv': '.csv',
+    'jsonl': '.jsonl',
+    'parquet': '.parquet',
+}
+
+# Suffix of the file an export is written to before it replaces the target
+EXPORT_TEMP_SUFFIX = '.tmp'
+
+# Rows per Parquet row group (and per DataFrame chunk when streaming tables)
+EXPORT_ROW_GROUP_ROWS = 10_000
+
+# Type of every exported column; columns not listed are exported as strings
+EXPORT_COLUMN_TYPES = {
+    **{column: 'float' for column in INPUT_COLUMNS + NUMERIC_RESULT_COLUMNS},
+    'status': 'str',
+    'entry_id': 'int',
+    'timestamp': 'str',  # ISO 8601
+    'pinned': 'bool',
+}
+
+
+def _export_value(value, kind: str):
+    """Convert one value to the plain Python type of its column (None if missing)."""
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+        return None
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if kind == 'float':
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        return None if math.isnan(value) else value
+    if kind == 'int':
+        return int(value)
+    if kind == 'bool':
+        return bool(value)
+    return str(value)
+
+
+def _frame_rows(frame: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    for start in range(0, len(frame), EXPORT_ROW_GROUP_ROWS):
+        yield from frame.iloc[start:start + EXPORT_ROW_GROUP_ROWS].to_dict('records')
+
+
+def result_rows(source) -> Tuple[List[str], Iterable[Dict[str, Any]]]:
+    """
+    Flat rows and column schema of an exportable source.
+
+    Args:
+        source: One analysis dict (get_complete_system_analysis), an
+                AnalysisHistory, a results DataFrame, or an iterable of
+                analysis dicts / flat row dicts
+
+    Returns:
+        Tuple of (columns, iterable of row dicts)
+    """
+    if isinstance(source, AnalysisHistory):
+        return HISTORY_COLUMNS, _frame_rows(source.to_frame())
+
+    if isinstance(source, pd.DataFrame):
+        columns = HISTORY_COLUMNS if 'entry_id' in source.columns else ANALYSIS_COLUMNS
+        return columns, _frame_rows(source)
+
+    if isinstance(source, dict):
+        return ANALYSIS_COLUMNS, [flatten_analysis(source)]
+
+    def rows():
+        for item in source:
+            yield flatten_analysis(item) if isinstance(item, dict) and 'system' in item else item
+
+    return ANALYSIS_COLUMNS, rows()
+
+
+class ResultWriter:
+    """
+    Streaming writer with a fixed column schema.
+
+    Missing columns are written as empty/null, extra keys are dropped.
+    Rows are written to path + EXPORT_TEMP_SUFFIX, which close() moves to
+    path; abort() (or an exception inside a with block) removes it and
+    leaves any earlier file at path untouched.
+
+    Example:
+        >>> with ResultWriter('results.jsonl') as writer:
+        ...     for analysis in analyses:
+        ...         writer.write(flatten_analysis(analysis))
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, columns: Optional[List[str]] = None):
+        """
+        Args:
+            path: Target file; the format's extension is added if missing
+            fmt: 'csv', 'jsonl' or 'parquet' (default: from the extension, else csv)
+            columns: Column schema (default: ANALYSIS_COLUMNS)
+        """
+        if fmt is None:
+            fmt = next((name for name, ext in EXPORT_FORMATS.items() if path.endswith(ext)), 'csv')
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"❌ Unknown export format '{fmt}'. Use one of: {list(EXPORT_FORMATS)}")
+        if not path.endswith(EXPORT_FORMATS[fmt]):
+            path += EXPORT_FORMATS[fmt]
+
+        self.path = path
+        self.fmt = fmt
+        self.columns = list(columns or ANALYSIS_COLUMNS)
+        self.rows = 0
+        self._temp_path = path + EXPORT_TEMP_SUFFIX
+
+        self._kinds = [EXPORT_COLUMN_TYPES.get(column, 'str') for column in self.columns]
+        self._pending = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if fmt == 'parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError(f"❌ Parquet export needs pyarrow: {e}") from e
+            types = {'float': pa.float64(), 'int': pa.int64(), 'bool': pa.bool_(), 'str': pa.string()}
+            self._schema = pa.schema([(column, types[kind]) for column, kind in zip(self.columns, self._kinds)])
+            self._file = None
+            self._parquet = pq.ParquetWriter(self._temp_path, self._schema)
+        else:
+            self._file = open(self._temp_path, 'w', newline='' if fmt == 'csv' else None, encoding='utf-8')
+            if fmt == 'csv':
+                self._csv = csv.writer(self._file)
+                self._csv.writerow(self.columns)
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Write one row (a mapping with the schema's column names)."""
+        values = [_export_value(row.get(column), kind) for column, kind in zip(self.columns, self._kinds)]
+
+        if self.fmt == 'csv':
+            self._csv.writerow(['' if value is None else value for value in values])
+        elif self.fmt == 'jsonl':
+            self._file.write(json.dumps(dict(zip(self.columns, values)), ensure_ascii=False) + '\n')
+        else:
+            self._pending.append(values)
+            if len(self._pending) >= EXPORT_ROW_GROUP_ROWS:
+                self._flush_row_group()
+        self.rows += 1
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Write rows as they are produced; returns the number written."""
+        start = self.rows
+        for row in rows:
+            self.write(row)
+        return self.rows - start
+
+    def _flush_row_group(self) -> None:
+        import pyarrow as pa
+
+        columns = list(zip(*self._pending)) if self._pending else [[] for _ in self.columns]
+        self._parquet.write_table(pa.Table.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, self._schema)],
+            schema=self._schema
+        ))
+        self._pending = []
+
+    def close(self) -> str:
+        """Finish the file and move it into place; returns its path."""
+        try:
+            if self.fmt == 'parquet':
+                if self._pending or self.rows == 0:
+                    self._flush_row_group()
+                self._parquet.close()
+            else:
+                self._file.close()
+            os.replace(self._temp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        return self.path
+
+    def abort(self) -> None:
+        """Discard the rows written so far; the target file is not touched."""
+        try:
+            if self.fmt == 'parquet':
+                self._parquet.close()
+            else:
+                self._file.close()
+        except Exception:
+            pass
+        try:
+            os.remove(self._temp_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+def export_results(source, path: str, fmt: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Export an analysis, the session history or batch results.
+
+    Args:
+        source: See result_rows (analysis dict, AnalysisHistory, results
+                DataFrame, or an iterable of analyses / rows, e.g. a
+                generator producing batch results)
+        path: Target file; the format's extension is added if missing
+        fmt: 'csv', 'jsonl' or 'parquet' (default: from the extension, else csv)
+
+    Returns:
+        dict with 'path', 'format', 'rows' and 'columns'
+
+    Example:
+        >>> export_results(run_batch_analysis(grid), 'exports/batch', fmt='jsonl')
+        {'path': 'exports/batch.jsonl', 'format': 'jsonl', 'rows': 135, ...}
+    """
+    columns, rows = result_rows(source)
+
+    with ResultWriter(path, fmt, columns) as writer:
+        writer.write_many(rows)
+
+    return {'path': writer.path, 'format': writer.fmt, 'rows': writer.rows, 'columns': writer.columns}
@@ -0,0 +1,168 @@
+"""
+One-at-a-time sensitivity (tornado) analysis of total system cost.
+
+Each input is perturbed down and up while the others stay at the base case.
+Catalog inputs (power, T1, temperature rise, approach) move to the
+neighbouring ALLHX grid values; pipe unit cost and room length move by a
+relative step. All perturbed scenarios are evaluated in a single call to
+run_batch_analysis.
+"""
+
+from typing import Dict, Optional, List, Any
+
+import numpy as np
+import pandas as pd
+
+from core.lookup import get_allhx_grid
+from core.batch_analysis import run_batch_analysis
+
+# Inputs varied in the sensitivity analysis, with their display labels
+SENSITIVITY_INPUTS = {
+    'power': 'Power (MW)',
+    't1': 'T1 (°C)',
+    'temp_diff': 'Temperature Rise (°C)',
+    'approach': 'Approach (°C)',
+    'pipe_cost_per_meter': 'Pipe Unit Cost (€/m)',
+    'total_pipe_length': 'Room / Pipe Length (m)',
+}
+
+# Inputs that must stay on the ALLHX catalog grid
+GRID_INPUTS = ['power', 't1', 'temp_diff', 'approach']
+
+
+def _grid_neighbours(value: float, grid: List[float]):
+    """Nearest catalog values below and above `value` (None at the edges)."""
+    below = [v for v in grid if v < value]
+    above = [v for v in grid if v > value]
+    return (below[-1] if below else None), (above[0] if above else None)
+
+
+def run_sensitivity_analysis(power: float, t1: float, temp_diff: float, approach: float,
+                             relative_step: float = 0.1, output: str = 'total_cost',
+                             inputs: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    One-at-a-time sensitivity of a result column to each input.
+
+    Args:
+        power: Base case power in MW
+        t1: Base case T1 in °C
+        temp_diff: Base case temperature rise in °C
+        approach: Base case approach in °C
+        relative_step: Relative perturbation for continuous inputs (0.1 = ±10%)
+        output: Result column to analyse (default total_cost)
+        inputs: Subset of SENSITIVITY_INPUTS to vary (default all)
+
+    Returns:
+        Dictionary with the base value, a per-input list sorted by swing
+        (largest first) with elasticities, and the full scenario table.
+        Returns None if the base case has no catalog data.
+    """
+    inputs = inputs or list(SENSITIVITY_INPUTS.keys())
+    unknown = set(inputs) - set(SENSITIVITY_INPUTS)
+    if unknown:
+        raise ValueError(f"Unknown sensitivity inputs: {sorted(unknown)}")
+
+    base_params = {'power': power, 't1': t1, 'temp_diff': temp_diff, 'approach': approach}
+
+    base = run_batch_analysis([base_params]).iloc[0]
+    if base['status'] != 'success':
+        print("❌ Sensitivity base case has no catalog data")
+        return None
+
+    base_values = dict(base_params)
+    base_values['pipe_cost_per_meter'] = base['pipe_cost_per_meter']
+    base_values['total_pipe_length'] = base['total_pipe_length']
+
+    grid = get_allhx_grid() if set(inputs) & set(GRID_INPUTS) else {}
+
+    # Build every perturbed scenario first, then evaluate them in one batch
+    scenarios = []
+    for name in inputs:
+        if name in GRID_INPUTS:
+            low, high = _grid_neighbours(base_values[name], grid.get(name, []))
+        else:
+            low = base_values[name] * (1 - relative_step)
+            high = base_values[name] * (1 + relative_step)
+
+        for side, value in (('low', low), ('high', high)):
+            if value is None:
+                continue
+            scenario = dict(base_params)
+            scenario['pipe_cost_per_meter'] = base_values['pipe_cost_per_meter']
+            scenario['total_pipe_length'] = base_values['total_pipe_length']
+            scenario[name] = value
+            if name in GRID_INPUTS:
+                # Let the looked-up pipe cost and length follow the new operating point
+                scenario['pipe_cost_per_meter'] = np.nan
+                scenario['total_pipe_length'] = np.nan
+            scenario['input'] = name
+            scenario['side'] = side
+            scenarios.append(scenario)
+
+    table = pd.DataFrame(scenarios)
+    if table.empty:
+        return {'output': output, 'base_value': float(base[output]), 'inputs': [], 'scenarios': table}
+
+    results = run_batch_analysis(table.drop(columns=['input', 'side']))
+    table['value'] = table.apply(lambda row: row[row['input']], axis=1).astype(float)
+    table['result'] = results[output].to_numpy(float)
+    table['status'] = results['status'].to_numpy()
+
+    base_output = float(base[output])
+    sensitivities = []
+    for name in inputs:
+        rows = table[(table['input'] == name) & (table['status'] == 'success')]
+        entry = {
+            'input': name,
+            'label': SENSITIVITY_INPUTS[name],
+            'base_value': float(base_values[name]),
+            'low_value': np.nan, 'low_result': np.nan,
+            'high_value': np.nan, 'high_result': np.nan,
+        }
+        for _, row in rows.iterrows():
+            entry[f"{row['side']}_value"] = float(row['value'])
+            entry[f"{row['side']}_result"] = float(row['result'])
+
+        # Elasticity: relative output change per relative input change (arc over low..high)
+        values = [entry['low_value'], entry['high_value']]
+        outcomes = [entry['low_result'], entry['high_result']]
+        if np.isnan(values[0]):
+            values[0], outcomes[0] = entry['base_value'], base_output
+        if np.isnan(values[1]):
+            values[1], outcomes[1] = entry['base_value'], base_output
+
+        if values[1] != values[0] and base_output != 0 and entry['base_value'] != 0:
+            entry['elasticity'] = ((outcomes[1] - outcomes[0]) / base_output) / \
+                                  ((values[1] - values[0]) / entry['base_value'])
+        else:
+            entry['elasticity'] = np.nan
+
+        entry['low_delta'] = entry['low_result'] - base_output
+        entry['high_delta'] = entry['high_result'] - base_output
+        entry['swing'] = float(np.nanmax([abs(entry['low_delta']), abs(entry['high_delta']), 0.0]))
+        sensitivities.append(entry)
+
+    sensitivities.sort(key=lambda e: e['swing'], reverse=True)
+
+    return {
+        'output': output,
+        'base_value': base_output,
+        'base_parameters': base_values,
+        'inputs': sensitivities,
+        'scenarios': table,
+    }
+
+
+def get_tornado_data(sensitivity: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Tornado chart data from a sensitivity result.
+
+    Args:
+        sensitivity: Result of run_sensitivity_analysis
+
+    Returns:
+        DataFrame with label, low_delta, high_delta, low_value, high_value,
+        elasticity and swing, largest swing first
+    """
+    columns = ['label', 'low_value', 'high_value', 'low_delta', 'high_delta', 'elasticity', 'swing']
+    return pd.DataFrame(sensitivity['inputs'], columns=['input'] + columns).set_index('input')
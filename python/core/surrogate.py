@@ -0,0 +1,342 @@
+"""
+Surrogate model for off-grid ALLHX estimates.
+
+The ALLHX catalog only covers discrete operating points, so
+lookup_allhx_data returns None for anything in between. This module builds
+a multilinear interpolator over the (wha, T1, itdt, TCSapp) grid once from
+the catalog and answers arbitrary inputs in microseconds.
+
+Every estimate carries an extrapolation flag (inputs outside the catalog
+range are clamped to its edge) and error bounds measured on catalog rows
+held out of the fit.
+"""
+
+import itertools
+from typing import Dict, Optional, List, Any
+
+import numpy as np
+import pandas as pd
+
+from core.lookup import get_allhx_points
+from data.loader import register_reload_hook
+
+# Catalog columns used as surrogate inputs (in grid-axis order) and outputs
+SURROGATE_INPUTS = ['wha', 'T1', 'itdt', 'TCSapp']
+SURROGATE_OUTPUTS = ['F1', 'F2', 'T3', 'T4', 'costHX']
+
+# Cached surrogate built from the loaded catalog
+_allhx_surrogate = None
+
+
+class GridSurrogate:
+    """
+    Multilinear interpolator over a (possibly incomplete) regular grid.
+
+    Grid cells missing from the catalog are filled once at build time by
+    interpolating along the axes; the share of interpolation weight that
+    falls on real catalog rows is reported as 'support'.
+    """
+
+    def __init__(self, axes: List[np.ndarray], values: np.ndarray,
+                 inputs: List[str], outputs: List[str]):
+        self.axes = [np.asarray(axis, dtype=float) for axis in axes]
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.error_bounds = {name: np.nan for name in self.outputs}
+        self.validation = None
+
+        values = np.asarray(values, dtype=float)      # (n_outputs, *grid_shape)
+        self.observed = ~np.isnan(values).any(axis=0)
+        self.values = _fill_missing_cells(values, self.axes)
+
+        # All 2^d corner offsets of a grid cell, shape (2^d, d, 1)
+        self._corners = np.array(list(itertools.product((0, 1), repeat=len(self.axes))),
+                                 dtype=bool)[:, :, None]
+
+    @classmethod
+    def from_table(cls, table: pd.DataFrame, inputs: List[str] = SURROGATE_INPUTS,
+                   outputs: List[str] = SURROGATE_OUTPUTS) -> 'GridSurrogate':
+        """
+        Build a surrogate from catalog rows.
+
+        Duplicate operating points keep their first row, matching
+        lookup_allhx_data.
+
+        Args:
+            table: Catalog rows with numeric input and output columns
+            inputs: Input columns (grid axes)
+            outputs: Output columns to interpolate
+
+        Returns:
+            GridSurrogate instance
+        """
+        table = table.drop_duplicates(subset=inputs, keep='first')
+        axes = [np.sort(table[name].unique().astype(float)) for name in inputs]
+
+        values = np.full((len(outputs),) + tuple(len(axis) for axis in axes), np.nan)
+        index = tuple(np.searchsorted(axis, table[name].to_numpy(float)) for axis, name in zip(axes, inputs))
+        for k, name in enumerate(outputs):
+            values[(k,) + index] = table[name].to_numpy(float)
+
+        return cls(axes, values, inputs, outputs)
+
+    def predict(self, **inputs) -> Dict[str, np.ndarray]:
+        """
+        Estimate outputs for arbitrary inputs.
+
+        Args:
+            **inputs: One scalar or array per input column, e.g.
+                      wha=1.5, T1=25, itdt=11, TCSapp=2.5
+
+        Returns:
+            Dictionary with one array per output plus 'extrapolated'
+            (bool) and 'support' (share of interpolation weight on cells
+            present in the catalog; 1.0 = every corner is a catalog row)
+        """
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise ValueError(f"Missing surrogate inputs: {missing}")
+
+        points = np.broadcast_arrays(*[np.atleast_1d(np.asarray(inputs[name], dtype=float))
+                                       for name in self.inputs])
+        n_points = points[0].size
+        extrapolated = np.zeros(n_points, dtype=bool)
+
+        lower = np.empty((len(self.axes), n_points), dtype=int)
+        upper = np.empty((len(self.axes), n_points), dtype=int)
+        fractions = np.zeros((len(self.axes), n_points))
+        for d, (axis, x) in enumerate(zip(self.axes, points)):
+            x = x.ravel()
+            extrapolated |= (x < axis[0]) | (x > axis[-1])
+            if len(axis) == 1:
+                lower[d] = upper[d] = 0
+                continue
+            clamped = np.clip(x, axis[0], axis[-1])
+            idx = np.clip(np.searchsorted(axis, clamped, side='right') - 1, 0, len(axis) - 2)
+            lower[d] = idx
+            upper[d] = idx + 1
+            fractions[d] = (clamped - axis[idx]) / (axis[idx + 1] - axis[idx])
+
+        # Gather all corners at once: indices (2^d, d, n), weights (2^d, n)
+        corner_index = tuple(np.where(self._corners, upper, lower).transpose(1, 0, 2))
+        weights = np.where(self._corners, fractions, 1.0 - fractions).prod(axis=1)
+
+        estimates = (self.values[(slice(None),) + corner_index] * weights).sum(axis=1)
+
+        result = {name: estimates[k] for k, name in enumerate(self.outputs)}
+        result['extrapolated'] = extrapolated
+        result['support'] = (self.observed[corner_index] * weights).sum(axis=0)
+        return result
+
+
+def _fill_missing_cells(values: np.ndarray, axes: List[np.ndarray]) -> np.ndarray:
+    """
+    Fill grid cells missing from the catalog.
+
+    Each missing cell takes the mean of 1-D linear interpolations along
+    every axis line where it lies between catalog cells. Cells outside the
+    data on every line (grid edges) take the mean of linear extrapolations
+    from the two nearest cells instead, and lines holding a single cell
+    are only used as a last resort. Each round fills only the holes with
+    the most preferred kind of estimate, until no holes remain, so the
+    fill is exact for data that is linear in each input.
+    """
+    values = values.copy()
+    while np.isnan(values).any():
+        # Estimates by preference: interpolated, extrapolated, copied
+        estimate_sum = np.zeros((3,) + values.shape)
+        estimate_count = np.zeros((3,) + values.shape)
+
+        for d, axis in enumerate(axes):
+            lines = np.moveaxis(values, d + 1, -1).reshape(-1, len(axis))
+            filled = np.full((3,) + lines.shape, np.nan)
+            for i, line in enumerate(lines):
+                known = ~np.isnan(line)
+                if known.any() and not known.all():
+                    x, y = axis[known], line[known]
+                    inside = (axis >= x[0]) & (axis <= x[-1])
+                    filled[0, i, inside] = np.interp(axis[inside], x, y)
+                    if len(x) == 1:
+                        filled[2, i, ~inside] = y[0]
+                    else:
+                        left = axis < x[0]
+                        right = axis > x[-1]
+                        filled[1, i, left] = y[0] + (axis[left] - x[0]) * (y[1] - y[0]) / (x[1] - x[0])
+                        filled[1, i, right] = y[-1] + (axis[right] - x[-1]) * (y[-1] - y[-2]) / (x[-1] - x[-2])
+            shape = np.moveaxis(values, d + 1, -1).shape
+            filled = np.stack([np.moveaxis(f.reshape(shape), -1, d + 1) for f in filled])
+            available = ~np.isnan(filled)
+            estimate_sum[available] += filled[available]
+            estimate_count[available] += 1
+
+        # Fill only the holes with the most preferred kind of estimate this
+        # round; the others may get a better estimate from the new cells
+        for tier_sum, tier_count in zip(estimate_sum, estimate_count):
+            holes = np.isnan(values) & (tier_count > 0)
+            if holes.any():
+                values[holes] = tier_sum[holes] / tier_count[holes]
+                break
+        else:
+            break
+    return values
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def validate_surrogate(table: Optional[pd.DataFrame] = None, holdout_fraction: float = 0.2,
+                       seed: int = 0) -> Dict[str, Any]:
+    """
+    Measure surrogate error on catalog rows held out of the fit.
+
+    Args:
+        table: Catalog rows (defaults to the ALLHX operating points)
+        holdout_fraction: Share of distinct operating points held out
+        seed: Seed for choosing the held-out points
+
+    Returns:
+        Dictionary with per-output error statistics ('mean_abs', 'p95_abs',
+        'max_abs', 'mean_rel') and the number of held-out rows
+    """
+    if table is None:
+        table = get_allhx_points(SURROGATE_INPUTS + SURROGATE_OUTPUTS)
+    if table is None or table.empty:
+        return {'n_holdout': 0, 'errors': {}}
+
+    table = table.drop_duplicates(subset=SURROGATE_INPUTS, keep='first').reset_index(drop=True)
+    rng = np.random.default_rng(seed)
+    n_holdout = max(1, int(round(len(table) * holdout_fraction)))
+    holdout = np.zeros(len(table), dtype=bool)
+    holdout[rng.choice(len(table), size=n_holdout, replace=False)] = True
+
+    model = GridSurrogate.from_table(table[~holdout])
+    held = table[holdout]
+    predicted = model.predict(**{name: held[name].to_numpy(float) for name in SURROGATE_INPUTS})
+
+    errors = {}
+    for name in SURROGATE_OUTPUTS:
+        actual = held[name].to_numpy(float)
+        abs_error = np.abs(predicted[name] - actual)
+        valid = ~np.isnan(abs_error)
+        if not valid.any():
+            errors[name] = {'mean_abs': np.nan, 'p95_abs': np.nan, 'max_abs': np.nan, 'mean_rel': np.nan}
+            continue
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rel_error = np.where(actual[valid] != 0, abs_error[valid] / np.abs(actual[valid]), np.nan)
+        errors[name] = {
+            'mean_abs': float(abs_error[valid].mean()),
+            'p95_abs': float(np.percentile(abs_error[valid], 95)),
+            'max_abs': float(abs_error[valid].max()),
+            'mean_rel': float(np.nanmean(rel_error)) if np.isfinite(rel_error).any() else np.nan,
+        }
+
+    return {
+        'n_holdout': int(n_holdout),
+        'n_extrapolated': int(predicted['extrapolated'].sum()),
+        'errors': errors,
+    }
+
+# =============================================================================
+# CATALOG SURROGATE ACCESS
+# =============================================================================
+
+def build_allhx_surrogate(validate: bool = True, holdout_fraction: float = 0.2,
+                          seed: int = 0) -> Optional[GridSurrogate]:
+    """
+    Build the ALLHX surrogate from the loaded catalog.
+
+    Args:
+        validate: Measure error bounds on held-out catalog rows
+        holdout_fraction: Share of operating points held out for validation
+        seed: Seed for the held-out split
+
+    Returns:
+        GridSurrogate fitted on the full catalog, or None if ALLHX is unavailable
+    """
+    table = get_allhx_points(SURROGATE_INPUTS + SURROGATE_OUTPUTS)
+    if table is None:
+        return None
+
+    model = GridSurrogate.from_table(table)
+    if validate:
+        model.validation = validate_surrogate(table, holdout_fraction, seed)
+        model.error_bounds = {name: stats['p95_abs']
+                              for name, stats in model.validation['errors'].items()}
+    return model
+
+
+def get_allhx_surrogate(rebuild: bool = False) -> Optional[GridSurrogate]:
+    """
+    Get the cached ALLHX surrogate, building it on first use.
+
+    Args:
+        rebuild: Force a rebuild (e.g. after reloading the catalog)
+
+    Returns:
+        GridSurrogate or None if ALLHX is unavailable
+    """
+    global _allhx_surrogate
+
+    if _allhx_surrogate is None or rebuild:
+        _allhx_surrogate = build_allhx_surrogate()
+    return _allhx_surrogate
+
+
+def _invalidate_allhx_surrogate(tables) -> None:
+    """Drop the cached surrogate when the ALLHX table was reloaded."""
+    global _allhx_surrogate
+
+    if 'ALLHX' in tables:
+        _allhx_surrogate = None
+
+
+register_reload_hook(_invalidate_allhx_surrogate)
+
+
+def estimate_allhx_data(power: float, t1: float, temp_diff: float, approach: float) -> Optional[Dict[str, Any]]:
+    """
+    Estimate ALLHX data for an arbitrary operating point.
+
+    Returns the same keys as lookup_allhx_data plus 'estimated',
+    'extrapolated', 'support' and 'error_bounds' (95th percentile absolute
+    error on held-out catalog rows).
+
+    Args:
+        power: System power in MW
+        t1: Inlet temperature in °C
+        temp_diff: Temperature difference in °C
+        approach: Approach value
+
+    Returns:
+        System data dictionary, or None if no estimate is possible
+    """
+    model = get_allhx_surrogate()
+    if model is None:
+        return None
+
+    estimate = model.predict(wha=power, T1=t1, itdt=temp_diff, TCSapp=approach)
+    if np.isnan(estimate['F1'][0]):
+        return None
+
+    return {
+        'power': power,
+        'F1': float(estimate['F1'][0]),
+        'F2': float(estimate['F2'][0]),
+        'T1': t1,
+        'T2': t1 + temp_diff,
+        'T3': float(estimate['T3'][0]),
+        'T4': float(estimate['T4'][0]),
+        'hx_cost': float(estimate['costHX'][0]),
+        'approach': approach,
+        'temp_diff': temp_diff,
+        'estimated': True,
+        'extrapolated': bool(estimate['extrapolated'][0]),
+        'support': float(estimate['support'][0]),
+        'error_bounds': {
+            'F1': model.error_bounds.get('F1'),
+            'F2': model.error_bounds.get('F2'),
+            'T3': model.error_bounds.get('T3'),
+            'T4': model.error_bounds.get('T4'),
+            'hx_cost': model.error_bounds.get('costHX'),
+        },
+    }
@@ -0,0 +1,245 @@
+"""
+Monte Carlo cost uncertainty analysis.
+
+Vendor prices (HX, PIPCOST, CVALV, IVALV), pipe lengths and installation
+effort are point estimates. This module samples multiplicative uncertainty
+factors around those estimates and evaluates the calculate_system_costs
+formula for every draw as array math.
+
+Runs are reproducible: a seed produces the same draws whether scenarios are
+evaluated serially or across a process pool, because every scenario gets
+its own child stream spawned from one SeedSequence.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, List, Any, Sequence
+
+import numpy as np
+
+from core.original_calculations import combine_system_costs
+
+# =============================================================================
+# DEFAULT DISTRIBUTIONS - Multiplicative factors around the point estimates
+# =============================================================================
+
+UNCERTAINTY_DISTRIBUTIONS = {
+    'pipe_cost_per_meter':  {'distribution': 'triangular', 'low': 0.85, 'mode': 1.0, 'high': 1.30},
+    'total_pipe_length':    {'distribution': 'triangular', 'low': 0.90, 'mode': 1.0, 'high': 1.50},
+    'control_valve_cost':   {'distribution': 'uniform', 'low': 0.90, 'high': 1.20},
+    'isolation_valve_cost': {'distribution': 'uniform', 'low': 0.90, 'high': 1.20},
+    'hx_cost':              {'distribution': 'lognormal', 'sigma': 0.15},
+    'pump_cost':            {'distribution': 'normal', 'sd': 0.10},
+    'installation_cost':    {'distribution': 'triangular', 'low': 0.80, 'mode': 1.0, 'high': 1.60},
+}
+
+COST_COMPONENTS = list(UNCERTAINTY_DISTRIBUTIONS.keys())
+
+DEFAULT_PERCENTILES = (5, 10, 50, 90, 95)
+
+# =============================================================================
+# SAMPLING
+# =============================================================================
+
+def sample_factor(spec: Dict[str, Any], n_draws: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw multiplicative factors for one cost component.
+
+    Args:
+        spec: Distribution specification, e.g. {'distribution': 'uniform', 'low': 0.9, 'high': 1.2}
+        n_draws: Number of draws
+        rng: NumPy random generator
+
+    Returns:
+        Array of n_draws non-negative factors
+    """
+    kind = spec.get('distribution', 'fixed')
+
+    if kind == 'fixed':
+        draws = np.full(n_draws, float(spec.get('value', 1.0)))
+    elif kind == 'uniform':
+        draws = rng.uniform(spec['low'], spec['high'], n_draws)
+    elif kind == 'triangular':
+        draws = rng.triangular(spec['low'], spec['mode'], spec['high'], n_draws)
+    elif kind == 'normal':
+        draws = rng.normal(spec.get('mean', 1.0), spec['sd'], n_draws)
+    elif kind == 'lognormal':
+        # Median of 1.0 keeps the point estimate as the central value
+        draws = rng.lognormal(np.log(spec.get('median', 1.0)), spec['sigma'], n_draws)
+    else:
+        raise ValueError(f"Unknown distribution '{kind}'")
+
+    return np.clip(draws, 0.0, None)
+
+
+def sample_cost_factors(n_draws: int, rng: np.random.Generator,
+                        distributions: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, np.ndarray]:
+    """
+    Draw factors for every cost component.
+
+    Components are always sampled in COST_COMPONENTS order so the same seed
+    gives the same draws regardless of dictionary ordering.
+
+    Args:
+        n_draws: Number of draws
+        rng: NumPy random generator
+        distributions: Overrides for UNCERTAINTY_DISTRIBUTIONS
+
+    Returns:
+        Dictionary of component name -> array of factors
+    """
+    specs = dict(UNCERTAINTY_DISTRIBUTIONS)
+    if distributions:
+        unknown = set(distributions) - set(specs)
+        if unknown:
+            raise ValueError(f"Unknown cost components: {sorted(unknown)}")
+        specs.update(distributions)
+
+    return {name: sample_factor(specs[name], n_draws, rng) for name in COST_COMPONENTS}
+
+# =============================================================================
+# EVALUATION
+# =============================================================================
+
+def get_cost_components(analysis: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Extract point-estimate cost components from a complete analysis.
+
+    Args:
+        analysis: Result of get_complete_system_analysis (or its 'costs' dict)
+
+    Returns:
+        Dictionary of component name -> point estimate
+    """
+    costs = analysis.get('costs', analysis)
+    return {name: float(costs[name]) for name in COST_COMPONENTS}
+
+
+def evaluate_cost_draws(components: Dict[str, float], factors: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Total system cost for every draw.
+
+    Args:
+        components: Point estimates from get_cost_components
+        factors: Sampled factors from sample_cost_factors
+
+    Returns:
+        Array of total costs, one per draw
+    """
+    scaled = {name: components[name] * factors[name] for name in COST_COMPONENTS}
+    return combine_system_costs(**scaled)
+
+
+def variance_drivers(total_cost: np.ndarray, factors: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Rank cost components by their contribution to total cost variance.
+
+    Contributions are squared correlations between each sampled factor and
+    the total cost, normalized to sum to one.
+
+    Args:
+        total_cost: Array of total costs per draw
+        factors: Sampled factors per component
+
+    Returns:
+        List of {'component', 'correlation', 'contribution'} dicts, largest first
+    """
+    centered_total = total_cost - total_cost.mean()
+    total_norm = np.sqrt(np.dot(centered_total, centered_total))
+
+    drivers = []
+    for name in COST_COMPONENTS:
+        centered = factors[name] - factors[name].mean()
+        norm = np.sqrt(np.dot(centered, centered))
+        corr = float(np.dot(centered, centered_total) / (norm * total_norm)) if norm > 0 and total_norm > 0 else 0.0
+        drivers.append({'component': name, 'correlation': corr, 'contribution': corr ** 2})
+
+    total_r2 = sum(d['contribution'] for d in drivers)
+    if total_r2 > 0:
+        for d in drivers:
+            d['contribution'] /= total_r2
+
+    return sorted(drivers, key=lambda d: d['contribution'], reverse=True)
+
+
+def run_cost_monte_carlo(analysis: Dict[str, Any], n_draws: int = 100_000, seed=None,
+                         distributions: Optional[Dict[str, Dict[str, Any]]] = None,
+                         percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                         return_samples: bool = False) -> Dict[str, Any]:
+    """
+    Monte Carlo cost uncertainty for one scenario.
+
+    Args:
+        analysis: Complete analysis, its 'costs' dict, or cost components
+        n_draws: Number of draws
+        seed: Seed, SeedSequence or Generator for reproducible results
+        distributions: Overrides for UNCERTAINTY_DISTRIBUTIONS
+        percentiles: Percentiles of total cost to report
+        return_samples: Include the total cost draws in the result
+
+    Returns:
+        Dictionary with the point estimate, mean, std, percentiles and
+        variance drivers
+    """
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    components = get_cost_components(analysis)
+
+    factors = sample_cost_factors(n_draws, rng, distributions)
+    total_cost = evaluate_cost_draws(components, factors)
+
+    point_estimate = float(combine_system_costs(**components))
+    percentile_values = np.percentile(total_cost, percentiles)
+
+    result = {
+        'n_draws': n_draws,
+        'point_estimate': point_estimate,
+        'mean': float(total_cost.mean()),
+        'std': float(total_cost.std(ddof=1)) if n_draws > 1 else 0.0,
+        'percentiles': {f"p{p:g}": float(v) for p, v in zip(percentiles, percentile_values)},
+        'probability_above_point_estimate': float(np.mean(total_cost > point_estimate)),
+        'drivers': variance_drivers(total_cost, factors),
+    }
+    if return_samples:
+        result['samples'] = total_cost
+    return result
+
+
+def _run_scenario(args):
+    """Process-pool worker: unpack arguments for run_cost_monte_carlo."""
+    components, n_draws, seed_seq, distributions, percentiles = args
+    return run_cost_monte_carlo(components, n_draws, np.random.default_rng(seed_seq),
+                                distributions, percentiles)
+
+
+def run_monte_carlo_scenarios(analyses: List[Dict[str, Any]], n_draws: int = 100_000, seed=None,
+                              distributions: Optional[Dict[str, Dict[str, Any]]] = None,
+                              percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                              max_workers: Optional[int] = 1) -> List[Dict[str, Any]]:
+    """
+    Monte Carlo cost uncertainty for many scenarios.
+
+    Each scenario gets an independent random stream spawned from `seed`, so
+    results are identical for any value of max_workers.
+
+    Args:
+        analyses: List of complete analyses (or cost component dicts)
+        n_draws: Number of draws per scenario
+        seed: Root seed
+        distributions: Overrides for UNCERTAINTY_DISTRIBUTIONS
+        percentiles: Percentiles of total cost to report
+        max_workers: Number of worker processes (1 = run in this process,
+                     None = one per CPU)
+
+    Returns:
+        List of results in the same order as analyses
+    """
+    child_seeds = np.random.SeedSequence(seed).spawn(len(analyses))
+    jobs = [
+        (get_cost_components(analysis), n_draws, child, distributions, tuple(percentiles))
+        for analysis, child in zip(analyses, child_seeds)
+    ]
+
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_run_scenario(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_scenario, jobs))
@@ -4,10 +4,15 @@ Data handling module for Heat Reuse Tool
 
 This module automatically loads and provides access to all CSV data files.
 The csv_data dictionary is automatically populated when the module is imported.
+Pass lazy=True to load_csv_files to parse each CSV table on its first
+get_csv_data() call instead.
 """
 
-from .loader import csv_data, load_csv_files, get_csv_data, is_csv_loaded, list_loaded_csvs
-from .converter import universal_float_convert
+from .loader import (csv_data, load_csv_files, get_csv_data, get_column_store, is_csv_loaded,
+                     list_loaded_csvs, reload_changed_files, register_reload_hook,
+                     start_watching, stop_watching, get_conversion_diagnostics)
+from .converter import universal_float_convert, conversion_cache_info, clear_conversion_cache
+from .catalog import get_catalog, query_operating_point, list_vendors, open_catalog, persist_catalog
 
 # Auto-load CSV files when module is imported
 import os
@@ -47,7 +52,20 @@ __all__ = [
     'csv_data',
     'load_csv_files',
     'get_csv_data', 
+    'get_column_store',
     'is_csv_loaded',
     'list_loaded_csvs',
-    'universal_float_convert'
+    'reload_changed_files',
+    'register_reload_hook',
+    'start_watching',
+    'stop_watching',
+    'get_conversion_diagnostics',
+    'universal_float_convert',
+    'conversion_cache_info',
+    'clear_conversion_cache',
+    'get_catalog',
+    'query_operating_point',
+    'list_vendors',
+    'open_catalog',
+    'persist_catalog'
 ]
\ No newline at end of file
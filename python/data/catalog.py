@@ -0,0 +1,360 @@
+"""
+Multi-Vendor Heat Exchanger Catalog
+
+Merges every vendor HX selection table (ALLHX.csv, ALLHX_SWEP.csv, and any
+further ALLHX_<VENDOR>.csv) into one typed table with a vendor column,
+indexed by operating point (wha, T1, itdt, TCSapp). A single query returns
+all vendors' offerings for a point, ranked by cost, area, weight or CO2.
+
+Values are kept in each vendor's reported units; areaHX in particular is
+not directly comparable between vendors, so ranking several vendors by
+area needs each one's factor to m² (see AREA_M2_PER_UNIT).
+
+The catalog is also persisted as a memory-mapped column store (see
+data.columnar) in the data directory's snapshot folder. Its header records
+the column schema and the fingerprints of the source files, so every
+process and kernel on a host opens the same files near-instantly and
+shares one copy of the data through the page cache.
+"""
+
+import os
+import pandas as pd
+from typing import Dict, Optional, List, Any
+
+from .loader import (get_table_columns, is_csv_loaded, list_loaded_csvs, freeze_table, register_reload_hook,
+                     get_data_dir, get_table_fingerprint)
+from .columnar import ColumnStore, ColumnStoreWriter
+from .schema import HX_SELECTION_COLUMNS, VENDOR_TABLE_PREFIX, schema_signature
+from .snapshot import SNAPSHOT_DIR_NAME
+
+# Known vendor tables -> vendor label. Any other loaded ALLHX_<NAME> table
+# is picked up automatically with <NAME> as its vendor label.
+VENDOR_TABLES = {
+    'ALLHX': 'ALLHX',
+    'ALLHX_SWEP': 'SWEP',
+}
+
+# Operating point that identifies an HX selection across vendors
+OPERATING_POINT_COLUMNS = ['wha', 'T1', 'itdt', 'TCSapp']
+
+# Shared vendor schema (source column order)
+CATALOG_SOURCE_COLUMNS = list(HX_SELECTION_COLUMNS)
+CATALOG_NUMERIC_COLUMNS = [c for c, spec in HX_SELECTION_COLUMNS.items() if spec['dtype'] == 'float']
+
+CATALOG_COLUMNS = ['vendor'] + CATALOG_SOURCE_COLUMNS
+
+# Ranking keys accepted by query_operating_point
+RANK_METRICS = {
+    'cost': 'costHX',
+    'area': 'areaHX',
+    'weight': 'Hxweight',
+    'co2': 'CO2_Footprint',
+}
+
+# Factor from a vendor's areaHX unit to m², by vendor label. Neither shipped
+# table documents its unit (ALLHX reports ~690-3500, SWEP ~0.1-2.3 for the
+# same duties), so both are missing and their areas are only ranked per vendor.
+AREA_M2_PER_UNIT: Dict[str, float] = {}
+
+# Persisted catalog store (inside the data directory's snapshot folder)
+CATALOG_STORE_NAME = 'catalog.columns'
+CATALOG_STORE_CHUNK_ROWS = 100_000
+
+# Merged catalog and its column store, built or opened on first use
+_catalog: Optional[pd.DataFrame] = None
+_catalog_store: Optional[ColumnStore] = None
+
+
+def discover_vendor_tables() -> Dict[str, str]:
+    """
+    Find loaded vendor HX tables.
+
+    Returns:
+        dict: Table name -> vendor label, for every loaded vendor table
+    """
+    tables = {name: vendor for name, vendor in VENDOR_TABLES.items() if is_csv_loaded(name)}
+
+    for name in list_loaded_csvs():
+        if name.startswith(VENDOR_TABLE_PREFIX) and name not in tables:
+            tables[name] = name[len(VENDOR_TABLE_PREFIX):]
+
+    return tables
+
+
+def load_vendor_table(table_name: str, vendor: str) -> Optional[pd.DataFrame]:
+    """
+    Load one vendor table into the shared typed schema.
+
+    The loader has already typed and cleaned the table (trailing empty
+    columns and legend rows removed, see data.schema); this adds the vendor
+    column and keeps the first row per operating point. A table kept in a
+    column store is read in chunks, catalog columns only.
+
+    Args:
+        table_name: Loaded table name (e.g. 'ALLHX_SWEP')
+        vendor: Vendor label stored in the vendor column
+
+    Returns:
+        DataFrame with CATALOG_COLUMNS, or None if the table lacks the schema
+    """
+    try:
+        typed = get_table_columns(table_name, CATALOG_SOURCE_COLUMNS, first_per=OPERATING_POINT_COLUMNS)
+    except KeyError as e:
+        print(f"❌ {table_name} is missing catalog columns: {e.args[0]}")
+        return None
+
+    typed.insert(0, 'vendor', vendor)
+    return typed
+
+
+def build_catalog(tables: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Merge vendor tables into one catalog indexed by operating point.
+
+    Args:
+        tables: Table name -> vendor label (default: discover_vendor_tables())
+
+    Returns:
+        Read-only FrozenTable with a sorted (wha, T1, itdt, TCSapp)
+        MultiIndex and columns vendor, T2, F1, ..., CO2_Footprint
+    """
+    tables = tables if tables is not None else discover_vendor_tables()
+
+    frames = [load_vendor_table(name, vendor) for name, vendor in tables.items()]
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+
+    if not frames:
+        catalog = pd.DataFrame(columns=CATALOG_COLUMNS)
+    else:
+        catalog = pd.concat(frames, ignore_index=True)
+
+    catalog['vendor'] = catalog['vendor'].astype('category')
+    return freeze_table(catalog.set_index(OPERATING_POINT_COLUMNS).sort_index())
+
+
+def get_catalog(rebuild: bool = False) -> pd.DataFrame:
+    """
+    Get the merged multi-vendor catalog, building it on first use.
+
+    Args:
+        rebuild: Rebuild from the loaded tables (e.g. after reloading CSVs)
+
+    Returns:
+        Merged catalog DataFrame
+    """
+    global _catalog
+
+    if _catalog is None or rebuild:
+        _catalog = build_catalog()
+    return _catalog
+
+
+def _invalidate_catalog(tables) -> None:
+    """Drop the merged catalog when a vendor table was reloaded."""
+    global _catalog, _catalog_store
+
+    if any(name in VENDOR_TABLES or name.startswith(VENDOR_TABLE_PREFIX) for name in tables):
+        _catalog = None
+        _catalog_store = None
+
+
+register_reload_hook(_invalidate_catalog)
+
+
+# =============================================================================
+# PERSISTED CATALOG STORE
+# =============================================================================
+
+def catalog_store_path(data_dir: Optional[str] = None) -> Optional[str]:
+    """Location of the persisted catalog for a data directory (default: the loaded one)."""
+    data_dir = data_dir or get_data_dir()
+    if data_dir is None:
+        return None
+    return os.path.join(os.path.abspath(data_dir), SNAPSHOT_DIR_NAME, CATALOG_STORE_NAME)
+
+
+def catalog_fingerprint() -> Dict[str, Any]:
+    """
+    Identify the catalog contents: schema digest plus, per vendor table,
+    its label and the fingerprint of its source file.
+    """
+    sources = {}
+    for name, vendor in sorted(discover_vendor_tables().items()):
+        fingerprint = get_table_fingerprint(name)
+        sources[name] = [vendor, list(fingerprint) if fingerprint else None]
+    return {'signature': schema_signature(), 'sources': sources}
+
+
+def catalog_schema() -> Dict[str, Dict[str, str]]:
+    """Column dtypes and units of the persisted catalog, in store column order."""
+    schema = {'vendor': {'dtype': 'str', 'units': 'label'}}
+    schema.update({name: {'dtype': spec['dtype'], 'units': spec['units']}
+                   for name, spec in HX_SELECTION_COLUMNS.items()})
+    return schema
+
+
+def persist_catalog(store_dir: Optional[str] = None) -> ColumnStore:
+    """
+    Write the merged catalog as a memory-mapped column store.
+
+    Rows are written in catalog order (sorted by operating point) with the
+    operating point as ordinary columns, so select() finds a point by
+    binary search. The store header holds the catalog schema and
+    catalog_fingerprint().
+
+    Args:
+        store_dir: Target directory (default: catalog_store_path())
+
+    Returns:
+        The persisted ColumnStore, opened for reading
+    """
+    store_dir = store_dir or catalog_store_path()
+    if store_dir is None:
+        raise ValueError("❌ No data directory loaded; pass store_dir to persist the catalog")
+
+    catalog = get_catalog().reset_index()[list(catalog_schema())]
+    os.makedirs(os.path.dirname(store_dir), exist_ok=True)
+
+    writer = ColumnStoreWriter(store_dir, 'CATALOG', sorted_by=OPERATING_POINT_COLUMNS)
+    try:
+        for start in range(0, max(len(catalog), 1), CATALOG_STORE_CHUNK_ROWS):
+            writer.append(catalog.iloc[start:start + CATALOG_STORE_CHUNK_ROWS])
+    except Exception:
+        writer.abort()
+        raise
+    return writer.close({'schema': catalog_schema(), 'fingerprint': catalog_fingerprint()})
+
+
+def open_catalog(store_dir: Optional[str] = None, validate: bool = True) -> Optional[ColumnStore]:
+    """
+    Open the persisted catalog without building it.
+
+    Only the store header is read; columns are mapped, not read.
+
+    Args:
+        store_dir: Store directory (default: catalog_store_path())
+        validate: Reject a store whose fingerprint does not match the
+                  currently loaded vendor tables
+
+    Returns:
+        ColumnStore, or None if missing or stale
+    """
+    store_dir = store_dir or catalog_store_path()
+    if store_dir is None:
+        return None
+
+    store = ColumnStore.open(store_dir)
+    if store is None:
+        return None
+    if validate and store.meta.get('fingerprint') != catalog_fingerprint():
+        return None
+    return store
+
+
+def get_catalog_store(rebuild: bool = False) -> Optional[ColumnStore]:
+    """
+    Get the persisted catalog, writing it first if missing or stale.
+
+    Args:
+        rebuild: Re-persist even if the stored catalog is current
+
+    Returns:
+        ColumnStore, or None if the catalog cannot be persisted (e.g. no
+        data directory loaded, or a read-only data directory)
+    """
+    global _catalog_store
+
+    if _catalog_store is None or rebuild:
+        store = None if rebuild else open_catalog()
+        if store is None:
+            try:
+                store = persist_catalog()
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Catalog store unavailable, using the in-memory catalog: {e}")
+                return None
+        _catalog_store = store
+    return _catalog_store
+
+
+def list_vendors() -> List[str]:
+    """Get the vendor labels present in the catalog."""
+    store = get_catalog_store()
+    if store is not None:
+        return [str(v) for v in store.unique('vendor')]
+    return [str(v) for v in get_catalog()['vendor'].cat.categories]
+
+
+def query_operating_point(power: float, t1: float, temp_diff: float, approach: float,
+                          rank_by: str = 'cost', vendors: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    All vendors' offerings for one operating point, best first.
+
+    Args:
+        power: System power in MW (wha)
+        t1: Inlet temperature in °C
+        temp_diff: Temperature difference in °C (itdt)
+        approach: Approach value (TCSapp)
+        rank_by: 'cost', 'area', 'weight' or 'co2' (or a catalog column name).
+                 'area' ranks several vendors only if AREA_M2_PER_UNIT
+                 has all their factors
+        vendors: Optional subset of vendor labels
+
+    Returns:
+        DataFrame with one row per vendor offering, sorted ascending by the
+        ranking column, with a 'rank' column starting at 1. Empty if no
+        vendor covers the point. Values stay in the vendors' units.
+
+    Raises:
+        ValueError: Unknown ranking, or ranking by area across vendors
+                    whose areaHX unit is not known
+
+    Example:
+        >>> offers = query_operating_point(1, 20, 10, 2, rank_by='co2')
+        >>> offers[['vendor', 'Unit', 'costHX', 'CO2_Footprint']]
+    """
+    metric = RANK_METRICS.get(rank_by, rank_by)
+    if metric not in CATALOG_NUMERIC_COLUMNS:
+        raise ValueError(f"❌ Unknown ranking '{rank_by}'. Use one of: {list(RANK_METRICS)}")
+
+    store = get_catalog_store()
+    if store is not None:
+        rows = store.select(**dict(zip(OPERATING_POINT_COLUMNS, (power, t1, temp_diff, approach))))
+        if len(rows) == 0:
+            return pd.DataFrame(columns=CATALOG_COLUMNS + ['rank'])
+        offers = store.to_frame(rows)
+    else:
+        catalog = get_catalog()
+        key = (float(power), float(t1), float(temp_diff), float(approach))
+
+        try:
+            offers = catalog.loc[[key]].reset_index()
+        except KeyError:
+            return pd.DataFrame(columns=CATALOG_COLUMNS + ['rank'])
+
+    if vendors is not None:
+        offers = offers[offers['vendor'].isin(vendors)]
+
+    key = None
+    if metric == 'areaHX':
+        factors = _area_m2_factors(offers['vendor'])
+        key = lambda area: area * factors
+    offers = offers.sort_values(metric, kind='stable', key=key).reset_index(drop=True)
+    offers['rank'] = range(1, len(offers) + 1)
+    return offers[CATALOG_COLUMNS + ['rank']]
+
+
+def _area_m2_factors(vendors: pd.Series) -> pd.Series:
+    """
+    Per-offer factors that bring areaHX to m² for ranking. Offers of a
+    single vendor rank in its own unit.
+    """
+    labels = vendors.astype(str)
+    if labels.nunique() < 2:
+        return pd.Series(1.0, index=labels.index)
+
+    unknown = sorted(set(labels) - set(AREA_M2_PER_UNIT))
+    if unknown:
+        raise ValueError(f"❌ areaHX unit of {unknown} is unknown, so areas of different vendors cannot be "
+                         f"ranked together. Pass vendors=[...] to rank one vendor, or add the m² factor "
+                         f"to AREA_M2_PER_UNIT")
+    return labels.map(AREA_M2_PER_UNIT)
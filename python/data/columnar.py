@@ -0,0 +1,360 @@
+"""
+On-Disk Columnar Table Store
+
+Very large data tables (e.g. full-range vendor HX catalogs with millions of
+rows) are kept out of memory: the loader streams them in chunks into one
+binary file per column, and lookups read the columns through memory maps.
+Only the rows a lookup selects are ever turned into a DataFrame.
+
+Layout of a store directory:
+    CURRENT        Name of the live version directory
+    <version>/
+      meta.json    Table name, row count, column dtypes and text categories
+      col<i>.bin   Raw little-endian column values (float64, or int32 codes
+                   into the column's categories for text; -1 = missing)
+
+A rewrite builds a new version directory and then atomically replaces
+CURRENT, so a reader always opens one complete version, and a store
+opened before the rewrite keeps reading its own version.
+"""
+
+import json
+import os
+import shutil
+import time
+from typing import Dict, Optional, Any, List
+
+import numpy as np
+import pandas as pd
+
+STORE_FORMAT_VERSION = 1
+STORE_META_FILE = 'meta.json'
+STORE_POINTER_FILE = 'CURRENT'
+TEMP_SUFFIX = '.tmp'
+
+# Attempts to open a version that a concurrent writer may just have removed
+OPEN_RETRIES = 3
+
+# Rows materialized at a time when a whole store is read (see iter_frames)
+READ_CHUNK_ROWS = 100_000
+
+# On-disk dtypes of numeric and dictionary-encoded text columns
+NUMERIC_DTYPE = '<f8'
+CODE_DTYPE = '<i4'
+
+
+def _version_time(name: str) -> int:
+    """Creation time of a version directory name, -1 for other entries."""
+    try:
+        return int(name[1:].split('-')[0]) if name.startswith('v') else -1
+    except ValueError:
+        return -1
+
+
+class ColumnStore:
+    """
+    Read-only view of a table stored column-wise on disk.
+
+    Opening a store reads its metadata and memory-maps every column
+    without reading the column data, so it is fast regardless of the table
+    size, and the store stays readable after a writer replaces it.
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        for attempt in range(OPEN_RETRIES):
+            with open(os.path.join(store_dir, STORE_POINTER_FILE), 'r', encoding='utf-8') as f:
+                self.version = f.read().strip()
+            try:
+                self._open_version(os.path.join(store_dir, self.version))
+                break
+            except FileNotFoundError:
+                # Replaced and removed between reading CURRENT and mapping it
+                if attempt == OPEN_RETRIES - 1:
+                    raise
+
+    def _open_version(self, version_dir: str) -> None:
+        with open(os.path.join(version_dir, STORE_META_FILE), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+        if self.meta.get('version') != STORE_FORMAT_VERSION:
+            raise ValueError(f"❌ Unsupported column store version in {self.store_dir}")
+
+        self.table_name = self.meta.get('table', '')
+        self.n_rows = int(self.meta['n_rows'])
+        self._specs = {spec['name']: spec for spec in self.meta['columns']}
+        self._arrays: Dict[str, np.ndarray] = {}
+        for spec in self.meta['columns']:
+            if self.n_rows == 0:
+                array = np.empty(0, dtype=spec['dtype'])
+            else:
+                array = np.memmap(os.path.join(version_dir, spec['file']), dtype=spec['dtype'],
+                                  mode='r', shape=(self.n_rows,))
+            self._arrays[spec['name']] = array
+
+    @classmethod
+    def open(cls, store_dir: str) -> Optional['ColumnStore']:
+        """Open a store, or return None if it is missing or unreadable."""
+        try:
+            return cls(store_dir)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __repr__(self) -> str:
+        return f"ColumnStore({self.table_name!r}, rows={self.n_rows}, columns={self.columns})"
+
+    @property
+    def columns(self) -> List[str]:
+        return [spec['name'] for spec in self.meta['columns']]
+
+    def _raw(self, name: str) -> np.ndarray:
+        """Memory-mapped stored values of a column (codes for text columns)."""
+        if name not in self._specs:
+            raise KeyError(f"❌ Column '{name}' not in {self.table_name}. Available: {self.columns}")
+        return self._arrays[name]
+
+    def is_text(self, name: str) -> bool:
+        return 'categories' in self._specs[name]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Values of one column.
+
+        Numeric columns are returned as a read-only memory map (no copy);
+        text columns are decoded into an object array.
+        """
+        values = self._raw(name)
+        if not self.is_text(name):
+            return values
+
+        categories = np.array(self._specs[name]['categories'] + [None], dtype=object)
+        return categories[values]
+
+    def unique(self, name: str) -> np.ndarray:
+        """Sorted distinct non-missing values of a column."""
+        if self.is_text(name):
+            codes = np.unique(self._raw(name))
+            categories = self._specs[name]['categories']
+            return np.array(sorted(categories[c] for c in codes if c >= 0), dtype=object)
+
+        values = np.unique(self._raw(name))
+        return values[~np.isnan(values)]
+
+    def select(self, **equals) -> np.ndarray:
+        """
+        Row positions where every given column equals its value.
+
+        Leading columns of the store's sort order (meta 'sorted_by') are
+        matched by binary search; only the remaining columns are compared
+        row by row, within the block of rows that search leaves.
+
+        Example:
+            >>> rows = store.select(wha=1, T1=20, itdt=10, TCSapp=2)
+        """
+        for name in equals:
+            self._raw(name)
+
+        start, stop = 0, self.n_rows
+        remaining = dict(equals)
+        for name in self.meta.get('sorted_by', []):
+            if name not in remaining:
+                break
+            value = float(remaining.pop(name))
+            block = self._raw(name)[start:stop]
+            start, stop = (start + int(np.searchsorted(block, value, 'left')),
+                           start + int(np.searchsorted(block, value, 'right')))
+            if start == stop:
+                return np.empty(0, dtype=np.int64)
+
+        mask = np.ones(stop - start, dtype=bool)
+        for name, value in remaining.items():
+            raw = self._raw(name)[start:stop]
+            if self.is_text(name):
+                categories = self._specs[name]['categories']
+                if value not in categories:
+                    return np.empty(0, dtype=np.int64)
+                mask &= raw == categories.index(value)
+            else:
+                mask &= raw == float(value)
+        return start + np.flatnonzero(mask)
+
+    def to_frame(self, rows: Optional[Any] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Materialize selected rows and columns as a DataFrame.
+
+        Parameters:
+        rows: Row positions or boolean mask (default: all rows)
+        columns: Column names (default: all columns)
+        """
+        columns = list(columns) if columns is not None else self.columns
+        data = {}
+        for name in columns:
+            raw = self._raw(name)
+            values = np.asarray(raw if rows is None else raw[rows])
+            if self.is_text(name):
+                categories = np.array(self._specs[name]['categories'] + [None], dtype=object)
+                values = categories[values]
+            else:
+                values = np.array(values, dtype=float)
+            data[name] = values
+        return pd.DataFrame(data, columns=columns)
+
+    def iter_frames(self, columns: Optional[List[str]] = None, chunk_rows: int = READ_CHUNK_ROWS):
+        """
+        Materialize all rows as consecutive DataFrame chunks, so a full
+        pass over a large store holds only chunk_rows rows at a time.
+
+        Parameters:
+        columns: Column names (default: all columns)
+        chunk_rows: Rows per chunk
+        """
+        for start in range(0, self.n_rows, chunk_rows):
+            yield self.to_frame(slice(start, start + chunk_rows), columns)
+
+
+class ColumnStoreWriter:
+    """
+    Build a ColumnStore by appending DataFrame chunks.
+
+    The first chunk fixes the columns: numeric columns are stored as
+    float64, all others as dictionary-encoded text. The rows are written
+    to a new version directory that close() publishes by replacing the
+    store's CURRENT pointer, so readers never see a partial store.
+
+    Parameters:
+    store_dir (str): Store directory (created if missing)
+    table_name (str): Table name recorded in the metadata
+    sorted_by (list): Numeric columns the rows are appended in
+        lexicographic order of. close() verifies the order and records the
+        longest valid leading run as meta 'sorted_by' for select().
+    """
+
+    def __init__(self, store_dir: str, table_name: str = '', sorted_by: Optional[List[str]] = None):
+        self.store_dir = store_dir
+        self.table_name = table_name
+        self.sorted_by = list(sorted_by or [])
+        self.n_rows = 0
+        self.version = f"v{time.time_ns()}-{os.getpid()}"
+        self._temp_dir = os.path.join(store_dir, self.version + TEMP_SUFFIX)
+        self._specs: Optional[List[Dict[str, Any]]] = None
+        self._category_index: Dict[str, Dict[str, int]] = {}
+        self._files = {}
+
+        os.makedirs(self._temp_dir)
+
+    def _start(self, chunk: pd.DataFrame) -> None:
+        self._specs = []
+        for i, name in enumerate(chunk.columns):
+            spec = {'name': str(name), 'file': f'col{i}.bin'}
+            if pd.api.types.is_numeric_dtype(chunk[name]) and not pd.api.types.is_bool_dtype(chunk[name]):
+                spec['dtype'] = NUMERIC_DTYPE
+            else:
+                spec['dtype'] = CODE_DTYPE
+                spec['categories'] = []
+                self._category_index[spec['name']] = {}
+            self._specs.append(spec)
+            self._files[spec['name']] = open(os.path.join(self._temp_dir, spec['file']), 'wb')
+
+    def append(self, chunk: pd.DataFrame) -> None:
+        """Append the rows of one chunk (same columns as the first chunk)."""
+        if self._specs is None:
+            self._start(chunk)
+
+        for spec in self._specs:
+            series = chunk[spec['name']]
+            if 'categories' in spec:
+                index = self._category_index[spec['name']]
+                codes = np.full(len(series), -1, dtype=CODE_DTYPE)
+                present = series.notna().to_numpy()
+                chunk_codes, uniques = pd.factorize(series[present].astype(str))
+                for value in uniques:
+                    if value not in index:
+                        index[value] = len(spec['categories'])
+                        spec['categories'].append(value)
+                to_store = np.array([index[value] for value in uniques], dtype=CODE_DTYPE)
+                codes[present] = to_store[chunk_codes]
+                values = codes
+            else:
+                values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=NUMERIC_DTYPE)
+            self._files[spec['name']].write(values.tobytes())
+
+        self.n_rows += len(chunk)
+
+    def _sorted_prefix(self) -> List[str]:
+        """Leading run of sorted_by the written rows are actually ordered by."""
+        specs = {spec['name']: spec for spec in self._specs or []}
+        prefix = []
+        # Adjacent row pairs still tied on every column checked so far
+        tied = np.ones(max(self.n_rows - 1, 0), dtype=bool)
+        for name in self.sorted_by:
+            spec = specs.get(name)
+            if spec is None or 'categories' in spec:
+                break
+            if self.n_rows == 0:
+                prefix.append(name)
+                continue
+            values = np.fromfile(os.path.join(self._temp_dir, spec['file']), dtype=NUMERIC_DTYPE)
+            if np.isnan(values).any() or (tied & (values[1:] < values[:-1])).any():
+                break
+            prefix.append(name)
+            tied &= values[1:] == values[:-1]
+        return prefix
+
+    def close(self, extra_meta: Optional[Dict[str, Any]] = None) -> ColumnStore:
+        """Finish the store, publish it as the current version and open it for reading."""
+        for f in self._files.values():
+            f.close()
+
+        meta = {
+            'version': STORE_FORMAT_VERSION,
+            'table': self.table_name,
+            'n_rows': self.n_rows,
+            'columns': self._specs or [],
+        }
+        sorted_by = self._sorted_prefix()
+        if sorted_by:
+            meta['sorted_by'] = sorted_by
+        meta.update(extra_meta or {})
+        with open(os.path.join(self._temp_dir, STORE_META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+        os.replace(self._temp_dir, os.path.join(self.store_dir, self.version))
+        pointer_temp = os.path.join(self.store_dir, f"{STORE_POINTER_FILE}.{self.version}{TEMP_SUFFIX}")
+        with open(pointer_temp, 'w', encoding='utf-8') as f:
+            f.write(self.version)
+        os.replace(pointer_temp, os.path.join(self.store_dir, STORE_POINTER_FILE))
+
+        self._remove_old_versions()
+        return ColumnStore(self.store_dir)
+
+    def _remove_old_versions(self) -> None:
+        """
+        Delete older versions (and files of the old flat layout).
+
+        Stores already open keep their memory maps; where the platform
+        refuses to delete mapped files, the version is removed by a later
+        close(). Entries of writers still in progress are left alone.
+        """
+        for name in os.listdir(self.store_dir):
+            if name in (STORE_POINTER_FILE, self.version) or name.endswith(TEMP_SUFFIX):
+                continue
+            # A newer version belongs to a writer about to publish it
+            if _version_time(name) > _version_time(self.version):
+                continue
+            path = os.path.join(self.store_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def abort(self) -> None:
+        """Discard a partially written store."""
+        for f in self._files.values():
+            f.close()
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
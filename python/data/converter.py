@@ -8,10 +8,52 @@ and edge cases commonly found in CSV data.
 
 import re
 import math
+import logging
+from collections import Counter
+from functools import lru_cache
 import pandas as pd
 
+logger = logging.getLogger(__name__)
 
-def universal_float_convert(value):
+# Maximum number of distinct raw strings remembered by the conversion memo
+CONVERSION_CACHE_SIZE = 65536
+
+# Text tokens that convert to 0.0
+_SPECIAL_TOKENS = frozenset({
+    'nan', 'none', 'null', 'n/a', 'na', '#n/a', '#value!', '#ref!',
+    '#div/0!', '#num!', 'inf', '-inf', 'infinity', '-infinity',
+    'true', 'false', 'yes', 'no', 'error', 'err',
+    'nichts', 'nul', 'erreur', 'infinito', 'niets', 'ingen'
+})
+
+# Tokenizer character classes. The original currency pattern is a
+# character class, so the letters of CHF/USD/EUR/GBP (any case) and '|'
+# are removed along with the symbols, before whitespace is collapsed.
+_DIGITS = frozenset('0123456789')
+_DIGITS_AND_COMMA = _DIGITS | {','}
+_KEPT_CHARS = '0123456789.,+- '
+_SIMPLE_NUMBER = re.compile(r'([0-9]+)(?:([.,])([0-9]+))?')
+_GROUPED_NUMBER = re.compile(r'([0-9]{1,3})((?P<sep>[., ])[0-9]{3}(?:(?P=sep)[0-9]{3})*)(?:([.,])([0-9]+))?')
+_NON_DIGITS = re.compile(r'[^0-9]')
+_CURRENCY_SYMBOLS = '$€£¥₹₽¢₦₪₨₩₫₡₵₸₴₺₼'
+_PRE_COLLAPSE_REMOVED = re.compile(f'[%{_CURRENCY_SYMBOLS}CHFUSDERGBPchfusdergbp|()\\[\\]{{}}"\']')
+_POST_COLLAPSE_REMOVED = re.compile(r'[^0-9.,+\- ]')
+# Characters _PRE_COLLAPSE_REMOVED drops, plus spaces, as str.strip() chars
+_EDGE_REMOVED = f'%{_CURRENCY_SYMBOLS}CHFUSDERGBPchfusdergbp|()[]{{}}"\' '
+
+# (thousands separator, decimal separator) -> strategy, and thousands-only styles
+_DECIMAL_STYLES = {('.', ','): 'german', (' ', ','): 'french', (',', '.'): 'american'}
+_THOUSANDS_STYLES = {'.': 'german_thousands', ' ': 'french_thousands', ',': 'american_thousands'}
+
+# Strategies that resolve an ambiguous separator by heuristic
+AMBIGUOUS_STRATEGIES = {
+    'american_thousands', 'european_decimal', 'european_long_decimal', 'comma_thousands',
+    'european_thousands', 'american_decimal', 'standard_decimal', 'dot_decimal',
+    'european_mixed', 'american_mixed', 'digits_only', 'digits_fallback',
+}
+
+
+def universal_float_convert(value, use_cache=True, diagnostics=None):
     """
     European-priority universal number parser
     Handles both American and European CSV data formats correctly
@@ -19,8 +61,15 @@ def universal_float_convert(value):
     Properly detects American thousands separators (comma + exactly 3 digits)
     vs European decimal separators
     
+    String values are memoized in a bounded, thread-safe LRU cache keyed
+    by the raw string, since data files repeat the same cells constantly
+    (see conversion_cache_info).
+    
     Args:
         value: Input value to convert (string, number, or None)
+        use_cache: Look strings up in (and add them to) the memo
+        diagnostics: Optional ConversionDiagnostics recording how the
+                     value was interpreted
         
     Returns:
         float: Converted numeric value, or 0.0 if conversion fails
@@ -33,31 +82,333 @@ def universal_float_convert(value):
         >>> universal_float_convert("€1,375.2")  # Currency
         1375.2
     """
+    result, strategy = convert_with_strategy(value, use_cache)
+    if diagnostics is not None:
+        diagnostics.record(value, strategy, result)
+    return result
+
+
+def convert_with_strategy(value, use_cache=True):
+    """
+    Convert a value and report how it was interpreted.
+    
+    Returns:
+        tuple: (float result, strategy name), e.g. (1493.0, 'american_thousands')
+    """
+    if isinstance(value, str):
+        return _convert_string(str(value)) if use_cache else _convert_value(value)
+    return _convert_value(value)
+
+
+class ConversionDiagnostics:
+    """
+    Summary of the interpretations chosen while converting one column:
+    value counts per strategy and a few sample conversions of each.
+    
+    Recording does no I/O; call log() to emit the summary at debug level.
+    """
+    
+    def __init__(self, name='', max_samples=3):
+        self.name = name
+        self.max_samples = max_samples
+        self.counts = Counter()
+        self.samples = {}
+    
+    def record(self, value, strategy, result, count=1):
+        """Record that `count` cells holding `value` were converted with `strategy`."""
+        self.counts[strategy] += count
+        samples = self.samples.setdefault(strategy, [])
+        if len(samples) < self.max_samples:
+            samples.append((value, result))
+    
+    @property
+    def ambiguous(self):
+        """Number of values resolved by a separator heuristic."""
+        return sum(n for strategy, n in self.counts.items() if strategy in AMBIGUOUS_STRATEGIES)
+    
+    def summary(self):
+        """Counts and samples per strategy, most frequent first."""
+        return {strategy: {'count': n, 'samples': self.samples.get(strategy, [])}
+                for strategy, n in self.counts.most_common()}
+    
+    def log(self, level=logging.DEBUG):
+        """Log the summary (debug level by default)."""
+        if logger.isEnabledFor(level):
+            logger.log(level, "Conversion of %s: %s", self.name or 'values', self.summary())
+    
+    def __repr__(self):
+        return f"ConversionDiagnostics({self.name!r}, {dict(self.counts)})"
+
+
+def conversion_cache_info():
+    """
+    Hit/miss statistics of the conversion memo.
+    
+    Returns:
+        dict: hits, misses, size (entries held) and maxsize
+    """
+    info = _convert_string.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+
+
+def clear_conversion_cache():
+    """Empty the conversion memo and reset its statistics."""
+    _convert_string.cache_clear()
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _convert_string(value):
+    """Memoized (result, strategy) for one raw string (see convert_with_strategy)."""
+    return _convert_value(value)
+
+
+def _convert_value(value):
+    """Uncached (result, strategy) conversion of any value (see convert_with_strategy)."""
+    if isinstance(value, str):
+        return _parse_number_string(value.strip())
+    
     # Handle None, NaN, and empty values
     if value is None:
-        return 0.0
+        return 0.0, 'missing'
     
     try:
         if pd.isna(value):
-            return 0.0
+            return 0.0, 'missing'
     except (TypeError, ValueError):
         pass
     
     # Handle numeric types that are already numbers
     if isinstance(value, (int, float)):
         if math.isnan(value) or math.isinf(value):
-            return 0.0
-        return float(value)
+            return 0.0, 'non_finite'
+        return float(value), 'number'
+    
+    try:
+        str_val = str(value).strip()
+    except (UnicodeError, AttributeError):
+        return 0.0, 'invalid'
+    return _parse_number_string(str_val)
+
+
+def _parse_number_string(str_val):
+    """
+    Single-pass number parser for a stripped string.
+    
+    Plain numeric text goes straight to the tokenizer, as does plain
+    numeric text between currency, percent or unit marks once they are
+    stripped; other text is cleaned with two compiled substitutions and a
+    whitespace collapse first. _interpret_number then classifies the separators in one scan.
+    Gives the same results and strategies as the original regex cascade
+    (_convert_value_regex), which still handles text with non-ASCII
+    characters other than currency symbols.
+    """
+    if not str_val:
+        return 0.0, 'missing'
+    
+    if str_val.isascii():
+        if str_val.isdigit():
+            result = float(str_val)
+            return (0.0, 'non_finite') if math.isinf(result) else (result, 'integer')
+        plain = not str_val.strip(_KEPT_CHARS)
+    else:
+        plain = False
+    core = '' if plain else str_val.strip(_EDGE_REMOVED)
+    
+    if plain:
+        # Only digits, separators and signs: no token, exponent, percent
+        # or symbol to handle
+        is_percentage = False
+        cleaned = ' '.join(str_val.split()) if '  ' in str_val else str_val
+    elif core and not core.strip(_KEPT_CHARS):
+        # Plain number text between currency, percent or unit marks, which
+        # the substitutions below would only remove: no token or exponent
+        is_percentage = '%' in str_val
+        cleaned = ' '.join(core.split()) if '  ' in core else core
+    else:
+        # Currency symbols are the only non-ASCII text handled here
+        removed = _PRE_COLLAPSE_REMOVED.sub('', str_val)
+        if not removed.isascii():
+            return _convert_value_regex(str_val)
+        
+        if str_val.lower() in _SPECIAL_TOKENS:
+            return 0.0, 'special_token'
+        
+        if 'e' in str_val or 'E' in str_val:
+            scientific = _scientific_value(str_val)
+            if scientific is not None:
+                return scientific, 'scientific'
+        
+        is_percentage = '%' in str_val
+        
+        # Drop symbols and currency letters, collapse whitespace, then keep
+        # only digits, separators and signs (the order matters for spaces)
+        cleaned = ' '.join(removed.split())
+        cleaned = _POST_COLLAPSE_REMOVED.sub('', cleaned).strip()
+    if not cleaned:
+        return 0.0, 'invalid'
+    
+    is_negative = False
+    if cleaned[0] == '-':
+        is_negative = True
+        cleaned = cleaned[1:].strip()
+    elif cleaned[0] == '+':
+        cleaned = cleaned[1:].strip()
+    
+    if not cleaned:
+        return 0.0, 'invalid'
+    
+    try:
+        result, strategy = _interpret_number(cleaned)
+    except (ValueError, OverflowError):
+        # Final fallback: every digit of the original text
+        digits = _NON_DIGITS.sub('', str_val)
+        if not digits:
+            return 0.0, 'invalid'
+        fallback = float(digits)
+        if is_negative:
+            fallback = -fallback
+        if is_percentage:
+            fallback = fallback / 100.0
+        return fallback, 'digits_fallback'
+    
+    if result is None:
+        return 0.0, 'invalid'
+    if is_negative:
+        result = -result
+    if is_percentage:
+        result = result / 100.0
+    if math.isnan(result) or math.isinf(result):
+        return 0.0, 'non_finite'
+    return result, strategy
+
+
+def _scientific_value(str_val):
+    """Value of scientific notation like 1.5e3 or 1,5e3, or None if not scientific."""
+    body = str_val[1:] if str_val.startswith('-') else str_val
+    if body.count('e') + body.count('E') != 1:
+        return None
+    
+    mantissa, _, exponent = body.replace('E', 'e').partition('e')
+    if exponent[:1] in ('+', '-'):
+        exponent = exponent[1:]
+    if not exponent or any(ch not in _DIGITS for ch in exponent):
+        return None
+    
+    integer, _, fraction = mantissa.partition('.')
+    if not integer or any(ch not in _DIGITS_AND_COMMA for ch in integer):
+        return None
+    if any(ch not in _DIGITS for ch in fraction):
+        return None
+    
+    try:
+        return float(str_val.replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def _interpret_number(text):
+    """
+    Interpret unsigned text made of digits, '.', ',', ' ', '+' and '-'.
+    
+    A compiled pattern tokenizes the text in one scan into a leading
+    digit group, thousands groups with their separator, and a decimal
+    part; the interpretation follows from the separators and the group
+    lengths. Text that does not tokenize as a grouped number falls back
+    to the mixed-separator and digits-only readings.
+    
+    Returns:
+        tuple: (float or None if there are no digits, strategy name)
+    """
+    simple = _SIMPLE_NUMBER.fullmatch(text)
+    if simple:
+        integer_part, separator, fractional_part = simple.groups()
+        if separator is None:
+            return float(text), 'integer'
+        if len(integer_part) <= 3 and len(fractional_part) == 3:
+            return float(integer_part + fractional_part), _THOUSANDS_STYLES[separator]
+        return _single_separator_value(integer_part, separator, fractional_part)
+    
+    grouped = _GROUPED_NUMBER.fullmatch(text)
+    if grouped:
+        head, thousands_groups, thousands, decimal, fraction = grouped.groups()
+        integer_part = head + thousands_groups.replace(thousands, '')
+        if decimal is None:
+            # Thousands groups only: 1.234.567 / 1 234 567 / 1,234,567
+            return float(integer_part), _THOUSANDS_STYLES[thousands]
+        if (thousands, decimal) in _DECIMAL_STYLES:
+            # Thousands groups and a decimal part: 1.234,5 / 1 234,5 / 1,234.5
+            return float(integer_part + '.' + fraction), _DECIMAL_STYLES[(thousands, decimal)]
+    
+    # Mixed separators: the last one is the decimal separator
+    if '.' in text and ',' in text:
+        last_dot = text.rfind('.')
+        last_comma = text.rfind(',')
+        last_sep, strategy = (last_comma, 'european_mixed') if last_comma > last_dot else (last_dot, 'american_mixed')
+        before = text[:last_sep].replace('.', '').replace(',', '').replace(' ', '').replace('\'', '')
+        after = text[last_sep + 1:]
+        return float(f"{before}.{after}"), strategy
+    
+    # Fallback: just the digits
+    digits = _NON_DIGITS.sub('', text)
+    if not digits:
+        return None, 'invalid'
+    return float(digits), 'digits_only'
+
+
+def _single_separator_value(integer_part, separator, fractional_part):
+    """Thousands or decimal reading of digits with one '.' or ',' by group lengths."""
+    if separator == ',':
+        if len(fractional_part) == 3 and len(integer_part) <= 4:
+            return float(integer_part + fractional_part), 'american_thousands'
+        if len(fractional_part) <= 2:
+            return float(integer_part + '.' + fractional_part), 'european_decimal'
+        if len(fractional_part) > 3:
+            return float(integer_part + '.' + fractional_part), 'european_long_decimal'
+        return float(integer_part + fractional_part), 'comma_thousands'
+    
+    text = integer_part + '.' + fractional_part
+    if len(fractional_part) == 3 and len(integer_part) >= 2:
+        if len(integer_part) >= 4:
+            return float(integer_part + fractional_part), 'european_thousands'
+        return float(text), 'american_decimal'
+    if len(fractional_part) <= 2:
+        return float(text), 'standard_decimal'
+    return float(text), 'dot_decimal'
+
+
+def _convert_value_regex(value):
+    """
+    Reference implementation: the original regex cascade.
+    
+    Kept as the specification for the single-pass parser (test_converter
+    compares both on a fuzz corpus) and used for text with non-ASCII
+    characters other than currency symbols.
+    """
+    # Handle None, NaN, and empty values
+    if value is None:
+        return 0.0, 'missing'
+    
+    try:
+        if pd.isna(value):
+            return 0.0, 'missing'
+    except (TypeError, ValueError):
+        pass
+    
+    # Handle numeric types that are already numbers
+    if isinstance(value, (int, float)):
+        if math.isnan(value) or math.isinf(value):
+            return 0.0, 'non_finite'
+        return float(value), 'number'
     
     # Convert to string and clean
     try:
         str_val = str(value).strip()
     except (UnicodeError, AttributeError):
-        return 0.0
+        return 0.0, 'invalid'
     
     # Handle empty string
     if not str_val:
-        return 0.0
+        return 0.0, 'missing'
     
     # Handle special text cases
     special_cases = {
@@ -67,7 +418,7 @@ def universal_float_convert(value):
         'nichts', 'nul', 'erreur', 'infinito', 'niets', 'ingen'
     }
     if str_val.lower() in special_cases:
-        return 0.0
+        return 0.0, 'special_token'
     
     # Store original
     original_str = str_val
@@ -80,7 +431,7 @@ def universal_float_convert(value):
         if re.match(pattern, str_val):
             try:
                 sci_val = str_val.replace(',', '.')
-                return float(sci_val)
+                return float(sci_val), 'scientific'
             except (ValueError, OverflowError):
                 continue
     
@@ -109,7 +460,7 @@ def universal_float_convert(value):
     str_val = re.sub(r'[^\d.,\s+\-\']', '', str_val).strip()
     
     if not str_val:
-        return 0.0
+        return 0.0, 'invalid'
     
     # Handle sign
     is_negative = False
@@ -120,49 +471,59 @@ def universal_float_convert(value):
         str_val = str_val[1:].strip()
     
     if not str_val:
-        return 0.0
+        return 0.0, 'invalid'
     
     try:
         result = None
+        strategy = None
         
         # STRATEGY 1: Simple cases (no ambiguity)
         if re.match(r'^\d+$', str_val):
             # Pure integer: 123
             result = float(str_val)
+            strategy = 'integer'
             
         # STRATEGY 2: Clear multi-separator patterns (unambiguous)
         elif re.match(r'^\d{1,3}(\.\d{3})+,\d+$', str_val):
             # German: 1.234.567,89 (dots=thousands, comma=decimal)
             result = float(str_val.replace('.', '').replace(',', '.'))
+            strategy = 'german'
             
         elif re.match(r'^\d{1,3}(\s\d{3})+,\d+$', str_val):
             # French: 1 234 567,89 (spaces=thousands, comma=decimal)
             result = float(str_val.replace(' ', '').replace(',', '.'))
+            strategy = 'french'
             
         elif re.match(r'^\d{1,3}(\'\d{3})+\.\d+$', str_val):
             # Swiss: 1'234'567.89 (apostrophes=thousands, dot=decimal)
             result = float(str_val.replace('\'', ''))
+            strategy = 'swiss'
             
         elif re.match(r'^\d{1,3}(,\d{3})+\.\d+$', str_val):
             # American with decimal: 1,234,567.89 (commas=thousands, dot=decimal)
             result = float(str_val.replace(',', ''))
+            strategy = 'american'
             
         # STRATEGY 3: Thousands-only patterns (no decimal part)
         elif re.match(r'^\d{1,3}(\.\d{3})+$', str_val):
             # German thousands: 1.234.567
             result = float(str_val.replace('.', ''))
+            strategy = 'german_thousands'
             
         elif re.match(r'^\d{1,3}(\s\d{3})+$', str_val):
             # French thousands: 1 234 567
             result = float(str_val.replace(' ', ''))
+            strategy = 'french_thousands'
             
         elif re.match(r'^\d{1,3}(\'\d{3})+$', str_val):
             # Swiss thousands: 1'234'567
             result = float(str_val.replace('\'', ''))
+            strategy = 'swiss_thousands'
             
         elif re.match(r'^\d{1,3}(,\d{3})+$', str_val):
             # American thousands: 1,234,567 OR single group like 1,493
             result = float(str_val.replace(',', ''))
+            strategy = 'american_thousands'
             
         # STRATEGY 4: Single separator - IMPROVED LOGIC
         elif re.match(r'^\d+[.,]\d+$', str_val):
@@ -177,18 +538,19 @@ def universal_float_convert(value):
                     # AMERICAN THOUSANDS: 1,493 or 12,345 (comma + exactly 3 digits)
                     # This is definitely a thousands separator, not decimal
                     result = float(integer_part + fractional_part)
-                    print(f"🔍 Detected American thousands: {str_val} → {result}")
+                    strategy = 'american_thousands'
                 elif len(fractional_part) <= 2:
                     # European decimal: 1,5 or 123,45 (comma + 1-2 digits)
                     result = float(integer_part + '.' + fractional_part)
-                    print(f"🔍 Detected European decimal: {str_val} → {result}")
+                    strategy = 'european_decimal'
                 elif len(fractional_part) > 3:
                     # 4+ digits after comma: definitely decimal (European style)
                     result = float(integer_part + '.' + fractional_part)
-                    print(f"🔍 Detected European long decimal: {str_val} → {result}")
+                    strategy = 'european_long_decimal'
                 else:
                     # Fallback for edge cases
                     result = float(integer_part + fractional_part)  # Treat as thousands
+                    strategy = 'comma_thousands'
                     
             else:  # '.' in str_val
                 parts = str_val.split('.')
@@ -203,18 +565,19 @@ def universal_float_convert(value):
                     if len(integer_part) >= 4:
                         # Likely European thousands: 1234.567 → 1234567
                         result = float(integer_part + fractional_part)
-                        print(f"🔍 Detected European thousands: {str_val} → {result}")
+                        strategy = 'european_thousands'
                     else:
                         # Likely American decimal: 12.345
                         result = float(str_val)
-                        print(f"🔍 Detected American decimal: {str_val} → {result}")
+                        strategy = 'american_decimal'
                 elif len(fractional_part) <= 2:
                     # Standard decimal: 12.34
                     result = float(str_val)
-                    print(f"🔍 Detected standard decimal: {str_val} → {result}")
+                    strategy = 'standard_decimal'
                 else:
                     # Default to decimal for unclear cases
                     result = float(str_val)
+                    strategy = 'dot_decimal'
         
         # STRATEGY 5: Mixed separators (both . and ,)
         elif '.' in str_val and ',' in str_val:
@@ -226,13 +589,13 @@ def universal_float_convert(value):
                 before = str_val[:last_comma].replace('.', '').replace(',', '').replace(' ', '').replace('\'', '')
                 after = str_val[last_comma + 1:]
                 result = float(f"{before}.{after}")
-                print(f"🔍 Detected European mixed format: {str_val} → {result}")
+                strategy = 'european_mixed'
             else:
                 # Dot is last = decimal separator (American)
                 before = str_val[:last_dot].replace('.', '').replace(',', '').replace(' ', '').replace('\'', '')
                 after = str_val[last_dot + 1:]
                 result = float(f"{before}.{after}")
-                print(f"🔍 Detected American mixed format: {str_val} → {result}")
+                strategy = 'american_mixed'
         
         # STRATEGY 6: Fallback
         else:
@@ -240,9 +603,9 @@ def universal_float_convert(value):
             digits_only = re.sub(r'[^\d]', '', str_val)
             if digits_only:
                 result = float(digits_only)
-                print(f"🔍 Fallback digits only: {str_val} → {result}")
+                strategy = 'digits_only'
             else:
-                return 0.0
+                return 0.0, 'invalid'
         
         # Apply transformations
         if is_negative and result is not None:
@@ -253,9 +616,9 @@ def universal_float_convert(value):
         
         # Validate result
         if result is None or math.isnan(result) or math.isinf(result):
-            return 0.0
+            return 0.0, 'non_finite'
             
-        return result
+        return result, strategy
         
     except (ValueError, TypeError, OverflowError):
         # Final fallback
@@ -267,11 +630,11 @@ def universal_float_convert(value):
                     fallback = -fallback
                 if is_percentage:
                     fallback = fallback / 100.0
-                return fallback
+                return fallback, 'digits_fallback'
             else:
-                return 0.0
+                return 0.0, 'invalid'
         except:
-            return 0.0
+            return 0.0, 'invalid'
 
 # Test function for validation
 def test_converter():
@@ -290,6 +653,50 @@ def test_converter():
         result = universal_float_convert(input_val)
         status = "✅" if result == expected else "❌"
         print(f"  {status} {input_val!r} → {result} (expected {expected}) - {description}")
+    
+    # The memo must return exactly what an uncached conversion returns
+    cached = [universal_float_convert(v) for v, _, _ in test_cases]
+    uncached = [universal_float_convert(v, use_cache=False) for v, _, _ in test_cases]
+    status = "✅" if cached == uncached else "❌"
+    print(f"  {status} Memoized results match uncached ({conversion_cache_info()})")
+    
+    # The single-pass parser must agree with the regex reference
+    corpus = [v for v, _, _ in test_cases] + fuzz_corpus()
+    mismatches = [v for v in corpus if not _same_conversion(_convert_value(v), _convert_value_regex(v))]
+    status = "✅" if not mismatches else "❌"
+    print(f"  {status} Single-pass parser matches regex reference on {len(corpus)} values"
+          + (f" (mismatches: {mismatches[:5]!r})" if mismatches else ""))
+
+
+def fuzz_corpus(size=20000, seed=0):
+    """
+    Random number-like strings for comparing parser implementations:
+    formatted numbers in every separator style, and free-form text mixing
+    digits, separators, signs, currency, percent, letters and quotes.
+    """
+    import random
+    rng = random.Random(seed)
+    alphabet = (['0', '1', '2', '3', '5', '7', '9'] * 4 + ['.', ',', ' '] * 3
+                + ['+', '-', '%', '$', '€', '£', 'e', 'E', 'a', 'c', 'x', "'", '(', ')', '"', '\t', '#', '/', 'é'])
+    styles = [(',', '.'), ('.', ','), (' ', ','), ("'", '.'), ('', '.'), ('', ','),
+              (',', ','), ('.', '.'), (' ', '.'), ('  ', ',')]
+    
+    corpus = []
+    for _ in range(size // 2):
+        thousands, decimal = rng.choice(styles)
+        integer = f"{rng.randrange(10 ** rng.randint(1, 9)):,}".replace(',', thousands)
+        text = integer + (decimal + str(rng.randrange(10 ** rng.randint(1, 4))) if rng.random() < 0.6 else '')
+        text = rng.choice(['', '-', '+', '$', '€ ', ' ']) + text + rng.choice(['', '%', ' €', ' EUR', 'e3', ' '])
+        corpus.append(text)
+    for _ in range(size - size // 2):
+        corpus.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))))
+    return corpus
+
+
+def _same_conversion(a, b):
+    """Equal (result, strategy) pairs, treating NaN results as equal."""
+    (x, xs), (y, ys) = a, b
+    return xs == ys and (x == y or (x != x and y != y))
 
 if __name__ == "__main__":
     test_converter()
\ No newline at end of file
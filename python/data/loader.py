@@ -1,55 +1,542 @@
 """
 CSV Data Loading and Management
 
-This module handles loading and accessing CSV data files.
+This module handles loading and accessing CSV data files and Excel workbooks.
 The csv_data dictionary is the central repository for all CSV files.
 """
 
+import numpy as np
 import pandas as pd
 import os
-from typing import Dict, Optional, Any
-from .converter import universal_float_convert
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, Tuple, Callable, List, Set
+from .converter import ConversionDiagnostics
+from .snapshot import load_with_snapshot, file_fingerprint, SNAPSHOT_DIR_NAME
+from .columnar import ColumnStore, ColumnStoreWriter
+from .schema import apply_schema, get_read_options, get_table_schema, schema_signature
 
 # Global CSV data storage - accessible from all modules
 csv_data: Dict[str, pd.DataFrame] = {}
 
-def load_csv_files(data_dir: str = "Data") -> Dict[str, pd.DataFrame]:
+# Tables found on disk but not parsed yet: name -> (file path, use snapshots).
+# get_csv_data parses them on first access.
+_pending_tables: Dict[str, Tuple[str, bool]] = {}
+_load_lock = threading.RLock()
+
+# Loaded data files: path -> (fingerprint, table names), used to detect
+# and re-ingest changed files (see reload_changed_files)
+_loaded_files: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
+_load_options: Dict[str, Any] = {}
+
+# Number interpretations per table and column, recorded when a file is
+# parsed (see get_conversion_diagnostics); parsed but not yet stored
+# tables wait in _parsed_diagnostics keyed by source file
+_conversion_diagnostics: Dict[str, Dict[str, ConversionDiagnostics]] = {}
+_parsed_diagnostics: Dict[str, Dict[str, Dict[str, ConversionDiagnostics]]] = {}
+
+# Callbacks notified with the names of re-ingested tables (see register_reload_hook)
+_reload_hooks: List[Callable[[Set[str]], None]] = []
+_watcher = None
+
+# Candidate CSV separators, sniffed once from the first line of each file
+CSV_SEPARATORS = [',', ';', '\t']
+
+# CSV files at least this large are streamed in chunks into an on-disk
+# column store (see data.columnar) instead of being held in memory
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+STREAMING_CHUNK_ROWS = 100_000
+
+# Tables kept on disk: name -> ColumnStore (see get_column_store)
+_column_stores: Dict[str, ColumnStore] = {}
+
+# Workbooks whose file name contains this are read as the data dictionary
+DATA_DICTIONARY_PATTERN = 'DATA_DICTIONARY'
+DATA_DICTIONARY_TABLE = 'DATA_DICTIONARY'
+
+# Data dictionary columns (header row located by 'Variable Name')
+DATA_DICTIONARY_COLUMNS = {
+    'Data Point Name': 'name',
+    'Data Point Description': 'description',
+    'Variable Name': 'variable',
+    'Data Type': 'data_type',
+    'Units': 'units',
+}
+
+def table_name_for_file(file_name: str) -> str:
+    """Normalized table name for a data file (without extension, uppercase)."""
+    return os.path.splitext(os.path.basename(file_name))[0].upper()
+
+def sniff_separator(file_path: str) -> str:
     """
-    Load all CSV files from the specified directory.
+    Pick the CSV separator from the first line of a file.
+    
+    Returns the candidate in CSV_SEPARATORS that occurs most often in the
+    first line, or ',' if none occurs.
+    """
+    with open(file_path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        first_line = f.readline()
+    
+    counts = {sep: first_line.count(sep) for sep in CSV_SEPARATORS}
+    best = max(CSV_SEPARATORS, key=lambda sep: counts[sep])
+    return best if counts[best] > 0 else ','
+
+def _record_diagnostics(file_path: str, table_name: str, diagnostics: Dict[str, ConversionDiagnostics]) -> None:
+    """Keep the conversion diagnostics of a parsed table and log them at debug level."""
+    _parsed_diagnostics.setdefault(file_path, {})[table_name] = diagnostics
+    for column_diagnostics in diagnostics.values():
+        if column_diagnostics.counts:
+            column_diagnostics.log()
+
+def _register_diagnostics(file_path: str, table_names) -> None:
+    """Publish the diagnostics of tables stored from a file (none if read from a snapshot)."""
+    parsed = _parsed_diagnostics.pop(file_path, {})
+    for name in table_names:
+        if name in parsed:
+            _conversion_diagnostics[name] = parsed[name]
+        else:
+            _conversion_diagnostics.pop(name, None)
+
+def get_conversion_diagnostics(csv_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    How numbers were interpreted when tables were parsed.
+    
+    Diagnostics are recorded when a file is actually parsed; tables served
+    from a snapshot were not converted in this session (reload with
+    use_snapshots=False to collect them).
     
     Parameters:
-    data_dir (str): Path to the directory containing CSV files
+    csv_name (str): Table name, or None for every parsed table
     
     Returns:
-    dict: Dictionary of dataframes with normalized names as keys
+    dict: column -> {strategy: {'count', 'samples'}} for one table, or
+    table -> that mapping for all tables
+    """
+    if csv_name is not None:
+        diagnostics = _conversion_diagnostics.get(csv_name.upper(), {})
+        return {column: d.summary() for column, d in diagnostics.items()}
+    return {name: {column: d.summary() for column, d in diagnostics.items()}
+            for name, diagnostics in _conversion_diagnostics.items()}
+
+def _read_csv_file(file_path: str) -> Dict[str, pd.DataFrame]:
+    """
+    Parse one CSV file with its sniffed separator and apply the table's
+    schema (see data.schema).
+    """
+    df_name = table_name_for_file(file_path)
+    df = pd.read_csv(file_path, sep=sniff_separator(file_path), **get_read_options(df_name))
+    
+    diagnostics = {}
+    table = apply_schema(df_name, df, diagnostics)
+    _record_diagnostics(file_path, df_name, diagnostics)
+    return {df_name: table}
+
+def column_store_path(file_path: str) -> str:
+    """Location of the column store for a large source CSV file."""
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, SNAPSHOT_DIR_NAME, name + '.columns')
+
+def ingest_csv_streaming(file_path: str, store_dir: Optional[str] = None,
+                         chunksize: int = STREAMING_CHUNK_ROWS, use_existing: bool = True,
+                         fingerprint: Optional[Tuple[int, int]] = None) -> ColumnStore:
+    """
+    Stream a CSV file in chunks into an on-disk column store.
+    
+    Each chunk is typed and filtered with the table's schema and appended
+    to the column files, so memory use is bounded by the chunk size rather
+    than the file size. An existing store built from the same file version
+    and schema is reused.
+    
+    Parameters:
+    file_path (str): Source CSV file
+    store_dir (str): Store directory (default: column_store_path(file_path))
+    chunksize (int): Rows per chunk
+    use_existing (bool): Reuse a current store instead of re-ingesting
+    fingerprint (tuple): Version of the file, taken before reading it
+                         (default: taken here)
+    
+    Returns:
+    ColumnStore: Read-only store of the typed table
+    """
+    df_name = table_name_for_file(file_path)
+    store_dir = store_dir or column_store_path(file_path)
+    fingerprint = fingerprint or file_fingerprint(file_path)
+    source = {'fingerprint': list(fingerprint), 'signature': schema_signature()}
+    
+    if use_existing:
+        store = ColumnStore.open(store_dir)
+        if store is not None and store.meta.get('source') == source:
+            return store
+    
+    # The writer verifies the schema's row order and records the valid
+    # leading run, which select() then matches by binary search
+    os.makedirs(os.path.dirname(store_dir), exist_ok=True)
+    writer = ColumnStoreWriter(store_dir, df_name, sorted_by=(get_table_schema(df_name) or {}).get('sorted_by'))
+    try:
+        chunks = pd.read_csv(file_path, sep=sniff_separator(file_path), chunksize=chunksize,
+                             **get_read_options(df_name))
+        diagnostics = {}
+        for chunk in chunks:
+            writer.append(apply_schema(df_name, chunk, diagnostics))
+    except Exception:
+        writer.abort()
+        raise
+    _record_diagnostics(file_path, df_name, diagnostics)
+    return writer.close({'source': source})
+
+def _load_csv_file(file_path: str, use_snapshots: bool,
+                   fingerprint: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    Load one CSV file: into frozen in-memory tables (through the snapshot
+    store), or into a column store if it exceeds STREAMING_THRESHOLD_BYTES.
+    The snapshot or store records fingerprint, the file version taken
+    before reading (default: taken here).
+    """
+    fingerprint = fingerprint or file_fingerprint(file_path)
+    if fingerprint[0] >= STREAMING_THRESHOLD_BYTES:
+        return {table_name_for_file(file_path): ingest_csv_streaming(file_path, use_existing=use_snapshots,
+                                                                     fingerprint=fingerprint)}
+    
+    tables = load_with_snapshot(file_path, _read_csv_file, use_snapshots, schema_signature(), fingerprint)
+    return {name: freeze_table(df) for name, df in tables.items()}
+
+def _store_tables(tables: Dict[str, Any], file_path: str) -> None:
+    """Register tables loaded from a file in csv_data, or as column stores."""
+    _register_diagnostics(file_path, tables)
+    for name, table in tables.items():
+        if isinstance(table, ColumnStore):
+            _column_stores[name] = table
+            csv_data.pop(name, None)
+        else:
+            csv_data[name] = table
+            _column_stores.pop(name, None)
+
+def _drop_table(name: str) -> None:
+    """Forget a table however it is held (loaded, pending or on disk)."""
+    csv_data.pop(name, None)
+    _pending_tables.pop(name, None)
+    _column_stores.pop(name, None)
+
+def _load_pending_table(csv_name: str) -> None:
+    """Parse a lazily registered table on first access (thread-safe)."""
+    with _load_lock:
+        if csv_name not in _pending_tables:
+            return
+        file_path, use_snapshots = _pending_tables[csv_name]
+        try:
+            _store_tables(_load_csv_file(file_path, use_snapshots), file_path)
+        except Exception as e:
+            print(f"❌ Failed to load {os.path.basename(file_path)}: {e}")
+        finally:
+            _pending_tables.pop(csv_name, None)
+
+def _read_excel_file(file_path: str) -> Dict[str, pd.DataFrame]:
+    """
+    Parse every sheet of a workbook.
+    
+    A single-sheet workbook becomes one table named after the file;
+    otherwise each sheet becomes FILE_SHEET. Fully empty rows and
+    unnamed empty columns are dropped, columns are mapped to dictionary
+    variable names and the table's schema is applied.
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0].upper()
+    sheets = pd.read_excel(file_path, sheet_name=None)
+    
+    tables = {}
+    for sheet_name, df in sheets.items():
+        df = df.dropna(how='all')
+        unnamed_empty = [c for c in df.columns if str(c).startswith('Unnamed') and df[c].isna().all()]
+        df = df.drop(columns=unnamed_empty).reset_index(drop=True)
+        
+        if df.empty:
+            continue
+        name = stem if len(sheets) == 1 else f"{stem}_{str(sheet_name).strip().upper().replace(' ', '_')}"
+        diagnostics = {}
+        tables[name] = apply_schema(name, map_columns_to_variables(df), diagnostics)
+        _record_diagnostics(file_path, name, diagnostics)
+    return tables
+
+def _read_data_dictionary(file_path: str) -> Dict[str, pd.DataFrame]:
+    """
+    Parse a data dictionary workbook into one variable table.
+    
+    Every sheet with a 'Variable Name' header row contributes its
+    variables; the first definition of a variable wins.
+    """
+    sheets = pd.read_excel(file_path, sheet_name=None, header=None)
+    
+    entries = []
+    for df in sheets.values():
+        df = df.dropna(how='all')
+        header_rows = df.index[(df == 'Variable Name').any(axis=1)]
+        if len(header_rows) == 0:
+            continue
+        
+        header = df.loc[header_rows[0]].astype(str).str.strip()
+        body = df.loc[header_rows[0] + 1:]
+        body.columns = header
+        body = body[[c for c in DATA_DICTIONARY_COLUMNS if c in body.columns]]
+        entries.append(body.rename(columns=DATA_DICTIONARY_COLUMNS))
+    
+    if not entries:
+        return {}
+    
+    dictionary = pd.concat(entries, ignore_index=True)
+    dictionary = dictionary[dictionary['variable'].notna()]
+    dictionary['variable'] = dictionary['variable'].astype(str).str.strip()
+    dictionary = dictionary.drop_duplicates(subset='variable', keep='first').reset_index(drop=True)
+    return {DATA_DICTIONARY_TABLE: dictionary}
+
+class FrozenTable(pd.DataFrame):
+    """
+    Read-only DataFrame shared by all consumers of a loaded table.
+    
+    Column arrays are write-protected, so in-place value writes
+    (df.loc[...] = ..., .values[...] = ...) raise ValueError, and
+    structural changes (adding, replacing or deleting columns, inplace=True
+    methods, reassigning index/columns) raise TypeError. Everything derived
+    from a frozen table - filters, selections, copies, arithmetic - is a
+    plain, mutable DataFrame.
+    """
+    
+    _READ_ONLY_MESSAGE = "❌ Loaded tables are read-only; derive a new frame instead (e.g. df.assign(...) or df.copy())"
+    
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+    
+    def __setitem__(self, key, value):
+        raise TypeError(self._READ_ONLY_MESSAGE)
+    
+    def __delitem__(self, key):
+        raise TypeError(self._READ_ONLY_MESSAGE)
+    
+    def __setattr__(self, name, value):
+        if name in ('columns', 'index') or name in getattr(self, 'columns', ()):
+            raise TypeError(self._READ_ONLY_MESSAGE)
+        super().__setattr__(name, value)
+    
+    def insert(self, *args, **kwargs):
+        raise TypeError(self._READ_ONLY_MESSAGE)
+    
+    def pop(self, *args, **kwargs):
+        raise TypeError(self._READ_ONLY_MESSAGE)
+    
+    def update(self, *args, **kwargs):
+        raise TypeError(self._READ_ONLY_MESSAGE)
+    
+    def _update_inplace(self, *args, **kwargs):
+        raise TypeError(self._READ_ONLY_MESSAGE)
+
+def freeze_table(df: pd.DataFrame) -> FrozenTable:
+    """
+    Rebuild a table as a FrozenTable on write-protected column arrays.
+    
+    Numeric columns keep their dtype and text columns are stored on object arrays.
+    Other extension dtypes (e.g. categorical) are kept as they are.
+    """
+    columns = {}
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufcmM':
+            values = np.array(series.to_numpy(), copy=True)
+        elif pd.api.types.is_string_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+            values = np.array(series.to_numpy(dtype=object), copy=True)
+        else:
+            columns[name] = series.copy()
+            continue
+        values.flags.writeable = False
+        columns[name] = values
+    
+    return FrozenTable(columns, index=df.index.copy(), copy=False)
+
+def map_columns_to_variables(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rename columns titled with a data dictionary 'Data Point Name' to
+    the corresponding variable name (e.g. 'Total Heat Available' -> 'wha').
+    
+    Columns without a dictionary entry are left unchanged. Requires the
+    data dictionary to be loaded; otherwise returns df unchanged.
+    """
+    if DATA_DICTIONARY_TABLE not in csv_data:
+        return df
+    
+    dictionary = csv_data[DATA_DICTIONARY_TABLE].dropna(subset=['name'])
+    names = {str(name).strip().lower(): variable
+             for name, variable in zip(dictionary['name'], dictionary['variable'])}
+    mapping = {c: names[str(c).strip().lower()] for c in df.columns
+               if str(c).strip().lower() in names and names[str(c).strip().lower()] not in df.columns}
+    return df.rename(columns=mapping) if mapping else df
+
+def dictionary_signature() -> str:
+    """
+    Digest of the loaded data dictionary's name -> variable mapping ('' if
+    none is loaded). Workbook snapshots parsed under another mapping are stale.
+    """
+    if DATA_DICTIONARY_TABLE not in csv_data:
+        return ''
+    
+    dictionary = csv_data[DATA_DICTIONARY_TABLE]
+    pairs = sorted((str(name).strip().lower(), str(variable))
+                   for name, variable in zip(dictionary['name'], dictionary['variable']) if pd.notna(name))
+    return hashlib.md5(repr(pairs).encode('utf-8')).hexdigest()
+
+def _list_data_files(data_dir: str) -> Tuple[List[str], List[str], List[str]]:
+    """Paths of the CSV files, data dictionary workbooks and other workbooks in a directory."""
+    files = sorted(os.listdir(data_dir))
+    csv_files = [f for f in files if f.lower().endswith('.csv')]
+    excel_files = [f for f in files if f.lower().endswith('.xlsx') and not f.startswith('~$')]
+    dictionary_files = [f for f in excel_files if DATA_DICTIONARY_PATTERN in f.upper().replace(' ', '_')]
+    workbook_files = [f for f in excel_files if f not in dictionary_files]
+    return ([os.path.join(data_dir, f) for f in csv_files],
+            [os.path.join(data_dir, f) for f in dictionary_files],
+            [os.path.join(data_dir, f) for f in workbook_files])
+
+def _track_file(file_path: str, tables: Set[str], fingerprint: Optional[Tuple[int, int]]) -> None:
+    """
+    Record the version of a data file that was read and the tables it
+    provides. fingerprint is taken before reading the file, so an edit
+    made while it was parsed shows up as a change on the next reload.
+    """
+    if fingerprint is None:
+        _loaded_files.pop(file_path, None)
+    else:
+        _loaded_files[file_path] = (fingerprint, set(tables))
+
+def _drop_stale_tables(file_path: str, keep: Set[str]) -> None:
+    """Drop the tables a file provided at its last load that are not in keep."""
+    _, tables = _loaded_files.get(file_path, (None, set()))
+    for name in tables - keep:
+        csv_data.pop(name, None)
+
+def _current_fingerprint(file_path: str) -> Optional[Tuple[int, int]]:
+    """Fingerprint of a data file, or None if it cannot be read."""
+    try:
+        return file_fingerprint(file_path)
+    except OSError:
+        return None
+
+def _load_workbooks(dictionary_files: List[str], workbook_files: List[str],
+                    csv_tables: Set[str], use_snapshots: bool) -> Set[str]:
+    """
+    Load data dictionary workbooks, then the other workbooks' sheets.
+    
+    Sheets whose table name is in csv_tables are skipped (a CSV takes
+    precedence). A file that fails to parse keeps its earlier tables.
+    Returns the names of the tables loaded.
+    """
+    loaded = set()
+    
+    for file_path in dictionary_files:
+        fingerprint = _current_fingerprint(file_path)
+        try:
+            tables = load_with_snapshot(file_path, _read_data_dictionary, use_snapshots, fingerprint=fingerprint)
+        except Exception as e:
+            print(f"❌ Failed to load data dictionary {os.path.basename(file_path)}: {e}")
+            continue
+        
+        csv_data.update({name: freeze_table(df) for name, df in tables.items()})
+        _drop_stale_tables(file_path, set(tables) | csv_tables)
+        _register_diagnostics(file_path, tables)
+        _track_file(file_path, set(tables), fingerprint)
+        loaded.update(tables)
+    
+    # Sheet columns are mapped through the dictionary loaded above
+    signature = f"{schema_signature()}:{dictionary_signature()}"
+    for file_path in workbook_files:
+        fingerprint = _current_fingerprint(file_path)
+        try:
+            tables = load_with_snapshot(file_path, _read_excel_file, use_snapshots, signature, fingerprint)
+        except Exception as e:
+            print(f"❌ Failed to load {os.path.basename(file_path)}: {e}")
+            continue
+        
+        provided = {name for name in tables if name not in csv_tables}
+        _register_diagnostics(file_path, provided)
+        for name in provided:
+            csv_data[name] = freeze_table(tables[name])
+        _drop_stale_tables(file_path, provided | csv_tables)
+        _track_file(file_path, provided, fingerprint)
+        loaded.update(provided)
+    
+    return loaded
+
+def load_csv_files(data_dir: str = "Data", use_snapshots: bool = True, lazy: bool = False,
+                   max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Load all CSV files and Excel workbooks from the specified directory.
+    
+    By default all CSV files are parsed up front, concurrently on a thread
+    pool, so startup takes about as long as the slowest file and csv_data
+    holds every table on return. With lazy=True CSV files are only
+    registered: each file is parsed on the first get_csv_data(name) call,
+    so a workflow only pays for the tables it uses, and csv_data holds the
+    tables parsed so far. Workbooks are always loaded up front because their table
+    names come from the sheets inside. CSV files of at least
+    STREAMING_THRESHOLD_BYTES are streamed into on-disk column stores
+    instead (see ingest_csv_streaming and get_column_store).
+    
+    Each table is typed and cleaned once here according to its schema
+    (see data.schema) and frozen (see freeze_table), so consumers receive
+    ready-to-use frames they can share without copying.
+    Parsed files are cached in the snapshot store (see data.snapshot), so
+    unchanged files load from the binary snapshot on later sessions.
+    Workbook sheets are named like CSVs (file name, or FILE_SHEET for
+    multi-sheet workbooks) and their columns are mapped to variable names
+    through the data dictionary workbook, if present. A CSV takes
+    precedence over a workbook sheet with the same table name.
+    
+    Parameters:
+    data_dir (str): Path to the directory containing the data files
+    use_snapshots (bool): Read and write the snapshot store (default: True)
+    lazy (bool): Parse CSV files on first access (default: False)
+    max_workers (int): Thread pool size for eager loading (None = default)
+    
+    Returns:
+    dict: Dictionary of the dataframes parsed so far, with normalized names as keys
     """
     global csv_data
     
     try:
-        # Get all CSV files in the directory
-        csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
+        csv_files, dictionary_files, workbook_files = _list_data_files(data_dir)
+        csv_paths = {table_name_for_file(f): f for f in csv_files}
         
-        # Load each CSV file into a dataframe
-        for file in csv_files:
-            # Create a normalized name for the dataframe (without .csv extension, uppercase)
-            df_name = os.path.splitext(file)[0].upper()
-            file_path = os.path.join(data_dir, file)
+        with _load_lock:
+            _loaded_files.clear()
+            _load_options.update(data_dir=data_dir, use_snapshots=use_snapshots, lazy=lazy)
             
-            try:
-                # Try to read the CSV file
-                csv_data[df_name] = pd.read_csv(file_path)
-                # print(f"✅ Loaded: {file} as {df_name}")
-            except Exception as e:
-                # Try with different separators if automatic detection fails
-                try:
-                    csv_data[df_name] = pd.read_csv(file_path, sep=';')
-                    # print(f"✅ Loaded: {file} as {df_name} (using semicolon separator)")
-                except:
-                    try:
-                        csv_data[df_name] = pd.read_csv(file_path, sep='\\t')
-                        # print(f"✅ Loaded: {file} as {df_name} (using tab separator)")
-                    except Exception as e2:
-                        print(f"❌ Failed to load {file}: {e2}")
+            # Reloading a directory replaces any earlier version of its tables
+            for name in csv_paths:
+                csv_data.pop(name, None)
+                _column_stores.pop(name, None)
+            
+            # Each file's version is taken once, before it is read
+            fingerprints = {name: _current_fingerprint(path) for name, path in csv_paths.items()}
+            
+            if lazy:
+                _pending_tables.update({name: (path, use_snapshots) for name, path in csv_paths.items()})
+            else:
+                for name in csv_paths:
+                    _pending_tables.pop(name, None)
+                
+                # Parse every CSV file concurrently
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {name: executor.submit(_load_csv_file, path, use_snapshots, fingerprints[name])
+                               for name, path in csv_paths.items()}
+                    for name, future in futures.items():
+                        try:
+                            _store_tables(future.result(), csv_paths[name])
+                            # print(f"✅ Loaded: {name}")
+                        except Exception as e:
+                            print(f"❌ Failed to load {os.path.basename(csv_paths[name])}: {e}")
+            
+            for name, path in csv_paths.items():
+                _track_file(path, {name}, fingerprints[name])
+            
+            # The data dictionary drives column mapping for workbook sheets
+            if dictionary_files or workbook_files:
+                _load_workbooks(dictionary_files, workbook_files, set(csv_paths), use_snapshots)
         
         return csv_data
     
@@ -61,6 +548,10 @@ def get_csv_data(csv_name: str) -> Optional[pd.DataFrame]:
     """
     Get a specific CSV dataframe by name.
     
+    Tables are shared without copying as read-only FrozenTable frames:
+    any attempt to modify one raises instead of changing the data seen by
+    other analyses. Derived frames (filters, selections) are mutable.
+    
     Parameters:
     csv_name (str): Name of the CSV file (case-insensitive)
     
@@ -72,19 +563,104 @@ def get_csv_data(csv_name: str) -> Optional[pd.DataFrame]:
     # Normalize the CSV name
     csv_name = csv_name.upper()
     
+    # Parse lazily registered tables on first access
+    if csv_name not in csv_data and csv_name in _pending_tables:
+        _load_pending_table(csv_name)
+    
+    # Tables kept on disk are materialized on request only
+    if csv_name not in csv_data and csv_name in _column_stores:
+        store = _column_stores[csv_name]
+        print(f"⚠️ {csv_name} is a {len(store):,}-row column store; materializing it "
+              f"(use get_column_store('{csv_name}') for lookups)")
+        return freeze_table(store.to_frame())
+    
     # Check if the CSV has been loaded
     if csv_name not in csv_data:
         available = list(csv_data.keys())
         raise ValueError(f"❌ CSV '{csv_name}' not loaded. Available CSVs: {available}")
     return csv_data[csv_name]
 
+def get_column_store(csv_name: str) -> Optional[ColumnStore]:
+    """
+    Get the on-disk column store of a large table.
+    
+    Parameters:
+    csv_name (str): Name of the CSV file (case-insensitive)
+    
+    Returns:
+    ColumnStore or None: The store, or None if the table is held in memory
+    (use get_csv_data) or not loaded
+    """
+    csv_name = csv_name.upper()
+    if csv_name in _pending_tables:
+        _load_pending_table(csv_name)
+    return _column_stores.get(csv_name)
+
+def get_table_columns(csv_name: str, columns: List[str],
+                      first_per: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Get selected columns of a table without materializing the rest.
+    
+    A table kept in a column store is read in chunks (see
+    ColumnStore.iter_frames), and with first_per each chunk is reduced
+    before the next is read, so memory use follows the result rather
+    than the table.
+    
+    Parameters:
+    csv_name (str): Name of the CSV file (case-insensitive)
+    columns (list): Columns to return
+    first_per (list): Keep only the first row per value of these columns
+    
+    Returns:
+    pd.DataFrame: The selected columns (a new, mutable frame)
+    
+    Raises:
+    KeyError: With the list of requested columns the table lacks
+    """
+    store = get_column_store(csv_name)
+    available = store.columns if store is not None else get_csv_data(csv_name).columns
+    missing = [c for c in columns if c not in available]
+    if missing:
+        raise KeyError(missing)
+    
+    def reduce(frame):
+        return frame.drop_duplicates(subset=first_per, keep='first') if first_per else frame
+    
+    if store is None:
+        return reduce(get_csv_data(csv_name)[list(columns)]).reset_index(drop=True)
+    
+    frames = [reduce(chunk) for chunk in store.iter_frames(columns)]
+    if not frames:
+        return store.to_frame(columns=columns)
+    return reduce(pd.concat(frames, ignore_index=True)).reset_index(drop=True)
+
 def is_csv_loaded(csv_name: str) -> bool:
-    """Check if a CSV file has been loaded."""
-    return csv_name.upper() in csv_data
+    """Check if a CSV file has been loaded (or registered for lazy loading)."""
+    csv_name = csv_name.upper()
+    return csv_name in csv_data or csv_name in _pending_tables or csv_name in _column_stores
 
 def list_loaded_csvs() -> list:
-    """Get list of all loaded CSV names."""
-    return list(csv_data.keys())
+    """Get list of all loaded CSV names, including lazily registered ones."""
+    names = list(csv_data.keys())
+    names += [name for name in list(_pending_tables) + list(_column_stores) if name not in names]
+    return names
+
+def get_data_dir() -> Optional[str]:
+    """Directory passed to the last load_csv_files call, if any."""
+    return _load_options.get('data_dir')
+
+def get_table_fingerprint(csv_name: str) -> Optional[Tuple[int, int]]:
+    """
+    Fingerprint (size, mtime) of the data file providing a table.
+    
+    Returns:
+    tuple or None: Fingerprint, or None if the table's file is unknown
+    """
+    csv_name = csv_name.upper()
+    for file_path, (fingerprint, tables) in list(_loaded_files.items()):
+        if csv_name in tables:
+            return fingerprint
+    return None
 
 def validate_required_csvs(required_csvs: list) -> bool:
     """Validate that all required CSV files are loaded."""
@@ -97,4 +673,199 @@ def validate_required_csvs(required_csvs: list) -> bool:
         available = list_loaded_csvs()
         raise ValueError(f"❌ Missing required CSV files: {missing}. Available: {available}")
     
-    return True
\ No newline at end of file
+    return True
+
+# =============================================================================
+# HOT RELOAD
+# =============================================================================
+
+def register_reload_hook(hook: Callable[[Set[str]], None]) -> None:
+    """
+    Register a callback run after reload_changed_files re-ingests tables.
+    
+    The hook receives the set of affected table names (new, changed or
+    removed) and should drop only the indexes and cached results derived
+    from those tables.
+    """
+    if hook not in _reload_hooks:
+        _reload_hooks.append(hook)
+
+def reload_changed_files(data_dir: Optional[str] = None) -> Set[str]:
+    """
+    Re-ingest only the data files that changed since they were loaded.
+    
+    New, modified and deleted files in the data directory are detected by
+    size and modification time. Changed files are parsed first and their
+    new tables then replace the old ones, so readers never find a table
+    missing mid-reload (in a lazily loaded directory, tables not used yet
+    are registered for parsing on first access instead). A file that fails
+    to parse, e.g. while it is still being written, keeps its old tables
+    and is retried on the next call. Tables of deleted files are dropped;
+    all other tables stay as they are. A changed data dictionary reloads
+    every workbook, since it maps their column names. Registered reload
+    hooks are then notified with the affected table names.
+    
+    Parameters:
+    data_dir (str): Data directory (default: the last one loaded)
+    
+    Returns:
+    set: Names of the tables that were re-ingested or removed
+    """
+    data_dir = data_dir or _load_options.get('data_dir')
+    if data_dir is None or not os.path.isdir(data_dir):
+        return set()
+    
+    use_snapshots = _load_options.get('use_snapshots', True)
+    lazy = _load_options.get('lazy', False)
+    
+    with _load_lock:
+        csv_files, dictionary_files, workbook_files = _list_data_files(data_dir)
+        current = set(csv_files) | set(dictionary_files) | set(workbook_files)
+        directory = os.path.dirname(os.path.join(data_dir, ''))
+        tracked = {path for path in _loaded_files if os.path.dirname(path) == directory}
+        
+        # Each file's version is taken once, before it is read
+        fingerprints = {path: _current_fingerprint(path) for path in current}
+        added = current - tracked
+        removed = tracked - current
+        modified = {path for path in current & tracked if fingerprints[path] != _loaded_files[path][0]}
+        changed = added | removed | modified
+        if not changed:
+            return set()
+        
+        # Parse the changed CSV files before anything is swapped, so readers
+        # keep the old tables until the new ones are ready. Tables not used
+        # yet in a lazily loaded directory are parsed on first access.
+        csv_tables = {table_name_for_file(path) for path in csv_files}
+        parsed, pending = {}, set()
+        for path in csv_files:
+            if path not in changed:
+                continue
+            name = table_name_for_file(path)
+            if lazy and name not in csv_data and name not in _column_stores:
+                pending.add(path)
+                continue
+            try:
+                parsed[path] = _load_csv_file(path, use_snapshots, fingerprints[path])
+            except Exception as e:
+                # The old tables and fingerprint stay, so the next poll retries
+                print(f"❌ Failed to load {os.path.basename(path)}: {e}")
+        
+        affected = set()
+        for path in removed:
+            _, tables = _loaded_files.pop(path, (None, set()))
+            for name in tables:
+                _drop_table(name)
+            affected.update(tables)
+        
+        for path in pending:
+            name = table_name_for_file(path)
+            _, tables = _loaded_files.get(path, (None, set()))
+            # Registered before the old table goes, so readers parse the new one
+            _pending_tables[name] = (path, use_snapshots)
+            for old in tables:
+                csv_data.pop(old, None)
+                _column_stores.pop(old, None)
+            _track_file(path, {name}, fingerprints[path])
+            affected.update(tables | {name})
+        
+        for path, tables in parsed.items():
+            _, old_tables = _loaded_files.get(path, (None, set()))
+            _pending_tables.pop(table_name_for_file(path), None)
+            _store_tables(tables, path)
+            for name in old_tables - set(tables):
+                _drop_table(name)
+            _track_file(path, set(tables), fingerprints[path])
+            affected.update(old_tables | set(tables))
+        
+        # A changed dictionary remaps every workbook, and an added or removed
+        # CSV can shadow or expose a workbook sheet of the same name
+        csv_set_changed = any(path.lower().endswith('.csv') for path in added | removed)
+        if csv_set_changed or changed & set(dictionary_files):
+            reload_workbooks = workbook_files
+        else:
+            reload_workbooks = [path for path in workbook_files if path in changed]
+        reload_dictionaries = [path for path in dictionary_files if path in changed]
+        
+        for path in reload_workbooks + reload_dictionaries:
+            affected.update(_loaded_files.get(path, (None, set()))[1])
+        if reload_workbooks or reload_dictionaries:
+            affected.update(_load_workbooks(reload_dictionaries, reload_workbooks, csv_tables, use_snapshots))
+    
+    for hook in list(_reload_hooks):
+        try:
+            hook(affected)
+        except Exception as e:
+            print(f"⚠️ Reload hook {getattr(hook, '__name__', hook)} failed: {e}")
+    
+    return affected
+
+class DataWatcher:
+    """
+    Background thread polling the data directory for changed files.
+    
+    Every `interval` seconds it calls reload_changed_files, so long-running
+    sessions pick up edited or newly dropped data files without a restart.
+    """
+    
+    def __init__(self, data_dir: Optional[str] = None, interval: float = 2.0,
+                 on_reload: Optional[Callable[[Set[str]], None]] = None):
+        self.data_dir = data_dir
+        self.interval = interval
+        self.on_reload = on_reload
+        self._stop = threading.Event()
+        self._thread = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> 'DataWatcher':
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='DataWatcher', daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                affected = reload_changed_files(self.data_dir)
+            except Exception as e:
+                print(f"⚠️ Data watcher failed to reload: {e}")
+                continue
+            if affected and self.on_reload is not None:
+                self.on_reload(affected)
+
+def start_watching(data_dir: Optional[str] = None, interval: float = 2.0,
+                   on_reload: Optional[Callable[[Set[str]], None]] = None) -> DataWatcher:
+    """
+    Start (or restart) the shared data watcher.
+    
+    Parameters:
+    data_dir (str): Data directory (default: the last one loaded)
+    interval (float): Polling interval in seconds
+    on_reload (callable): Optional callback with the affected table names
+    
+    Returns:
+    DataWatcher: The running watcher
+    """
+    global _watcher
+    
+    stop_watching()
+    _watcher = DataWatcher(data_dir, interval, on_reload).start()
+    return _watcher
+
+def stop_watching() -> None:
+    """Stop the shared data watcher, if running."""
+    global _watcher
+    
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
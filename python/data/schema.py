@@ -0,0 +1,315 @@
+"""
+Data Table Schema Registry
+
+Declares, for every Data/ table, its columns with dtype, units and number
+format (locale), how the file is read, and which rows are dropped. The
+loader applies the schema once when a file is parsed, so consumers get
+clean, typed frames and never re-convert values per call.
+
+Column spec keys:
+    dtype:  'float' or 'str'
+    units:  Unit label for documentation and display
+    locale: Number format of the raw text -
+            'auto' (universal_float_convert, mixed formats),
+            'us'   (1,234.56 with optional currency symbols),
+            'eu'   (1.234,56 with optional currency symbols)
+
+Table spec keys:
+    description: What the table holds
+    header:      Row number of the header, or None for headerless files
+    columns:     Ordered column name -> column spec
+    drop_values: Column -> raw values marking rows to drop (legend rows)
+    required:    Columns that must have a value (rows without are dropped)
+    positive:    Columns that must be > 0 (rows failing are dropped)
+    sorted_by:   Columns the file's rows are ordered by; a file streamed
+                 into a column store records the verified leading run
+"""
+
+import hashlib
+from typing import Dict, Optional, Any
+
+import pandas as pd
+
+from .converter import convert_with_strategy, ConversionDiagnostics
+
+# =============================================================================
+# COLUMN DEFINITIONS
+# =============================================================================
+
+# Shared layout of the vendor HX selection tables (ALLHX, ALLHX_<VENDOR>)
+HX_SELECTION_COLUMNS = {
+    'wha':           {'dtype': 'float', 'units': 'MW'},
+    'T1':            {'dtype': 'float', 'units': '°C'},
+    'itdt':          {'dtype': 'float', 'units': '°C'},
+    'T2':            {'dtype': 'float', 'units': '°C'},
+    'TCSapp':        {'dtype': 'float', 'units': '°C'},
+    'F1':            {'dtype': 'float', 'units': 'L/min'},
+    'T4':            {'dtype': 'float', 'units': '°C'},
+    'T3':            {'dtype': 'float', 'units': '°C'},
+    'F2':            {'dtype': 'float', 'units': 'L/min'},
+    'FWSapp':        {'dtype': 'float', 'units': '°C'},
+    'Unit':          {'dtype': 'str',   'units': 'model'},
+    'costHX':        {'dtype': 'float', 'units': '€'},
+    'areaHX':        {'dtype': 'float', 'units': 'vendor-specific'},
+    'Hxweight':      {'dtype': 'float', 'units': 'kg'},
+    'CO2_Footprint': {'dtype': 'float', 'units': 'kg CO2e'},
+}
+
+HX_SELECTION_SCHEMA = {
+    'description': 'Heat exchanger selection per operating point (wha, T1, itdt, TCSapp)',
+    'header': 0,
+    'columns': HX_SELECTION_COLUMNS,
+    'drop_values': {'wha': ['A', 'wha']},
+    'required': ['wha', 'T1', 'itdt', 'TCSapp'],
+    'positive': ['wha', 'T1', 'itdt', 'TCSapp'],
+    'sorted_by': ['wha', 'T1', 'itdt', 'TCSapp'],
+}
+
+# =============================================================================
+# TABLE REGISTRY
+# =============================================================================
+
+TABLE_SCHEMAS = {
+    'ALLHX': HX_SELECTION_SCHEMA,
+    'ALLHX_SWEP': HX_SELECTION_SCHEMA,
+    'PIPSZ': {
+        'description': 'Maximum flow per pipe size (ceiling lookup)',
+        'header': None,
+        'columns': {
+            'flow_lpm':  {'dtype': 'float', 'units': 'L/min'},
+            'pipe_size': {'dtype': 'float', 'units': 'DN'},
+        },
+        'required': ['flow_lpm', 'pipe_size'],
+    },
+    'ROOM': {
+        'description': 'Pipe run length per power capacity (ceiling lookup)',
+        'header': None,
+        'columns': {
+            'power_mw': {'dtype': 'float', 'units': 'MW'},
+            'length_m': {'dtype': 'float', 'units': 'm'},
+        },
+        'required': ['power_mw', 'length_m'],
+    },
+    'PIPCOST': {
+        'description': 'Pipe cost per meter by nominal size',
+        'header': 0,
+        'columns': {
+            'Pipe Size': {'dtype': 'float', 'units': 'in'},
+            'Sch 40':    {'dtype': 'float', 'units': '€/m'},
+            'Stainless': {'dtype': 'float', 'units': '€/m'},
+        },
+        'required': ['Pipe Size'],
+    },
+    'CVALV': {
+        'description': 'Control valve cost by nominal size',
+        'header': 0,
+        'columns': {
+            'Pipe Size':     {'dtype': 'str',   'units': 'in'},
+            'Control Valve': {'dtype': 'float', 'units': '€'},
+        },
+        'required': ['Pipe Size'],
+    },
+    'IVALV': {
+        'description': 'Isolation valve cost by nominal size',
+        'header': 0,
+        'columns': {
+            'Pipe Size':       {'dtype': 'str',   'units': 'in'},
+            'ISOLATION Valve': {'dtype': 'float', 'units': '€'},
+        },
+        'required': ['Pipe Size'],
+    },
+    'JOINTS': {
+        'description': 'Pipe joint cost by nominal size and material',
+        'header': 0,
+        'columns': {
+            'Pipe Size': {'dtype': 'str',   'units': 'in'},
+            'BLK':       {'dtype': 'float', 'units': '€'},
+            '316':       {'dtype': 'float', 'units': '€'},
+        },
+        'required': ['Pipe Size'],
+    },
+    'HX': {
+        'description': 'Heat exchanger budget price by capacity',
+        'header': 0,
+        'columns': {
+            'MW':    {'dtype': 'float', 'units': 'MW'},
+            'Price': {'dtype': 'float', 'units': '$', 'locale': 'us'},
+        },
+        'required': ['MW', 'Price'],
+    },
+    'MW PRICE DATA': {
+        'description': 'System budget price by capacity',
+        'header': 0,
+        'columns': {
+            'MW':    {'dtype': 'float', 'units': 'MW'},
+            'Price': {'dtype': 'float', 'units': '€'},
+        },
+        'required': ['MW', 'Price'],
+    },
+}
+
+# Vendor tables not listed above (ALLHX_<VENDOR>) share the ALLHX layout
+VENDOR_TABLE_PREFIX = 'ALLHX_'
+
+# Bump when apply_schema/convert_column type values differently, so tables
+# cached by the old code (snapshots, column stores) are parsed again
+SCHEMA_PARSER_VERSION = 2
+
+# =============================================================================
+# SCHEMA ACCESS
+# =============================================================================
+
+def get_table_schema(table_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the schema for a table.
+
+    Parameters:
+    table_name (str): Normalized table name (e.g. 'ALLHX', 'MW PRICE DATA')
+
+    Returns:
+    dict or None: Table schema, or None for tables without one
+    """
+    table_name = table_name.upper()
+    if table_name in TABLE_SCHEMAS:
+        return TABLE_SCHEMAS[table_name]
+    if table_name.startswith(VENDOR_TABLE_PREFIX):
+        return HX_SELECTION_SCHEMA
+    return None
+
+
+def get_read_options(table_name: str) -> Dict[str, Any]:
+    """pandas.read_csv options implied by a table's schema."""
+    schema = get_table_schema(table_name)
+    if schema is None or schema.get('header', 0) is not None:
+        return {}
+    return {'header': None, 'names': list(schema['columns'])}
+
+
+def schema_signature() -> str:
+    """Digest of the registry; cached tables parsed under another schema are stale."""
+    return hashlib.md5(repr((SCHEMA_PARSER_VERSION, TABLE_SCHEMAS)).encode('utf-8')).hexdigest()
+
+# =============================================================================
+# TYPING AND CLEANING
+# =============================================================================
+
+_CURRENCY_PATTERN = r'[$€£¥\s"\']'
+
+# universal_float_convert strategies that found no number (converted to 0.0
+# there); typed columns hold NaN for these so row filters can drop them
+UNPARSEABLE_STRATEGIES = {'missing', 'special_token', 'invalid', 'non_finite'}
+
+
+def convert_column(series: pd.Series, dtype: str = 'float', locale: str = 'auto',
+                   diagnostics: Optional[ConversionDiagnostics] = None) -> pd.Series:
+    """
+    Convert a raw column to its declared dtype.
+
+    Parameters:
+    series (pd.Series): Raw column
+    dtype (str): 'float' or 'str'
+    locale (str): 'auto', 'us' or 'eu' number format
+    diagnostics (ConversionDiagnostics): Optional record of the
+        interpretation chosen per value ('auto' locale only)
+
+    Returns:
+    pd.Series: Typed column; missing or unparseable numbers become NaN
+    """
+    if dtype == 'str':
+        return series.astype(str).str.strip().where(series.notna())
+
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+
+    if locale == 'auto':
+        # Parse each distinct raw value once
+        counts = series.dropna().value_counts(sort=False)
+        parsed = {}
+        for value, count in counts.items():
+            result, strategy = convert_with_strategy(value)
+            parsed[value] = float('nan') if strategy in UNPARSEABLE_STRATEGIES else float(result)
+            if diagnostics is not None:
+                diagnostics.record(value, strategy, result, int(count))
+        return series.map(parsed).astype(float)
+
+    text = series.astype(str).str.replace(_CURRENCY_PATTERN, '', regex=True)
+    if locale == 'us':
+        text = text.str.replace(',', '', regex=False)
+    elif locale == 'eu':
+        text = text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+    else:
+        raise ValueError(f"❌ Unknown number locale '{locale}'")
+    return pd.to_numeric(text.where(series.notna()), errors='coerce')
+
+
+def apply_schema(table_name: str, df: pd.DataFrame,
+                 diagnostics: Optional[Dict[str, ConversionDiagnostics]] = None) -> pd.DataFrame:
+    """
+    Type and clean a raw table according to its schema.
+
+    Keeps only the declared columns (in declared order), drops legend rows,
+    converts every column once, and drops rows failing the row filters.
+    Tables without a schema are returned unchanged.
+
+    Parameters:
+    table_name (str): Normalized table name
+    df (pd.DataFrame): Raw table as read from the file
+    diagnostics (dict): Optional column -> ConversionDiagnostics, filled
+        (or extended, e.g. across chunks) with the number interpretations
+
+    Returns:
+    pd.DataFrame: Clean, typed table with a fresh RangeIndex
+    """
+    schema = get_table_schema(table_name)
+    if schema is None:
+        return df
+
+    columns = schema['columns']
+    df = df.rename(columns=lambda c: str(c).strip())
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(f"❌ {table_name} is missing columns {missing}. Found: {list(df.columns)}")
+
+    df = df[list(columns)]
+    for column, values in schema.get('drop_values', {}).items():
+        df = df[~df[column].astype(str).str.strip().isin(values)]
+
+    if diagnostics is not None:
+        for column, spec in columns.items():
+            if spec['dtype'] == 'float' and column not in diagnostics:
+                diagnostics[column] = ConversionDiagnostics(f"{table_name}.{column}")
+
+    typed = pd.DataFrame({
+        column: convert_column(df[column], spec['dtype'], spec.get('locale', 'auto'),
+                               diagnostics.get(column) if diagnostics is not None else None)
+        for column, spec in columns.items()
+    })
+
+    required = schema.get('required', [])
+    if required:
+        typed = typed.dropna(subset=required)
+    for column in schema.get('positive', []):
+        typed = typed[typed[column] > 0]
+
+    return typed.reset_index(drop=True)
+
+
+def describe_schema(table_name: str) -> pd.DataFrame:
+    """
+    Column, dtype, units and locale of a table as a DataFrame.
+
+    Parameters:
+    table_name (str): Normalized table name
+
+    Returns:
+    pd.DataFrame: One row per declared column
+    """
+    schema = get_table_schema(table_name)
+    if schema is None:
+        raise ValueError(f"❌ No schema registered for '{table_name}'")
+
+    return pd.DataFrame([
+        {'column': column, 'dtype': spec['dtype'], 'units': spec.get('units', ''),
+         'locale': spec.get('locale', 'auto') if spec['dtype'] == 'float' else ''}
+        for column, spec in schema['columns'].items()
+    ])
@@ -0,0 +1,162 @@
+"""
+Binary Snapshot Store
+
+Parsed data files are cached as pickled DataFrames next to the source data
+(in a .snapshots/ folder). A snapshot is reused while the source file's
+size and modification time are unchanged, so slow parsing - Excel
+workbooks in particular - happens once per file change instead of once
+per session.
+"""
+
+import os
+import pickle
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+SNAPSHOT_DIR_NAME = '.snapshots'
+
+# Bump when the parsed table layout changes so old snapshots are ignored
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def file_fingerprint(file_path: str) -> Tuple[int, int]:
+    """Size and modification time (ns) identifying one version of a file."""
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def snapshot_path(file_path: str) -> str:
+    """Location of the snapshot for a source data file."""
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, SNAPSHOT_DIR_NAME, name + '.pkl')
+
+
+def read_snapshot(file_path: str, signature: str = '',
+                  fingerprint: Optional[Tuple[int, int]] = None) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Read the cached tables for a file if the snapshot is current.
+
+    A snapshot is current when the file is unchanged and it was written
+    with the same signature (e.g. the schema registry digest).
+
+    Args:
+        file_path: Source data file
+        signature: Parser version tag the snapshot must have been written with
+        fingerprint: Version of the file to match (default: the current one)
+
+    Returns:
+        dict: Table name -> DataFrame, or None if missing or stale
+    """
+    path = snapshot_path(file_path)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return None
+
+    if snapshot.get('version') != SNAPSHOT_FORMAT_VERSION:
+        return None
+    if snapshot.get('fingerprint') != (fingerprint or file_fingerprint(file_path)):
+        return None
+    if snapshot.get('signature', '') != signature:
+        return None
+    return snapshot['tables']
+
+
+def write_snapshot(file_path: str, tables: Dict[str, pd.DataFrame], signature: str = '',
+                   fingerprint: Optional[Tuple[int, int]] = None) -> bool:
+    """
+    Cache parsed tables for a file.
+
+    The snapshot is written to a temporary file and moved into place, so a
+    concurrent reader never sees a partial file. Failures (e.g. a read-only
+    data directory or a table that cannot be pickled) are not fatal; the
+    temporary file is removed whatever goes wrong.
+
+    Args:
+        file_path: Source data file
+        tables: Parsed tables
+        signature: Parser version tag
+        fingerprint: Version of the file the tables were parsed from, taken
+                     before reading it (default: the current one). A file
+                     edited while it was parsed then no longer matches.
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    path = snapshot_path(file_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    snapshot = {
+        'version': SNAPSHOT_FORMAT_VERSION,
+        'fingerprint': fingerprint or file_fingerprint(file_path),
+        'signature': signature,
+        'tables': tables,
+    }
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        return True
+    except BaseException as e:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        if isinstance(e, Exception):
+            return False
+        raise
+
+
+def load_with_snapshot(file_path: str, parser: Callable[[str], Dict[str, pd.DataFrame]],
+                       use_snapshot: bool = True, signature: str = '',
+                       fingerprint: Optional[Tuple[int, int]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Load a data file through the snapshot store.
+
+    Args:
+        file_path: Source data file
+        parser: Function parsing the file into a dict of tables
+        use_snapshot: Set False to always parse (and not write a snapshot)
+        signature: Parser version tag; snapshots with another tag are rebuilt
+        fingerprint: Version of the file, taken before reading it (default:
+                     taken here); callers tracking the file record the same one
+
+    Returns:
+        dict: Table name -> DataFrame
+    """
+    fingerprint = fingerprint or file_fingerprint(file_path)
+    if use_snapshot:
+        tables = read_snapshot(file_path, signature, fingerprint)
+        if tables is not None:
+            return tables
+
+    tables = parser(file_path)
+
+    if use_snapshot:
+        write_snapshot(file_path, tables, signature, fingerprint)
+    return tables
+
+
+def clear_snapshots(data_dir: str = "Data") -> int:
+    """
+    Delete all snapshots for a data directory.
+
+    Returns:
+        int: Number of snapshot files removed
+    """
+    directory = os.path.join(data_dir, SNAPSHOT_DIR_NAME)
+    if not os.path.isdir(directory):
+        return 0
+
+    removed = 0
+    for name in os.listdir(directory):
+        if name.endswith('.pkl'):
+            os.remove(os.path.join(directory, name))
+            removed += 1
+    return removed
@@ -17,14 +17,22 @@ Author: Heat Reuse Analysis Tool Team
 Version: 1.0
 """
 
-from .constants import *
-from .engineering_calculations import *
-from .thermodynamics import *
-from .fluid_mechanics import *
-from .heat_transfer import *
-from .heat_exchangers import *
-from .materials import *
-from .units import *
+import importlib
+
+# Submodules re-exported at package level, in star-import order (a name
+# defined in several of them resolves to the last one). They are imported
+# on first access, so `from physics.constants import ...` loads only that
+# module.
+_SUBMODULES = (
+    'constants',
+    'engineering_calculations',
+    'thermodynamics',
+    'fluid_mechanics',
+    'heat_transfer',
+    'heat_exchangers',
+    'materials',
+    'units'
+)
 
 __all__ = [
     # Constants
@@ -54,4 +62,32 @@ __all__ = [
     # Unit Conversions
     'celsius_to_kelvin', 'fahrenheit_to_celsius', 'liters_per_minute_to_m3_per_second',
     'watts_to_btu_per_hour', 'pressure_conversions'
-]
\ No newline at end of file
+]
+
+def _public_names(module):
+    """Names a star-import of the module would bind."""
+    names = getattr(module, '__all__', None)
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith('_')]
+    return names
+
+def __getattr__(name):
+    """Import the package-level names of the submodules on first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if not name.startswith('_'):
+        for submodule in reversed(_SUBMODULES):
+            module = importlib.import_module(f'.{submodule}', __name__)
+            if name in _public_names(module):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    names = set(globals()) | set(_SUBMODULES)
+    for submodule in _SUBMODULES:
+        names.update(_public_names(importlib.import_module(f'.{submodule}', __name__)))
+    return sorted(names)
@@ -1,9 +1,19 @@
 """
 Main UI Interface for Heat Reuse Tool
 Simple init file that imports main display function
+
+The display functions are imported on first access, so importing a light
+submodule (e.g. ui.config or ui.formatting) does not load ipywidgets,
+IPython or matplotlib.
 """
 
-from .interface import display_interface, auto_initialize_interface
+import importlib
+
+# Public name -> submodule defining it
+_LAZY_EXPORTS = {
+    'display_interface': 'interface',
+    'auto_initialize_interface': 'interface'
+}
 
 # Make main functions available when importing from ui
 __all__ = [
@@ -11,4 +21,15 @@ __all__ = [
     'auto_initialize_interface'
 ]
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
+
+def __getattr__(name):
+    """Import a display function's module on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_EXPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
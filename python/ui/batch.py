@@ -0,0 +1,210 @@
+"""
+Batch Results Panel
+
+Progress bar and results table for batch calculations. The table holds the
+flat run_batch_analysis() results (ANALYSIS_COLUMNS), can be sorted and
+filtered in the notebook, and exports the current view to CSV, JSON Lines
+or Parquet (core.result_export).
+"""
+
+import ipywidgets as widgets
+from IPython.display import display, HTML
+
+from core.batch_analysis import NUMERIC_RESULT_COLUMNS
+from core.result_export import EXPORT_FORMATS, export_results
+from .config import BATCH_CONFIG
+
+# Export formats offered by the results table
+RESULTS_EXPORT_FORMATS = list(EXPORT_FORMATS)
+
+# =============================================================================
+# PROGRESS
+# =============================================================================
+
+def create_batch_progress(total):
+    """
+    Create the progress bar for a batch run.
+
+    Args:
+        total: Number of work items (distinct operating points)
+
+    Returns:
+        IntProgress widget
+    """
+    progress = widgets.IntProgress(
+        value=0,
+        min=0,
+        max=max(total, 1),
+        description='Batch:',
+        bar_style='info',
+        layout=widgets.Layout(width='60%')
+    )
+    progress.style.bar_color = BATCH_CONFIG['progress_color']
+    return progress
+
+def create_progress_callback(progress):
+    """
+    Progress callback for run_batch_analysis that updates a progress bar.
+
+    Only the widget value changes, so each step sends one small comm
+    message instead of re-rendering an output area.
+    """
+    def update(done, total):
+        progress.max = max(total, 1)
+        progress.value = done
+        progress.description = f"{done}/{total}"
+
+    return update
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def export_results_table(results, path, fmt='csv'):
+    """
+    Write a results table to CSV, JSON Lines or Parquet.
+
+    Args:
+        results: Results DataFrame
+        path: Target file; the format's extension is added if missing
+        fmt: 'csv', 'jsonl' or 'parquet'
+
+    Returns:
+        Path written
+
+    Raises:
+        ImportError: For Parquet when pyarrow is not installed
+    """
+    return export_results(results, path, fmt)['path']
+
+# =============================================================================
+# RESULTS TABLE
+# =============================================================================
+
+class BatchResultsTable:
+    """
+    Sortable, filterable view of a batch results table.
+
+    Sorting and filtering only re-slice the DataFrame that is already in
+    memory; nothing is recalculated. At most BATCH_CONFIG['table_max_rows']
+    rows are rendered, exports always contain the whole filtered view.
+
+    Example:
+        >>> table = BatchResultsTable(run_batch_analysis(parameter_sets))
+        >>> display(table.widget)
+    """
+
+    def __init__(self, results, max_rows=None):
+        self.results = results.reset_index(drop=True)
+        self.max_rows = max_rows or BATCH_CONFIG['table_max_rows']
+
+        columns = list(self.results.columns)
+        default_sort = BATCH_CONFIG['default_sort']
+        statuses = sorted(self.results['status'].dropna().unique()) if 'status' in columns else []
+
+        self.sort_widget = widgets.Dropdown(
+            options=columns,
+            value=default_sort if default_sort in columns else columns[0],
+            description='Sort by:'
+        )
+        self.order_widget = widgets.ToggleButtons(
+            options=['Ascending', 'Descending'],
+            value='Ascending'
+        )
+        self.status_widget = widgets.Dropdown(
+            options=['all'] + statuses,
+            value='all',
+            description='Status:'
+        )
+        self.query_widget = widgets.Text(
+            value='',
+            placeholder='e.g. t1 == 30 and total_cost < 200000',
+            description='Filter:',
+            continuous_update=False,
+            layout=widgets.Layout(width='50%')
+        )
+        self.path_widget = widgets.Text(
+            value=BATCH_CONFIG['export_path'],
+            description='Export to:'
+        )
+        self.export_buttons = [
+            widgets.Button(description=fmt.upper(), icon='download', tooltip=f"Export the filtered table as {fmt.upper()}")
+            for fmt in RESULTS_EXPORT_FORMATS
+        ]
+        self.summary = widgets.HTML()
+        self.table = widgets.Output()
+
+        for control in (self.sort_widget, self.order_widget, self.status_widget, self.query_widget):
+            control.observe(lambda change: self.refresh(), names='value')
+        for fmt, button in zip(RESULTS_EXPORT_FORMATS, self.export_buttons):
+            button.on_click(lambda b, fmt=fmt: self.export(fmt))
+
+        self._widget = None
+        self.refresh()
+
+    def view(self):
+        """Filtered and sorted results (all rows)."""
+        view = self.results
+
+        if self.status_widget.value != 'all':
+            view = view[view['status'] == self.status_widget.value]
+
+        query = self.query_widget.value.strip()
+        self.query_error = None
+        if query:
+            try:
+                view = view.query(query)
+            except Exception as e:
+                self.query_error = f"{type(e).__name__}: {e}"
+
+        return view.sort_values(
+            self.sort_widget.value,
+            ascending=self.order_widget.value == 'Ascending',
+            kind='stable',
+            na_position='last'
+        )
+
+    def refresh(self):
+        """Re-render the table for the current sort and filter."""
+        view = self.view()
+        shown = view.head(self.max_rows)
+
+        summary = f"Showing {len(shown):,} of {len(view):,} rows ({len(self.results):,} total)"
+        if self.query_error:
+            summary += f" &nbsp; ⚠️ Filter ignored: {self.query_error}"
+        self.summary.value = f"<span style='color: #495057;'>{summary}</span>"
+
+        formatters = {column: '{:,.2f}'.format for column in NUMERIC_RESULT_COLUMNS if column in shown.columns}
+        table_html = shown.to_html(index=False, na_rep='–', formatters=formatters, border=0)
+
+        self.table.clear_output(wait=True)
+        with self.table:
+            display(HTML(f"""
+            <div style="max-height: 420px; overflow: auto; border: 1px solid #dee2e6; border-radius: 8px;">
+                {table_html}
+            </div>
+            """))
+
+    def export(self, fmt):
+        """Export the current (filtered and sorted) view."""
+        try:
+            view = self.view()
+            path = export_results_table(view, self.path_widget.value.strip() or BATCH_CONFIG['export_path'], fmt)
+            self.summary.value = f"<span style='color: #155724;'>✅ Exported {len(view):,} rows to {path}</span>"
+        except ImportError as e:
+            self.summary.value = f"<span style='color: #856404;'>⚠️ {fmt.upper()} export unavailable: {e}</span>"
+        except Exception as e:
+            self.summary.value = f"<span style='color: #721c24;'>❌ Export failed: {e}</span>"
+
+    @property
+    def widget(self):
+        """Controls, summary line and table as one widget."""
+        if self._widget is None:
+            self._widget = widgets.VBox([
+                widgets.HBox([self.sort_widget, self.order_widget]),
+                widgets.HBox([self.status_widget, self.query_widget]),
+                widgets.HBox([self.path_widget] + self.export_buttons),
+                self.summary,
+                self.table
+            ])
+        return self._widget
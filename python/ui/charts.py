@@ -3,8 +3,15 @@ Chart Generation Module - Configurable chart creation
 Extracted from Interactive Analysis Tool.ipynb
 """
 
+import io
+import weakref
 import matplotlib.pyplot as plt
 import numpy as np  # Also needed for the effectiveness gauge
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.text import Annotation, Text
+from matplotlib.transforms import Bbox
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from .config import CHART_CONFIG
 from .formatting import format_display_value, safe_float_convert, calculate_effectiveness 
 
@@ -44,9 +51,7 @@ def create_system_charts(analysis):
         create_cost_efficiency_chart(axs[1, 2], analysis)  # Efficiency
        
         # Set overall title
-        power_display = format_display_value(float(system['power']), 'temperature', False)
-        plt.suptitle(f'Heat Reuse System Analysis - {power_display}MW System', 
-                    fontsize=16, fontweight='bold')
+        plt.suptitle(_chart_title(system), fontsize=16, fontweight='bold')
         
         plt.tight_layout()
         plt.show()
@@ -63,17 +68,50 @@ def create_system_charts(analysis):
 # INDIVIDUAL CHART CREATION FUNCTIONS
 # =============================================================================
 
-def create_temperature_chart(ax, system_data):
-    """Create temperature flow chart."""
-    config = CHART_CONFIG['charts']['temperatures']
-    
-    # Prepare data
+def _temperature_values(system_data):
+    """Temperature bar values and their value labels."""
     temp_values = [
         float(system_data['T1']),
         float(system_data['T2']),
         float(system_data['T3']),
         float(system_data['T4'])
     ]
+    labels = [format_display_value(v, 'temperature', True, '°C') for v in temp_values]
+    return temp_values, labels
+
+def _flow_rate_values(system_data):
+    """Flow rate bar values and their value labels."""
+    flow_values = [
+        float(system_data['F1']),
+        float(system_data['F2'])
+    ]
+    labels = [format_display_value(v, 'flow_rate', False) for v in flow_values]
+    return flow_values, labels
+
+def _cost_breakdown_values(costs_data):
+    """Cost breakdown values (pipe, HX, valves, pump, installation)."""
+    return [
+        float(costs_data['total_pipe_cost']),
+        float(costs_data['hx_cost']),
+        float(costs_data['total_valve_cost']),
+        float(costs_data['pump_cost']),
+        float(costs_data['installation_cost'])
+    ]
+
+def _cost_bar_labels(cost_values):
+    cost_rounding_types = ['total_pipe_cost', 'hx_cost', 'valve_costs', 'pump_cost', 'pump_cost']
+    return [f"€{format_display_value(v, rounding_type, False)}"
+            for v, rounding_type in zip(cost_values, cost_rounding_types)]
+
+def _bar_label_offset(values):
+    return max(values) * 0.02
+
+def create_temperature_chart(ax, system_data):
+    """Create temperature flow chart."""
+    config = CHART_CONFIG['charts']['temperatures']
+    
+    # Prepare data
+    temp_values, labels = _temperature_values(system_data)
     
     # Create chart
     bars = ax.bar(config['labels'], temp_values, color=config['colors'])
@@ -81,19 +119,15 @@ def create_temperature_chart(ax, system_data):
     ax.set_ylabel(config['ylabel'])
     
     # Add value labels
-    for i, v in enumerate(temp_values):
-        display_value = format_display_value(v, 'temperature', True, '°C')
-        ax.text(i, v + max(temp_values)*0.02, display_value, ha='center', fontweight='bold')
+    for i, (v, display_value) in enumerate(zip(temp_values, labels)):
+        ax.text(i, v + _bar_label_offset(temp_values), display_value, ha='center', fontweight='bold')
 
 def create_flow_rates_chart(ax, system_data):
     """Create flow rates comparison chart."""
     config = CHART_CONFIG['charts']['flow_rates']
     
     # Prepare data
-    flow_values = [
-        float(system_data['F1']),
-        float(system_data['F2'])
-    ]
+    flow_values, labels = _flow_rate_values(system_data)
     
     # Create chart
     bars = ax.bar(config['labels'], flow_values, color=config['colors'])
@@ -101,22 +135,15 @@ def create_flow_rates_chart(ax, system_data):
     ax.set_ylabel(config['ylabel'])
     
     # Add value labels
-    for i, v in enumerate(flow_values):
-        display_value = format_display_value(v, 'flow_rate', False)
-        ax.text(i, v + max(flow_values)*0.02, display_value, ha='center', fontweight='bold')
+    for i, (v, display_value) in enumerate(zip(flow_values, labels)):
+        ax.text(i, v + _bar_label_offset(flow_values), display_value, ha='center', fontweight='bold')
 
 def create_cost_breakdown_chart(ax, costs_data):
     """Create cost breakdown chart (pie chart for better total cost visualization)."""
     config = CHART_CONFIG['charts']['cost_breakdown']
     
     # Prepare data
-    cost_values = [
-        float(costs_data['total_pipe_cost']),
-        float(costs_data['hx_cost']),
-        float(costs_data['total_valve_cost']),
-        float(costs_data['pump_cost']),
-        float(costs_data['installation_cost'])
-    ]
+    cost_values = _cost_breakdown_values(costs_data)
     
     # Create chart based on type
     if config['type'] == 'pie':
@@ -137,10 +164,8 @@ def create_cost_breakdown_chart(ax, costs_data):
         ax.set_ylabel('Cost (€)')
         
         # Add cost labels
-        cost_rounding_types = ['total_pipe_cost', 'hx_cost', 'valve_costs', 'pump_cost', 'pump_cost']
-        for i, (v, rounding_type) in enumerate(zip(cost_values, cost_rounding_types)):
-            display_value = format_display_value(v, rounding_type, False)
-            ax.text(i, v + max(cost_values)*0.02, f"€{display_value}", 
+        for i, (v, label) in enumerate(zip(cost_values, _cost_bar_labels(cost_values))):
+            ax.text(i, v + _bar_label_offset(cost_values), label, 
                    ha='center', fontweight='bold', rotation=45)
 
 def create_system_metrics_chart(ax, system_data, sizing_data):
@@ -333,6 +358,9 @@ def save_charts_to_file(analysis, filename='heat_reuse_charts.png', dpi=300):
     """
     Save charts to file instead of displaying.
     
+    Uses its own Agg figure rather than pyplot, so it can run from
+    several threads or processes at once (see ui.export).
+    
     Args:
         analysis: System analysis dictionary
         filename: Output filename
@@ -341,11 +369,9 @@ def save_charts_to_file(analysis, filename='heat_reuse_charts.png', dpi=300):
     try:
         # Create charts
         layout = CHART_CONFIG['layout']
-        fig, axs = plt.subplots(
-            layout['subplot_rows'], 
-            layout['subplot_cols'], 
-            figsize=layout['figure_size']
-        )
+        fig = Figure(figsize=layout['figure_size'])
+        FigureCanvasAgg(fig)
+        axs = fig.subplots(layout['subplot_rows'], layout['subplot_cols'])
         
         # Extract data and create charts
         system = analysis['system']
@@ -358,13 +384,10 @@ def save_charts_to_file(analysis, filename='heat_reuse_charts.png', dpi=300):
         create_system_metrics_chart(axs[1, 1], system, sizing)
         
         # Set title and save
-        power_display = format_display_value(float(system['power']), 'temperature', False)
-        plt.suptitle(f'Heat Reuse System Analysis - {power_display}MW System', 
-                    fontsize=16, fontweight='bold')
+        fig.suptitle(_chart_title(system), fontsize=16, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(filename, dpi=dpi, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(filename, dpi=dpi, bbox_inches='tight')
         
         return f"Charts saved to {filename}"
         
@@ -430,12 +453,12 @@ def create_approach_profiles_chart(ax, system_data):
         # Plot TCS approach profile (internal system)
         ax.plot(time_percent, tcs['temperatures'], 
                color='#ff6666', linewidth=3, marker='o', markersize=4,
-               label=f'TCS ({tcs["start_temp"]:.0f}°C → {tcs["target_temp"]:.0f}°C)')
+               label=_profile_label('TCS', tcs), gid='tcs')
         
         # Plot FWS approach profile (external system)
         ax.plot(time_percent, fws['temperatures'], 
                color='#66b3ff', linewidth=3, marker='s', markersize=4,
-               label=f'FWS ({fws["start_temp"]:.0f}°C → {fws["target_temp"]:.0f}°C)')
+               label=_profile_label('FWS', fws), gid='fws')
         
         # Chart styling
         ax.set_title('System Approach Profiles', fontsize=14, fontweight='bold')
@@ -448,17 +471,15 @@ def create_approach_profiles_chart(ax, system_data):
         ax.annotate(f'TCS Start\n{tcs["start_temp"]:.0f}°C', 
                    xy=(0, tcs['temperatures'][0]), xytext=(10, tcs['temperatures'][0] + 1),
                    arrowprops=dict(arrowstyle='->', color='#ff6666', alpha=0.7),
-                   fontsize=9, ha='left')
+                   fontsize=9, ha='left', gid='tcs_start')
         
         ax.annotate(f'FWS Start\n{fws["start_temp"]:.0f}°C', 
                    xy=(0, fws['temperatures'][0]), xytext=(10, fws['temperatures'][0] - 1),
                    arrowprops=dict(arrowstyle='->', color='#66b3ff', alpha=0.7),
-                   fontsize=9, ha='left')
+                   fontsize=9, ha='left', gid='fws_start')
         
         # Set reasonable y-axis limits
-        all_temps = tcs['temperatures'] + fws['temperatures']
-        temp_range = max(all_temps) - min(all_temps)
-        ax.set_ylim(min(all_temps) - temp_range * 0.1, max(all_temps) + temp_range * 0.1)
+        ax.set_ylim(*_profile_ylim(tcs, fws))
         
     except Exception as e:
         ax.text(0.5, 0.5, f'Chart Error:\n{str(e)}', 
@@ -466,6 +487,14 @@ def create_approach_profiles_chart(ax, system_data):
                bbox=dict(boxstyle="round,pad=0.3", facecolor="lightcoral"))
         ax.set_title('Approach Profiles (Error)', fontsize=14, fontweight='bold')
 
+def _profile_label(name, profile):
+    return f'{name} ({profile["start_temp"]:.0f}°C → {profile["target_temp"]:.0f}°C)'
+
+def _profile_ylim(tcs, fws):
+    all_temps = tcs['temperatures'] + fws['temperatures']
+    temp_range = max(all_temps) - min(all_temps)
+    return min(all_temps) - temp_range * 0.1, max(all_temps) + temp_range * 0.1
+
 def create_efficiency_chart(ax, system_data, costs_data):
     """
     Create efficiency analysis chart.
@@ -535,15 +564,13 @@ def create_effectiveness_gauge(ax, effectiveness):
     ax.plot(np.cos(theta_green), np.sin(theta_green), '#4CAF50', linewidth=8)
     
     # Needle position
-    needle_angle = np.pi * (1 - effectiveness)
-    needle_x = [0, 0.8 * np.cos(needle_angle)]
-    needle_y = [0, 0.8 * np.sin(needle_angle)]
-    ax.plot(needle_x, needle_y, 'black', linewidth=4)
+    needle_x, needle_y = _needle_xy(effectiveness)
+    ax.plot(needle_x, needle_y, 'black', linewidth=4, gid='needle')
     ax.plot(0, 0, 'ko', markersize=8)
     
     # Labels
     ax.text(0, -0.3, f'{effectiveness:.1%}', ha='center', va='center', 
-            fontsize=16, fontweight='bold')
+            fontsize=16, fontweight='bold', gid='effectiveness')
     ax.text(0, -0.5, 'Effectiveness', ha='center', va='center', fontsize=12)
     
     # Zone labels
@@ -557,6 +584,10 @@ def create_effectiveness_gauge(ax, effectiveness):
     ax.axis('off')
     ax.set_title('Heat Exchanger Effectiveness', fontsize=14, fontweight='bold', pad=20)
 
+def _needle_xy(effectiveness):
+    needle_angle = np.pi * (1 - effectiveness)
+    return [0, 0.8 * np.cos(needle_angle)], [0, 0.8 * np.sin(needle_angle)]
+
 def create_cost_efficiency_chart(ax, analysis):
     """
     Create cost efficiency chart showing cost per MW across different system sizes.
@@ -653,6 +684,24 @@ def create_eu_compliance_gauge(ax, analysis):
     ax.grid(True, alpha=0.3)
     
     
+# Cost per MW by system size, based on the MW price data
+COST_EFFICIENCY_MW_SIZES = [0.5, 0.75, 1, 1.25, 1.5, 1.75, 2, 2.25, 2.5, 2.75, 3, 3.25, 3.5, 3.75, 4, 4.25, 4.5, 4.75, 5]
+COST_EFFICIENCY_PRICES = [16000, 18000, 21000, 26000, 30000, 35000, 38000, 41000, 42000, 45000, 52000, 58000, 61000, 65000, 70000, 73000, 77000, 81000, 85000]
+COST_EFFICIENCY_COST_PER_MW = [price/mw for price, mw in zip(COST_EFFICIENCY_PRICES, COST_EFFICIENCY_MW_SIZES)]
+
+def _current_system_point(analysis):
+    """Index of the current system size in the cost efficiency chart (None if off-grid) and its cost per MW."""
+    current_power = analysis['system']['power']
+    current_cost_per_mw = analysis['costs']['total_cost'] / current_power
+    
+    for i, mw in enumerate(COST_EFFICIENCY_MW_SIZES):
+        if abs(mw - current_power) < 0.01:  # Find matching power
+            return i, current_cost_per_mw
+    return None, current_cost_per_mw
+
+def _cost_efficiency_label(cost_per_mw):
+    return f'Your System\n€{cost_per_mw:,.0f}/MW'
+
 def create_cost_efficiency_chart(ax, analysis):
     """
     Create cost efficiency chart showing cost per MW across different system sizes.
@@ -661,39 +710,30 @@ def create_cost_efficiency_chart(ax, analysis):
         ax: Matplotlib axis to plot on
         analysis: System analysis data
     """
-    # Data based on your MW price data
-    mw_sizes = [0.5, 0.75, 1, 1.25, 1.5, 1.75, 2, 2.25, 2.5, 2.75, 3, 3.25, 3.5, 3.75, 4, 4.25, 4.5, 4.75, 5]
-    prices = [16000, 18000, 21000, 26000, 30000, 35000, 38000, 41000, 42000, 45000, 52000, 58000, 61000, 65000, 70000, 73000, 77000, 81000, 85000]
-    
-    # Calculate cost per MW
-    cost_per_mw = [price/mw for price, mw in zip(prices, mw_sizes)]
+    mw_sizes = COST_EFFICIENCY_MW_SIZES
+    cost_per_mw = COST_EFFICIENCY_COST_PER_MW
     
     # Current system highlighting
-    current_power = analysis['system']['power']
-    current_cost_per_mw = analysis['costs']['total_cost'] / current_power
+    current_index, current_cost_per_mw = _current_system_point(analysis)
     
     # Create bar chart
     bars = ax.bar(mw_sizes, cost_per_mw, color='lightblue', alpha=0.7, edgecolor='navy')
     
     # Highlight current system
-    current_index = None
-    for i, mw in enumerate(mw_sizes):
-        if abs(mw - current_power) < 0.01:  # Find matching power
-            bars[i].set_color('#FF5722')
-            bars[i].set_alpha(1.0)
-            current_index = i
-            break
+    if current_index is not None:
+        bars[current_index].set_color('#FF5722')
+        bars[current_index].set_alpha(1.0)
     
     # Add trend line
     ax.plot(mw_sizes, cost_per_mw, 'r--', alpha=0.8, linewidth=2, label='Cost Trend')
     
     # Annotations
     if current_index is not None:
-        ax.annotate(f'Your System\n€{current_cost_per_mw:,.0f}/MW', 
+        ax.annotate(_cost_efficiency_label(current_cost_per_mw), 
                    xy=(mw_sizes[current_index], cost_per_mw[current_index]),
                    xytext=(mw_sizes[current_index], cost_per_mw[current_index] + 3000),
                    arrowprops=dict(arrowstyle='->', color='red', lw=2),
-                   ha='center', fontweight='bold', color='red')
+                   ha='center', fontweight='bold', color='red', gid='current_system')
     
     # Formatting
     ax.set_xlabel('System Size (MW)', fontweight='bold')
@@ -709,4 +749,727 @@ def create_cost_efficiency_chart(ax, analysis):
     ax.axhline(y=20000, color='green', linestyle=':', alpha=0.7, label='Excellent (<€20k/MW)')
     ax.axhline(y=30000, color='orange', linestyle=':', alpha=0.7, label='Good Threshold')
     
-    
\ No newline at end of file
+    
+
+# =============================================================================
+# SENSITIVITY CHARTS
+# =============================================================================
+
+def create_tornado_chart(ax, sensitivity, max_bars=None):
+    """
+    Create a tornado chart from a one-at-a-time sensitivity analysis.
+    
+    Args:
+        ax: Matplotlib axis to plot on
+        sensitivity: Result of core.sensitivity.run_sensitivity_analysis
+        max_bars: Optional limit on the number of inputs shown
+    """
+    entries = sensitivity['inputs'][:max_bars] if max_bars else sensitivity['inputs']
+    base_value = sensitivity['base_value']
+    
+    # Largest swing at the top
+    entries = list(reversed(entries))
+    y_positions = np.arange(len(entries))
+    low_deltas = [0.0 if np.isnan(e['low_delta']) else e['low_delta'] for e in entries]
+    high_deltas = [0.0 if np.isnan(e['high_delta']) else e['high_delta'] for e in entries]
+    
+    ax.barh(y_positions, low_deltas, left=base_value, color='#66b3ff', label='Low input')
+    ax.barh(y_positions, high_deltas, left=base_value, color='#ff6666', label='High input')
+    ax.axvline(base_value, color='black', linewidth=1)
+    
+    ax.set_yticks(y_positions)
+    ax.set_yticklabels([e['label'] for e in entries])
+    
+    # Annotate elasticities next to each bar
+    for y, entry, low, high in zip(y_positions, entries, low_deltas, high_deltas):
+        if not np.isnan(entry['elasticity']):
+            ax.text(base_value + max(low, high, 0), y, f"  ε={entry['elasticity']:.2f}",
+                    va='center', fontsize=9)
+    
+    # Title, label and tick format follow the analysed result column
+    output = sensitivity['output']
+    name = output.replace('_', ' ').title()
+    ax.set_title(f'{name} Sensitivity', fontsize=14, fontweight='bold')
+    if 'cost' in output.split('_'):
+        ax.set_xlabel(f'{name} (€)')
+        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+    else:
+        ax.set_xlabel(name)
+    ax.grid(True, axis='x', alpha=0.3)
+    ax.legend(loc='lower right')
+
+def display_tornado_chart(sensitivity, max_bars=None):
+    """
+    Display a tornado chart for a sensitivity analysis.
+    
+    Args:
+        sensitivity: Result of core.sensitivity.run_sensitivity_analysis
+        max_bars: Optional limit on the number of inputs shown
+    """
+    try:
+        fig, ax = plt.subplots(1, 1, figsize=(10, 6))
+        create_tornado_chart(ax, sensitivity, max_bars)
+        plt.tight_layout()
+        plt.show()
+        
+    except Exception as e:
+        print(f"Chart creation error: {str(e)}")
+        create_error_chart(str(e))
+
+# =============================================================================
+# DESIGN-SPACE HEATMAP
+# =============================================================================
+
+def _heatmap_extent(grid):
+    rows, cols = np.shape(grid)
+    return (-0.5, cols - 0.5, -0.5, rows - 0.5)
+
+def set_design_space_axes(ax, x_values, y_values, x_label, y_label):
+    """
+    Label the heatmap cells with the input values of a design-space slice.
+    
+    Args:
+        ax: Matplotlib axis holding the heatmap
+        x_values: Input values along the columns
+        y_values: Input values along the rows
+        x_label: X axis label
+        y_label: Y axis label
+    """
+    ax.set_xticks(np.arange(len(x_values)))
+    ax.set_xticklabels([f'{v:g}' for v in x_values])
+    ax.set_yticks(np.arange(len(y_values)))
+    ax.set_yticklabels([f'{v:g}' for v in y_values])
+    ax.set_xlim(-0.5, len(x_values) - 0.5)
+    ax.set_ylim(-0.5, len(y_values) - 0.5)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+
+def create_design_space_heatmap(ax, grid, x_values, y_values, x_label, y_label,
+                                metric_label, clim=None, cmap='viridis'):
+    """
+    Create a heatmap of one metric over two inputs.
+    
+    Args:
+        ax: Matplotlib axis to plot on
+        grid: 2D array (rows = y_values, columns = x_values); NaN cells
+              (no data) are left blank
+        x_values: Input values along the columns
+        y_values: Input values along the rows
+        x_label: X axis label
+        y_label: Y axis label
+        metric_label: Colorbar label
+        clim: Optional (vmin, vmax) color limits
+        cmap: Colormap name
+    
+    Returns:
+        Tuple of (AxesImage, Colorbar)
+    """
+    vmin, vmax = clim if clim else (None, None)
+    image = ax.imshow(np.ma.masked_invalid(grid), origin='lower', aspect='auto', cmap=cmap,
+                      vmin=vmin, vmax=vmax, interpolation='nearest', extent=_heatmap_extent(grid))
+    set_design_space_axes(ax, x_values, y_values, x_label, y_label)
+    
+    colorbar = ax.figure.colorbar(image, ax=ax)
+    colorbar.set_label(metric_label)
+    return image, colorbar
+
+def update_design_space_heatmap(image, grid):
+    """Replace the heatmap data in place (the slice shape may change)."""
+    image.set_data(np.ma.masked_invalid(grid))
+    image.set_extent(_heatmap_extent(grid))
+
+# =============================================================================
+# SCENARIO COMPARISON CHARTS
+# =============================================================================
+
+def _grouped_bar_offsets(count, width=0.8):
+    bar_width = width / max(count, 1)
+    return [(i - (count - 1) / 2) * bar_width for i in range(count)], bar_width
+
+def _category_labels(config):
+    # Config labels spell line breaks as a literal backslash-n
+    return [label.replace('\\n', '\n') for label in config['labels']]
+
+def create_comparison_charts(figure, analyses, labels):
+    """
+    Overlay several analyses: temperatures, flow rates and cost breakdown.
+    
+    Args:
+        figure: matplotlib.figure.Figure
+        analyses: List of analysis dictionaries ('system' and 'costs' used)
+        labels: Legend label per analysis
+    
+    Returns:
+        Dictionary of axes by panel name
+    """
+    axs = figure.subplots(1, 3)
+    axes = dict(zip(['temperatures', 'flow_rates', 'cost_breakdown'], axs))
+    colors = [f'C{i % 10}' for i in range(len(analyses))]
+    
+    # Temperatures: one line per scenario over T1..T4
+    config = CHART_CONFIG['charts']['temperatures']
+    ax = axes['temperatures']
+    for analysis, label, color in zip(analyses, labels, colors):
+        ax.plot(_category_labels(config), _temperature_values(analysis['system'])[0], marker='o', color=color, label=label)
+    ax.set_title(config['title'], fontsize=14, fontweight='bold')
+    ax.set_ylabel(config['ylabel'])
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=9)
+    
+    # Flow rates and cost breakdown: grouped bars
+    offsets, bar_width = _grouped_bar_offsets(len(analyses))
+    for name, values_of in (('flow_rates', lambda a: _flow_rate_values(a['system'])[0]),
+                            ('cost_breakdown', lambda a: _cost_breakdown_values(a['costs']))):
+        config = CHART_CONFIG['charts'][name]
+        ax = axes[name]
+        positions = np.arange(len(config['labels']))
+        for analysis, label, color, offset in zip(analyses, labels, colors, offsets):
+            ax.bar(positions + offset, values_of(analysis), bar_width, color=color, label=label)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(_category_labels(config))
+        ax.set_title(config['title'], fontsize=14, fontweight='bold')
+        ax.grid(True, axis='y', alpha=0.3)
+    
+    axes['flow_rates'].set_ylabel(CHART_CONFIG['charts']['flow_rates']['ylabel'])
+    axes['cost_breakdown'].set_ylabel('Cost (€)')
+    axes['cost_breakdown'].yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+    
+    figure.tight_layout()
+    return axes
+
+# =============================================================================
+# PERSISTENT CHART CANVAS
+# =============================================================================
+
+def _chart_title(system_data):
+    power_display = format_display_value(float(system_data['power']), 'temperature', False)
+    return f'Heat Reuse System Analysis - {power_display}MW System'
+
+def _artist_by_gid(artists, gid):
+    for artist in artists:
+        if artist.get_gid() == gid:
+            return artist
+    raise LookupError(f"No artist with gid '{gid}'")
+
+def _update_bar_chart(ax, values, labels):
+    """Set bar heights and move/relabel the value labels of a bar panel."""
+    bars, texts = ax.patches, ax.texts
+    if len(bars) != len(values) or len(texts) != len(values):
+        raise LookupError("Bar panel does not match the data")
+    
+    offset = _bar_label_offset(values)
+    for i, (bar, text, v, label) in enumerate(zip(bars, texts, values, labels)):
+        bar.set_height(v)
+        text.set_position((i, v + offset))
+        text.set_text(label)
+    
+    ax.relim()
+    ax.autoscale_view()
+
+def _update_temperature_chart(ax, analysis):
+    _update_bar_chart(ax, *_temperature_values(analysis['system']))
+
+def _update_flow_rates_chart(ax, analysis):
+    _update_bar_chart(ax, *_flow_rate_values(analysis['system']))
+
+def _update_cost_breakdown_chart(ax, analysis):
+    """Move the pie wedges, labels and percentages (same geometry as ax.pie)."""
+    config = CHART_CONFIG['charts']['cost_breakdown']
+    cost_values = _cost_breakdown_values(analysis['costs'])
+    
+    if config['type'] != 'pie':
+        _update_bar_chart(ax, cost_values, _cost_bar_labels(cost_values))
+        return
+    
+    wedges = ax.patches
+    texts = [t for t in ax.texts if t.get_text() in config['labels']]
+    autotexts = [t for t in ax.texts if t not in texts]
+    if not (len(wedges) == len(texts) == len(autotexts) == len(cost_values)):
+        raise LookupError("Pie panel does not match the data")
+    
+    total = sum(cost_values)
+    autopct = config.get('autopct', '%1.1f%%')
+    theta1 = 90 / 360  # startangle=90, counterclockwise
+    for wedge, text, autotext, value in zip(wedges, texts, autotexts, cost_values):
+        frac = value / total
+        theta2 = theta1 + frac
+        wedge.set_theta1(360 * theta1)
+        wedge.set_theta2(360 * theta2)
+        
+        thetam = np.pi * (theta1 + theta2)
+        x, y = np.cos(thetam), np.sin(thetam)
+        text.set_position((1.1 * x, 1.1 * y))
+        text.set_horizontalalignment('left' if x > 0 else 'right')
+        autotext.set_position((0.6 * x, 0.6 * y))
+        autotext.set_text(autopct % (100 * frac))
+        theta1 = theta2
+
+def _update_approach_profiles_chart(ax, analysis):
+    from core.original_calculations import calculate_combined_approach_profiles
+    
+    profiles = calculate_combined_approach_profiles(analysis['system'])
+    if not profiles or not profiles['tcs_profile'] or not profiles['fws_profile']:
+        raise LookupError("No approach profiles")
+    
+    for name, profile, offset in [('tcs', profiles['tcs_profile'], 1), ('fws', profiles['fws_profile'], -1)]:
+        line = _artist_by_gid(ax.lines, name)
+        line.set_data([t * 100 for t in profile['time_progression']], profile['temperatures'])
+        line.set_label(_profile_label(name.upper(), profile))
+        
+        start = _artist_by_gid(ax.texts, f'{name}_start')
+        start.set_text(f'{name.upper()} Start\n{profile["start_temp"]:.0f}°C')
+        start.xy = (0, profile['temperatures'][0])
+        start.set_position((10, profile['temperatures'][0] + offset))
+    
+    ax.legend(loc='best')
+    ax.set_ylim(*_profile_ylim(profiles['tcs_profile'], profiles['fws_profile']))
+
+def _update_effectiveness_gauge(ax, analysis):
+    effectiveness = calculate_effectiveness(analysis)
+    _artist_by_gid(ax.lines, 'needle').set_data(*_needle_xy(effectiveness))
+    _artist_by_gid(ax.texts, 'effectiveness').set_text(f'{effectiveness:.1%}')
+
+def _update_cost_efficiency_chart(ax, analysis):
+    current_index, current_cost_per_mw = _current_system_point(analysis)
+    bars = ax.patches
+    if len(bars) != len(COST_EFFICIENCY_MW_SIZES):
+        raise LookupError("Cost efficiency panel does not match the data")
+    
+    for i, bar in enumerate(bars):
+        if i == current_index:
+            bar.set_color('#FF5722')
+            bar.set_alpha(1.0)
+        else:
+            bar.set_facecolor('lightblue')
+            bar.set_edgecolor('navy')
+            bar.set_alpha(0.7)
+    
+    if current_index is None:
+        for text in ax.texts:
+            if text.get_gid() == 'current_system':
+                text.set_visible(False)
+        return
+    
+    annotation = _artist_by_gid(ax.texts, 'current_system')
+    x, y = COST_EFFICIENCY_MW_SIZES[current_index], COST_EFFICIENCY_COST_PER_MW[current_index]
+    annotation.set_text(_cost_efficiency_label(current_cost_per_mw))
+    annotation.xy = (x, y)
+    annotation.set_position((x, y + 3000))
+    annotation.set_visible(True)
+
+def _system_key(analysis, *fields):
+    return tuple(analysis['system'][field] for field in fields)
+
+def _approach_profiles_key(analysis):
+    from core.original_calculations import calculate_combined_approach_profiles
+    
+    profiles = calculate_combined_approach_profiles(analysis['system']) or {}
+    return tuple(
+        (tuple(profile['time_progression']), tuple(profile['temperatures']),
+         profile['start_temp'], profile['target_temp']) if profile else None
+        for profile in (profiles.get('tcs_profile'), profiles.get('fws_profile'))
+    )
+
+def _cost_efficiency_key(analysis):
+    # Off the size grid the panel shows no system, whatever it costs
+    current_index, current_cost_per_mw = _current_system_point(analysis)
+    if current_index is None:
+        return None
+    return current_index, _cost_efficiency_label(current_cost_per_mw)
+
+# Panels of the 2x3 system chart grid. 'key' is what a panel draws from
+# the analysis: a panel whose key is unchanged is not touched at all.
+# 'update' changes the panel's artists in place and raises LookupError if
+# they no longer fit the data, in which case the panel is rebuilt.
+CHART_PANELS = {
+    'cost_breakdown': {
+        'position': (0, 0),
+        'key': lambda a: (CHART_CONFIG['charts']['cost_breakdown']['type'],
+                          tuple(_cost_breakdown_values(a['costs']))),
+        'create': lambda ax, a: create_cost_breakdown_chart(ax, a['costs']),
+        'update': _update_cost_breakdown_chart,
+    },
+    'approach_profiles': {
+        'position': (0, 1),
+        'key': _approach_profiles_key,
+        'create': lambda ax, a: create_approach_profiles_chart(ax, a['system']),
+        'update': _update_approach_profiles_chart,
+    },
+    'effectiveness': {
+        'position': (0, 2),
+        'key': calculate_effectiveness,
+        'create': lambda ax, a: create_effectiveness_gauge(ax, calculate_effectiveness(a)),
+        'update': _update_effectiveness_gauge,
+    },
+    'flow_rates': {
+        'position': (1, 0),
+        'key': lambda a: _system_key(a, 'F1', 'F2'),
+        'create': lambda ax, a: create_flow_rates_chart(ax, a['system']),
+        'update': _update_flow_rates_chart,
+    },
+    'temperatures': {
+        'position': (1, 1),
+        'key': lambda a: _system_key(a, 'T1', 'T2', 'T3', 'T4'),
+        'create': lambda ax, a: create_temperature_chart(ax, a['system']),
+        'update': _update_temperature_chart,
+    },
+    'cost_efficiency': {
+        'position': (1, 2),
+        'key': _cost_efficiency_key,
+        'create': create_cost_efficiency_chart,
+        'update': _update_cost_efficiency_chart,
+    },
+}
+
+def canvas_png(canvas, box=None):
+    """
+    Fast PNG encoding of a drawn Agg canvas.
+    
+    Args:
+        canvas: FigureCanvasAgg that has been drawn
+        box: Optional pixel rectangle (x0, y0, x1, y1), origin bottom left
+    
+    Returns:
+        PNG bytes
+    """
+    pixels = np.asarray(canvas.buffer_rgba())
+    if box is not None:
+        x0, y0, x1, y1 = box
+        height = pixels.shape[0]
+        pixels = pixels[height - y1:height - y0, x0:x1]
+    from PIL import Image as PILImage
+    
+    # The figure background is opaque, so RGB encodes faster at no loss
+    buffer = io.BytesIO()
+    PILImage.fromarray(np.ascontiguousarray(pixels[:, :, :3])).save(buffer, format='png', compress_level=1)
+    return buffer.getvalue()
+
+def create_system_dashboard(figure, analysis):
+    """
+    Draw the 2x3 system charts onto a Figure without pyplot.
+    
+    Args:
+        figure: matplotlib.figure.Figure (e.g. with a FigureCanvasAgg)
+        analysis: Complete system analysis dictionary
+    
+    Returns:
+        Tuple of (axes by panel name, suptitle Text)
+    """
+    axs = figure.subplots(2, 3)
+    axes = {}
+    for name, panel in CHART_PANELS.items():
+        axes[name] = axs[panel['position']]
+        panel['create'](axes[name], analysis)
+    
+    title = figure.suptitle(_chart_title(analysis['system']), fontsize=16, fontweight='bold')
+    figure.tight_layout()
+    return axes, title
+
+# Growth of a panel beyond its laid-out extent that is still drawn in place
+EXTENT_TOLERANCE_PX = 0.5
+
+def _data_artists(ax):
+    """Patches, lines, texts and legend of an axes, in the order Axes.draw draws them."""
+    data = set(ax.patches) | set(ax.lines) | set(ax.texts)
+    if ax.legend_ is not None:
+        data.add(ax.legend_)
+    return sorted((artist for artist in ax.get_children() if artist in data), key=lambda a: a.get_zorder())
+
+def _text_extent(text, renderer):
+    # Annotation.get_window_extent also lays out the arrow, which is slow
+    if isinstance(text, Annotation):
+        text.update_positions(renderer)
+    return Text.get_window_extent(text, renderer)
+
+def _frame_key(ax):
+    # What the frame (spines, ticks, grid, labels, title) of a panel is drawn from
+    return ax.get_xlim(), ax.get_ylim(), ax.get_title(), ax.get_xlabel(), ax.get_ylabel(), ax.axison
+
+class SystemChartCanvas:
+    """
+    Persistent 2x3 system chart figure that is updated in place.
+    
+    The figure, its layout and the artists of every panel are created on
+    the first update(). Later updates compare what each panel draws with
+    the previous analysis, update the artists of the changed panels in
+    place (bar heights, pie wedges, profile lines, gauge needle, labels)
+    and redraw only those panels' regions of the Agg canvas; unchanged
+    panels are skipped. Each panel is drawn as its frame (spines, ticks,
+    grid, labels, title) with the data artists on top, and the pixels of
+    the frame are kept: a changed panel whose limits and titles are
+    unchanged only has its data artists drawn again over the kept frame.
+    
+    The layout is kept while the changed panels' tick labels, titles and
+    annotations stay within their extents at the last layout; a panel
+    that grows past them makes the whole figure lay out and draw again,
+    as a fresh canvas would. Panels that shrink keep the roomier layout,
+    so the canvas can differ slightly from a fresh one. In a notebook the
+    canvas is shown as a grid of image widgets, one per panel, so only
+    changed panels are re-encoded and re-sent to the browser.
+    """
+    
+    def __init__(self, figsize=(18, 10), dpi=100):
+        """
+        Args:
+            figsize: Figure size in inches
+            dpi: Canvas resolution
+        """
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        # tight_layout of a fresh figure starts from these subplot positions
+        self._initial_subplotpars = self._subplot_params()
+        self.axes = {}
+        self.stats = {'updates': 0, 'panels_drawn': 0, 'panels_skipped': 0,
+                      'frames_drawn': 0, 'relayouts': 0}
+        
+        self._title = None
+        self._keys = {}
+        self._cells = {}
+        self._extents = {}
+        self._frames = {}
+        self._backgrounds = {}
+        self._images = {}
+        self._widget = None
+    
+    def update(self, analysis):
+        """
+        Show an analysis, redrawing only the panels whose inputs changed.
+        
+        Args:
+            analysis: Complete system analysis dictionary
+        
+        Returns:
+            List of redrawn panel names ('title' for the figure title)
+        """
+        keys = {name: panel['key'](analysis) for name, panel in CHART_PANELS.items()}
+        keys['title'] = _chart_title(analysis['system'])
+        
+        if not self.axes:
+            self._build(analysis)
+            changed = list(keys)
+        else:
+            changed = [name for name in keys if keys[name] != self._keys.get(name)]
+            reframed = set()
+            for name in changed:
+                if self._update_panel(name, analysis) or \
+                        (name != 'title' and _frame_key(self.axes[name]) != self._frames[name]):
+                    reframed.add(name)
+            
+            if self._outgrown(changed, reframed):
+                # Changed tick labels, titles or annotations no longer fit the layout
+                self._relayout()
+                self.stats['relayouts'] += 1
+                changed = list(keys)
+            else:
+                self._redraw(changed, reframed)
+        
+        self._keys = keys
+        self.stats['updates'] += 1
+        self.stats['panels_drawn'] += len(changed)
+        self.stats['panels_skipped'] += len(keys) - len(changed)
+        
+        width = self.canvas.get_width_height()[0]
+        for name in changed:
+            if name in self._images:
+                x0, _, x1, _ = self._cells[name]
+                self._images[name].value = self.panel_png(name)
+                self._images[name].layout.width = f'{100 * (x1 - x0) / width:.4f}%'
+        return changed
+    
+    def _build(self, analysis):
+        self.axes, self._title = create_system_dashboard(self.figure, analysis)
+        self._draw_all()
+    
+    def _draw_all(self):
+        """Draw the whole figure, keeping each panel's frame pixels."""
+        data = {name: _data_artists(ax) for name, ax in self.axes.items()}
+        for artists in data.values():
+            for artist in artists:
+                artist.set_animated(True)
+        self.canvas.draw()
+        for artists in data.values():
+            for artist in artists:
+                artist.set_animated(False)
+        
+        self._extents = self._panel_extents()
+        self._cells = self._panel_cells()
+        for name, ax in self.axes.items():
+            self._frames[name] = _frame_key(ax)
+            self._backgrounds[name] = self._cell_pixels(name).copy()
+            for artist in data[name]:
+                self.figure.draw_artist(artist)
+        self.stats['frames_drawn'] += len(self.axes)
+    
+    def _panel_extents(self):
+        """Pixel extents of the panels (axes with labels; vertical extent of the title)."""
+        renderer = self.canvas.get_renderer()
+        extents = {name: tuple(ax.get_tightbbox(renderer).extents) for name, ax in self.axes.items()}
+        title = self._title.get_window_extent(renderer)
+        extents['title'] = (title.y0, title.y1)
+        return extents
+    
+    def _subplot_params(self):
+        params = self.figure.subplotpars
+        return {name: getattr(params, name) for name in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')}
+    
+    def _outgrown(self, names, reframed):
+        """True if a changed panel now extends past its extent at the last layout."""
+        renderer = self.canvas.get_renderer()
+        for name in names:
+            if name == 'title':
+                continue
+            ax = self.axes[name]
+            # Lines, patches and legends stay inside the axes; only texts and
+            # annotations (whose arrows point into the axes) can reach past them
+            boxes = [_text_extent(artist, renderer) for artist in _data_artists(ax)
+                     if isinstance(artist, Text) and artist.get_visible() and artist.get_text()]
+            if name in reframed:
+                boxes.append(ax.get_tightbbox(renderer, bbox_extra_artists=[]))
+            if not boxes:
+                continue
+            x0, y0, x1, y1 = Bbox.union(boxes).extents
+            cx0, cy0, cx1, cy1 = self._extents[name]
+            if x0 < cx0 - EXTENT_TOLERANCE_PX or y0 < cy0 - EXTENT_TOLERANCE_PX or \
+                    x1 > cx1 + EXTENT_TOLERANCE_PX or y1 > cy1 + EXTENT_TOLERANCE_PX:
+                return True
+        return False
+    
+    def _relayout(self):
+        """Lay the figure out again as a fresh canvas would, and draw all of it."""
+        self.figure.subplots_adjust(**self._initial_subplotpars)
+        self.figure.tight_layout()
+        self._draw_all()
+    
+    def _update_panel(self, name, analysis):
+        """Update a panel's artists; True if the panel had to be created again."""
+        if name == 'title':
+            self._title.set_text(_chart_title(analysis['system']))
+            return False
+        
+        panel = CHART_PANELS[name]
+        ax = self.axes[name]
+        try:
+            panel['update'](ax, analysis)
+            return False
+        except LookupError:
+            # Artists no longer fit (e.g. a profile became unavailable)
+            ax.clear()
+            panel['create'](ax, analysis)
+            return True
+    
+    def _cell_pixels(self, name):
+        # The Agg buffer is writable and has its origin at the top left
+        pixels = np.asarray(self.canvas.buffer_rgba())
+        x0, y0, x1, y1 = self._cells[name]
+        return pixels[pixels.shape[0] - y1:pixels.shape[0] - y0, x0:x1]
+    
+    def _redraw(self, names, reframed):
+        """
+        Draw the given panels again: the reframed ones in full, the others
+        as their data artists over the kept frame pixels.
+        """
+        background = np.round(np.array(to_rgba(self.figure.get_facecolor())) * 255).astype(np.uint8)
+        for name in names:
+            if name == 'title':
+                self._cell_pixels(name)[:] = background
+                self.figure.draw_artist(self._title)
+                continue
+            
+            ax = self.axes[name]
+            data = _data_artists(ax)
+            if name in reframed:
+                self._cell_pixels(name)[:] = background
+                for artist in data:
+                    artist.set_animated(True)
+                self.figure.draw_artist(ax)
+                for artist in data:
+                    artist.set_animated(False)
+                self._frames[name] = _frame_key(ax)
+                self._backgrounds[name] = self._cell_pixels(name).copy()
+                self.stats['frames_drawn'] += 1
+            else:
+                self._cell_pixels(name)[:] = self._backgrounds[name]
+            
+            for artist in data:
+                self.figure.draw_artist(artist)
+    
+    def _panel_cells(self):
+        """
+        Split the canvas into one pixel rectangle (x0, y0, x1, y1) per panel,
+        with borders halfway between neighbouring panels' extents.
+        """
+        width, height = self.canvas.get_width_height()
+        extents = self._extents
+        
+        def borders(spans, size):
+            edges = [0]
+            for (_, upper), (lower, _) in zip(spans, spans[1:]):
+                edges.append(int(round((upper + lower) / 2)))
+            return edges + [size]
+        
+        columns = [(min(extents[n][0] for n, p in CHART_PANELS.items() if p['position'][1] == col),
+                    max(extents[n][2] for n, p in CHART_PANELS.items() if p['position'][1] == col))
+                   for col in range(3)]
+        rows = [(min(extents[n][1] for n, p in CHART_PANELS.items() if p['position'][0] == row),
+                 max(extents[n][3] for n, p in CHART_PANELS.items() if p['position'][0] == row))
+                for row in (1, 0)] + [extents['title']]
+        
+        x_edges = borders(columns, width)
+        y_edges = borders(rows, height)  # bottom to top: row 1, row 0, title
+        
+        cells = {'title': (0, y_edges[2], width, height)}
+        for name, panel in CHART_PANELS.items():
+            row, col = panel['position']
+            cells[name] = (x_edges[col], y_edges[1 - row], x_edges[col + 1], y_edges[2 - row])
+        return cells
+    
+    def panel_png(self, name):
+        """PNG bytes of one panel's cell ('title' for the figure title)."""
+        return canvas_png(self.canvas, self._cells[name])
+    
+    def to_png(self):
+        """PNG bytes of the whole figure as currently drawn."""
+        return canvas_png(self.canvas)
+    
+    @property
+    def widget(self):
+        """ipywidgets view: the title above a 2x3 grid of panel images."""
+        if self._widget is None:
+            import ipywidgets as widgets
+            
+            width = self.canvas.get_width_height()[0]
+            for name, (x0, y0, x1, y1) in self._cells.items():
+                self._images[name] = widgets.Image(
+                    value=self.panel_png(name), format='png',
+                    layout=widgets.Layout(width=f'{100 * (x1 - x0) / width:.4f}%', height='auto', margin='0')
+                )
+            
+            rows = [[name for name, panel in CHART_PANELS.items() if panel['position'][0] == row]
+                    for row in (0, 1)]
+            self._widget = widgets.VBox(
+                [self._images['title']] +
+                [widgets.HBox([self._images[name] for name in row], layout=widgets.Layout(margin='0'))
+                 for row in rows]
+            )
+        return self._widget
+
+# One persistent canvas per chart output area
+_chart_canvases = weakref.WeakKeyDictionary()
+
+def get_chart_canvas(output_area):
+    """
+    Get the persistent chart canvas of an output area, creating it on first use.
+    
+    Args:
+        output_area: Output widget the charts are displayed in
+    
+    Returns:
+        SystemChartCanvas
+    """
+    if output_area not in _chart_canvases:
+        _chart_canvases[output_area] = SystemChartCanvas()
+    return _chart_canvases[output_area]
+
+def reset_chart_canvas(output_area):
+    """Drop the persistent canvas of an output area (rebuilt on next use)."""
+    _chart_canvases.pop(output_area, None)
@@ -3,8 +3,6 @@ UI Configuration - All UI settings in one place for easy maintenance
 Extracted from Interactive Analysis Tool.ipynb
 """
 
-import ipywidgets as widgets
-
 # =============================================================================
 # DROPDOWN CONFIGURATION - Easy to modify for global deployment
 # =============================================================================
@@ -119,7 +117,8 @@ CHART_CONFIG = {
         'figure_size': (14, 14),  
         'subplot_rows': 3,        
         'subplot_cols': 2,
-        'style': 'ggplot'
+        'style': 'ggplot',
+        'incremental_updates': True  # Keep one chart canvas and redraw only changed panels
     },
     'charts': {
         'temperatures': {
@@ -175,6 +174,22 @@ CHART_CONFIG = {
 }
 
 
+# =============================================================================
+# DESIGN-SPACE EXPLORER CONFIGURATION
+# =============================================================================
+
+DESIGN_SPACE_CONFIG = {
+    'metrics': {
+        'total_cost': {'label': 'Total Cost (€)', 'cmap': 'viridis_r'},
+        'cost_per_mw': {'label': 'Cost per MW (€/MW)', 'cmap': 'viridis_r'},
+        'effectiveness': {'label': 'HX Effectiveness', 'cmap': 'viridis'}
+    },
+    'default_metric': 'total_cost',
+    'default_axes': ('t1', 'approach'),  # (x, y); the other inputs get sliders
+    'figure_size': (8, 5.5),
+    'dpi': 100
+}
+
 # =============================================================================
 # ERROR AND SUCCESS MESSAGE STYLING
 # =============================================================================
@@ -226,6 +241,38 @@ OUTPUT_CONFIG = {
     }
 }
 
+# =============================================================================
+# BATCH RESULTS CONFIGURATION
+# =============================================================================
+
+BATCH_CONFIG = {
+    'max_workers': None,          # Worker processes (1 = in the kernel, None = one per CPU)
+    'table_max_rows': 200,        # Rows rendered in the results table (exports include all)
+    'default_sort': 'total_cost',
+    'export_path': 'batch_results',  # Extension is added per format
+    'progress_color': '#4CAF50'
+}
+
+# =============================================================================
+# EXPORT CONFIGURATION
+# =============================================================================
+
+EXPORT_CONFIG = {
+    'path': 'exports/heat_reuse_results',  # Extension is added per format
+    'format': 'csv'                        # 'csv', 'jsonl' or 'parquet'
+}
+
+# =============================================================================
+# SESSION HISTORY CONFIGURATION
+# =============================================================================
+
+HISTORY_CONFIG = {
+    'enabled': True,          # Record every displayed analysis
+    'capacity': 50,           # Entries kept (pinned entries included)
+    'figure_size': (18, 5),   # Comparison charts
+    'dpi': 100
+}
+
 # =============================================================================
 # INTERNATIONALIZATION SUPPORT (for future use)
 # =============================================================================
@@ -0,0 +1,297 @@
+"""
+Design-Space Explorer
+
+Heatmap of total cost, cost per MW or HX effectiveness over two chosen
+inputs (e.g. T1 × approach), with the remaining inputs set by sliders.
+
+The explorer is fed by a precomputed sweep (a run_batch_analysis results
+table). The sweep is turned into one dense array per metric, indexed by
+the four inputs, when the explorer is created; moving a slider or picking
+another metric only slices those arrays and replaces the image data of
+the existing heatmap. No analysis is rerun.
+"""
+
+import numpy as np
+import ipywidgets as widgets
+from IPython.display import display
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.batch_analysis import INPUT_COLUMNS, analysis_from_row, build_parameter_grid, run_batch_analysis
+from .config import UI_CONFIG, DESIGN_SPACE_CONFIG
+from .inputs import create_dropdown_widget, create_slider_widget
+from .charts import (create_design_space_heatmap, update_design_space_heatmap,
+                     set_design_space_axes, canvas_png)
+from .formatting import calculate_effectiveness
+from .batch import create_batch_progress, create_progress_callback
+
+# =============================================================================
+# SWEEP DATA
+# =============================================================================
+
+def run_design_sweep(max_workers=None, progress_callback=None, **values):
+    """
+    Analyse the full grid of input options for the explorer.
+
+    Args:
+        max_workers: Worker processes (see run_batch_analysis)
+        progress_callback: Optional callable(done, total)
+        **values: Optional input values per input name; defaults to the
+                  dropdown options in UI_CONFIG
+
+    Returns:
+        Results DataFrame (ANALYSIS_COLUMNS)
+    """
+    grid = {name: values.get(name, UI_CONFIG['dropdowns'][name]['options']) for name in INPUT_COLUMNS}
+    return run_batch_analysis(build_parameter_grid(**grid), max_workers=max_workers,
+                              progress_callback=progress_callback)
+
+def sweep_metric_values(sweep, metric):
+    """
+    One explorer metric for every row of a sweep table (NaN where unavailable).
+
+    Args:
+        sweep: Results DataFrame (ANALYSIS_COLUMNS)
+        metric: 'total_cost', 'cost_per_mw' or 'effectiveness'
+
+    Returns:
+        numpy array aligned with the sweep rows
+    """
+    success = (sweep['status'] == 'success').to_numpy()
+
+    if metric == 'total_cost':
+        values = sweep['total_cost'].to_numpy(dtype=float)
+    elif metric == 'cost_per_mw':
+        values = sweep['total_cost'].to_numpy(dtype=float) / sweep['power_mw'].to_numpy(dtype=float)
+    elif metric == 'effectiveness':
+        values = np.array([calculate_effectiveness(analysis_from_row(row)) if ok else np.nan
+                           for ok, row in zip(success, sweep.to_dict('records'))], dtype=float)
+    else:
+        raise ValueError(f"❌ Unknown metric '{metric}'. Use one of: {list(DESIGN_SPACE_CONFIG['metrics'])}")
+
+    return np.where(success, values, np.nan)
+
+class DesignSpace:
+    """
+    Dense metric arrays over the four inputs of a sweep.
+
+    Each metric is stored as an array with one axis per input (power, t1,
+    temp_diff, approach in INPUT_COLUMNS order) over the distinct values
+    found in the sweep; combinations without a successful result are NaN.
+    If the sweep holds several rows for one operating point (e.g. cost
+    overrides), the last one is used.
+    """
+
+    def __init__(self, sweep, metrics=None):
+        """
+        Args:
+            sweep: Results DataFrame (ANALYSIS_COLUMNS)
+            metrics: Metric names to precompute (default: all configured)
+        """
+        metrics = metrics or list(DESIGN_SPACE_CONFIG['metrics'])
+
+        self.axes = {name: np.sort(sweep[name].dropna().unique()) for name in INPUT_COLUMNS}
+        shape = tuple(len(self.axes[name]) for name in INPUT_COLUMNS)
+
+        known = sweep[INPUT_COLUMNS].notna().all(axis=1).to_numpy()
+        index = tuple(np.searchsorted(self.axes[name], sweep[name].to_numpy()[known]) for name in INPUT_COLUMNS)
+
+        self.values = {}
+        self.ranges = {}
+        for metric in metrics:
+            cube = np.full(shape, np.nan)
+            cube[index] = sweep_metric_values(sweep, metric)[known]
+            self.values[metric] = cube
+            self.ranges[metric] = (np.nanmin(cube), np.nanmax(cube)) if np.isfinite(cube).any() else None
+
+    def slice(self, metric, x, y, fixed):
+        """
+        2D slice of a metric over two inputs.
+
+        Args:
+            metric: Precomputed metric name
+            x: Input along the columns
+            y: Input along the rows
+            fixed: Values of the other two inputs, e.g. {'power': 2, 'temp_diff': 12}
+
+        Returns:
+            Array of shape (len(axes[y]), len(axes[x]))
+        """
+        indexer = tuple(slice(None) if name in (x, y)
+                        else int(np.searchsorted(self.axes[name], fixed[name]))
+                        for name in INPUT_COLUMNS)
+        plane = self.values[metric][indexer]
+
+        # Remaining axes are in INPUT_COLUMNS order; rows must be y
+        if INPUT_COLUMNS.index(x) < INPUT_COLUMNS.index(y):
+            plane = plane.T
+        return plane
+
+# =============================================================================
+# EXPLORER PANEL
+# =============================================================================
+
+def _input_label(name):
+    return UI_CONFIG['dropdowns'][name]['label'].rstrip(':')
+
+class DesignSpaceExplorer:
+    """
+    Interactive heatmap over a precomputed design space.
+
+    Example:
+        >>> explorer = DesignSpaceExplorer(run_design_sweep())
+        >>> display(explorer.widget)
+    """
+
+    def __init__(self, sweep, metric=None, x=None, y=None):
+        """
+        Args:
+            sweep: Results DataFrame (ANALYSIS_COLUMNS)
+            metric: Initial metric (default: DESIGN_SPACE_CONFIG['default_metric'])
+            x: Initial column input (default: DESIGN_SPACE_CONFIG['default_axes'][0])
+            y: Initial row input (default: DESIGN_SPACE_CONFIG['default_axes'][1])
+        """
+        self.space = DesignSpace(sweep)
+        default_x, default_y = DESIGN_SPACE_CONFIG['default_axes']
+        input_options = [(_input_label(name), name) for name in INPUT_COLUMNS]
+
+        self.metric_widget = create_dropdown_widget(
+            options=[(spec['label'], name) for name, spec in DESIGN_SPACE_CONFIG['metrics'].items()],
+            default=metric or DESIGN_SPACE_CONFIG['default_metric'],
+            label='Metric:'
+        )
+        self.x_widget = create_dropdown_widget(input_options, x or default_x, 'X axis:')
+        self.y_widget = create_dropdown_widget(input_options, y or default_y, 'Y axis:')
+        self.sliders = {
+            name: create_slider_widget(
+                options=[float(v) for v in self.space.axes[name]],
+                default=float(self._slider_default(name)),
+                label=UI_CONFIG['dropdowns'][name]['label'],
+                tooltip=UI_CONFIG['dropdowns'][name].get('tooltip', '')
+            )
+            for name in INPUT_COLUMNS
+        }
+
+        self.figure = Figure(figsize=DESIGN_SPACE_CONFIG['figure_size'], dpi=DESIGN_SPACE_CONFIG['dpi'])
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(1, 1, 1)
+
+        spec = DESIGN_SPACE_CONFIG['metrics'][self.metric]
+        self.image, self.colorbar = create_design_space_heatmap(
+            self.ax, self.grid(), self.space.axes[self.x], self.space.axes[self.y],
+            _input_label(self.x), _input_label(self.y), spec['label'],
+            clim=self.space.ranges[self.metric], cmap=spec['cmap']
+        )
+        self.ax.set_title(self._title(), fontsize=12, fontweight='bold')
+        self.figure.tight_layout()
+
+        self.image_widget = widgets.Image(format='png')
+        self.stats = {'redraws': 0}
+
+        self.metric_widget.observe(lambda change: self._on_metric(), names='value')
+        self.x_widget.observe(lambda change: self._on_axis('x', change), names='value')
+        self.y_widget.observe(lambda change: self._on_axis('y', change), names='value')
+        for slider in self.sliders.values():
+            slider.observe(lambda change: self.refresh(), names='value')
+
+        self._widget = None
+        self._swapping = False
+        self._show_sliders()
+        self.refresh()
+
+    def _slider_default(self, name):
+        default = UI_CONFIG['dropdowns'][name]['default']
+        return default if default in self.space.axes[name] else self.space.axes[name][0]
+
+    @property
+    def metric(self):
+        return self.metric_widget.value
+
+    @property
+    def x(self):
+        return self.x_widget.value
+
+    @property
+    def y(self):
+        return self.y_widget.value
+
+    def grid(self):
+        """Current 2D slice of the selected metric."""
+        fixed = {name: slider.value for name, slider in self.sliders.items()}
+        return self.space.slice(self.metric, self.x, self.y, fixed)
+
+    def _title(self):
+        fixed = ', '.join(f"{_input_label(name)} = {self.sliders[name].value:g}"
+                          for name in INPUT_COLUMNS if name not in (self.x, self.y))
+        return f"{DESIGN_SPACE_CONFIG['metrics'][self.metric]['label']}\n{fixed}"
+
+    def refresh(self):
+        """Show the current slice (new image data only, nothing recalculated)."""
+        update_design_space_heatmap(self.image, self.grid())
+        self.ax.set_title(self._title(), fontsize=12, fontweight='bold')
+        self.canvas.draw()
+        self.image_widget.value = canvas_png(self.canvas)
+        self.stats['redraws'] += 1
+
+    def _on_metric(self):
+        spec = DESIGN_SPACE_CONFIG['metrics'][self.metric]
+        clim = self.space.ranges[self.metric]
+        if clim:
+            self.image.set_clim(*clim)
+        self.image.set_cmap(spec['cmap'])
+        self.colorbar.set_label(spec['label'])
+        self.refresh()
+
+    def _on_axis(self, which, change):
+        # Picking the other axis' input swaps the two axes
+        if self._swapping:
+            return
+        other = self.y_widget if which == 'x' else self.x_widget
+        if other.value == change['new']:
+            self._swapping = True
+            try:
+                other.value = change['old']
+            finally:
+                self._swapping = False
+
+        set_design_space_axes(self.ax, self.space.axes[self.x], self.space.axes[self.y],
+                              _input_label(self.x), _input_label(self.y))
+        self._show_sliders()
+        self.refresh()
+
+    def _show_sliders(self):
+        for name, slider in self.sliders.items():
+            slider.layout.display = 'none' if name in (self.x, self.y) else None
+
+    @property
+    def widget(self):
+        """Controls above the heatmap image."""
+        if self._widget is None:
+            self._widget = widgets.VBox([
+                self.metric_widget,
+                widgets.HBox([self.x_widget, self.y_widget]),
+                widgets.VBox([self.sliders[name] for name in INPUT_COLUMNS]),
+                self.image_widget
+            ])
+        return self._widget
+
+def display_design_space_explorer(sweep=None, max_workers=None):
+    """
+    Display the design-space explorer, running the sweep first if needed.
+
+    Args:
+        sweep: Precomputed results DataFrame (default: run_design_sweep())
+        max_workers: Worker processes for the sweep
+
+    Returns:
+        DesignSpaceExplorer
+    """
+    if sweep is None:
+        progress = create_batch_progress(0)
+        display(progress)
+        sweep = run_design_sweep(max_workers=max_workers, progress_callback=create_progress_callback(progress))
+        progress.layout.display = 'none'
+
+    explorer = DesignSpaceExplorer(sweep)
+    display(explorer.widget)
+    return explorer
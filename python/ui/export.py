@@ -0,0 +1,173 @@
+"""
+Headless Dashboard Export
+
+Renders the 2x3 system chart dashboard for every scenario of a batch
+results table (core.batch_analysis.run_batch_analysis) to PNG and/or SVG
+files. Each dashboard is drawn on its own Agg figure without pyplot, so
+scenarios render in parallel across a process pool. A failing scenario is
+recorded in the manifest and does not stop the export.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Optional, List, Any, Tuple
+
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.batch_analysis import INPUT_COLUMNS, analysis_from_row
+from .charts import create_system_dashboard
+
+# File formats the dashboard can be written in
+EXPORT_FORMATS = ('png', 'svg')
+
+# Dashboard size (same as the notebook charts)
+DASHBOARD_FIGSIZE = (18, 10)
+
+MANIFEST_FILENAME = 'manifest.csv'
+MANIFEST_COLUMNS = INPUT_COLUMNS + ['scenario', 'status', 'files', 'error', 'render_seconds']
+
+
+def _format_number(value) -> str:
+    """Compact, filename-safe number: 2.0 -> '2', 2.5 -> '2p5'."""
+    return f"{float(value):g}".replace('.', 'p').replace('-', 'm')
+
+
+def scenario_filename(index: int, row, fmt: str = 'png') -> str:
+    """
+    Deterministic file name for one scenario's dashboard.
+
+    The name starts with the scenario's row position (so files sort in
+    table order) followed by its inputs.
+
+    Example:
+        >>> scenario_filename(7, {'power': 2, 't1': 30, 'temp_diff': 12, 'approach': 2.5})
+        'scenario_0007_2MW_t1-30_dt-12_app-2p5.png'
+    """
+    return (f"scenario_{index:04d}_{_format_number(row['power'])}MW"
+            f"_t1-{_format_number(row['t1'])}_dt-{_format_number(row['temp_diff'])}"
+            f"_app-{_format_number(row['approach'])}.{fmt}")
+
+
+def render_dashboard(analysis: Dict[str, Any], paths: List[str], dpi: int = 100) -> None:
+    """
+    Draw one dashboard and write it to each path (format from the extension).
+
+    Args:
+        analysis: Analysis dictionary with 'system', 'sizing' and 'costs'
+        paths: Output files, e.g. ['.../scenario_0000_1MW....png']
+        dpi: Resolution of raster formats
+    """
+    figure = Figure(figsize=DASHBOARD_FIGSIZE)
+    FigureCanvasAgg(figure)
+    create_system_dashboard(figure, analysis)
+
+    for path in paths:
+        figure.savefig(path, dpi=dpi)
+
+
+def _export_scenario(task: Tuple[int, Dict[str, Any], str, Tuple[str, ...], int]) -> Dict[str, Any]:
+    """Render one scenario (process-pool worker); never raises."""
+    index, row, output_dir, formats, dpi = task
+    start = time.perf_counter()
+    record = {column: row.get(column) for column in INPUT_COLUMNS}
+    record.update({'scenario': index, 'files': '', 'error': ''})
+
+    analysis = analysis_from_row(row)
+    if analysis is None:
+        record.update({'status': 'skipped', 'error': f"status {row.get('status')}", 'render_seconds': 0.0})
+        return record
+
+    paths = [os.path.join(output_dir, scenario_filename(index, row, fmt)) for fmt in formats]
+    try:
+        render_dashboard(analysis, paths, dpi)
+        record.update({'status': 'ok', 'files': ';'.join(os.path.basename(p) for p in paths)})
+    except Exception as e:
+        record.update({'status': 'failed', 'error': f"{type(e).__name__}: {e}"})
+
+    record['render_seconds'] = time.perf_counter() - start
+    return record
+
+
+def export_dashboards(results: pd.DataFrame, output_dir: str, formats=('png',), dpi: int = 100,
+                      max_workers: Optional[int] = None, progress_callback=None) -> Dict[str, Any]:
+    """
+    Render a dashboard per scenario of a batch results table.
+
+    Args:
+        results: DataFrame from run_batch_analysis (ANALYSIS_COLUMNS)
+        output_dir: Directory for the files and manifest.csv (created if needed)
+        formats: Any of EXPORT_FORMATS
+        dpi: Resolution of PNG files
+        max_workers: Worker processes (1 = render in this process,
+                     None = one per CPU)
+        progress_callback: Optional callable(done, total) called as each
+                           scenario finishes
+
+    Returns:
+        dict with:
+            'manifest': DataFrame with MANIFEST_COLUMNS, one row per scenario
+                        in table order (status 'ok', 'skipped' for rows
+                        without a successful analysis, or 'failed')
+            'metrics': Counts, wall time and throughput
+
+    Example:
+        >>> results = run_batch_analysis(build_parameter_grid(power=[1, 2], t1=[20, 30],
+        ...                                                   temp_diff=[10], approach=[2]))
+        >>> report = export_dashboards(results, 'reports/dashboards', formats=('png', 'svg'))
+        >>> report['metrics']['scenarios_per_second']
+    """
+    formats = tuple(formats)
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"❌ Unknown export formats {unknown}. Use any of: {list(EXPORT_FORMATS)}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    rows = results.reset_index(drop=True).to_dict('records')
+    tasks = [(index, row, output_dir, formats, dpi) for index, row in enumerate(rows)]
+
+    start = time.perf_counter()
+    records: Dict[int, Dict[str, Any]] = {}
+
+    if max_workers == 1 or len(tasks) <= 1:
+        workers = 1
+        for task in tasks:
+            records[task[0]] = _export_scenario(task)
+            if progress_callback:
+                progress_callback(len(records), len(tasks))
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_export_scenario, task): task for task in tasks}
+            for future in as_completed(futures):
+                index, row = futures[future][:2]
+                try:
+                    records[index] = future.result()
+                except Exception as e:
+                    # Worker process died (e.g. out of memory): record, keep going
+                    records[index] = {**{column: row.get(column) for column in INPUT_COLUMNS},
+                                      'scenario': index, 'status': 'failed', 'files': '',
+                                      'error': f"{type(e).__name__}: {e}", 'render_seconds': float('nan')}
+                if progress_callback:
+                    progress_callback(len(records), len(tasks))
+
+    elapsed = time.perf_counter() - start
+    manifest = pd.DataFrame([records[index] for index in sorted(records)], columns=MANIFEST_COLUMNS)
+    manifest.to_csv(os.path.join(output_dir, MANIFEST_FILENAME), index=False)
+
+    rendered = manifest[manifest['status'] == 'ok']
+    metrics = {
+        'scenarios': len(manifest),
+        'rendered': len(rendered),
+        'skipped': int((manifest['status'] == 'skipped').sum()),
+        'failed': int((manifest['status'] == 'failed').sum()),
+        'files': len(rendered) * len(formats),
+        'workers': workers,
+        'wall_seconds': elapsed,
+        'scenarios_per_second': len(rendered) / elapsed if elapsed > 0 else float('nan'),
+        'mean_render_seconds': float(rendered['render_seconds'].mean()) if len(rendered) else float('nan'),
+    }
+
+    return {'manifest': manifest, 'metrics': metrics}
@@ -3,7 +3,9 @@ Display Formatting and Input Validation
 Extracted from Interactive Analysis Tool.ipynb
 """
 
+from functools import lru_cache
 from .config import DISPLAY_ROUNDING, VALIDATION_RULES, MESSAGE_STYLES
+from .templates import HtmlTemplate
 
 # =============================================================================
 # DISPLAY FORMATTING FUNCTIONS
@@ -54,6 +56,23 @@ def format_display_value(value, rounding_type, include_units=True, units=""):
 # HTML GENERATION FUNCTIONS
 # =============================================================================
 
+RESULT_ROW_TEMPLATE = HtmlTemplate("""
+            <tr><td style="padding: 8px; font-weight: bold; {border_style}">{label}</td>
+                <td style="padding: 8px; {border_style}">{value}</td></tr>""")
+
+RESULT_TOTAL_ROW_TEMPLATE = HtmlTemplate("""
+            <tr><td style="padding: 10px; font-weight: bold; font-size: 18px; color: #f44336; border-bottom: 2px solid #333;">{label}</td>
+                <td style="padding: 10px; font-weight: bold; font-size: 18px; color: #f44336; border-bottom: 2px solid #333;">{value}</td></tr>""")
+
+RESULT_TEMPLATE = HtmlTemplate("""
+    <div style="background-color: white; padding: 15px; border-radius: 8px; border: 2px solid {border_color}; margin: 10px 0;">
+        <h3 style="color: {title_color}; margin-top: 0;">{title}</h3>
+        <table style="width: 100%; border-collapse: collapse;">
+            {rows_html}
+        </table>
+    </div>
+    """)
+
 def create_result_html(title, data_rows, border_color, title_color):
     """
     Generate HTML for result displays with consistent styling.
@@ -67,27 +86,32 @@ def create_result_html(title, data_rows, border_color, title_color):
     Returns:
         HTML string for display
     """
-    rows_html = ""
+    rows = []
     for i, (label, value) in enumerate(data_rows):
         border_style = "border-bottom: 1px solid #eee;" if i < len(data_rows) - 1 else ""
         if i == len(data_rows) - 1 and "TOTAL" in label.upper():
             # Special styling for total row
-            rows_html += f"""
-            <tr><td style="padding: 10px; font-weight: bold; font-size: 18px; color: #f44336; border-bottom: 2px solid #333;">{label}</td>
-                <td style="padding: 10px; font-weight: bold; font-size: 18px; color: #f44336; border-bottom: 2px solid #333;">{value}</td></tr>"""
+            rows.append(RESULT_TOTAL_ROW_TEMPLATE.render(label=label, value=value))
         else:
-            rows_html += f"""
-            <tr><td style="padding: 8px; font-weight: bold; {border_style}">{label}</td>
-                <td style="padding: 8px; {border_style}">{value}</td></tr>"""
+            rows.append(RESULT_ROW_TEMPLATE.render(label=label, value=value, border_style=border_style))
     
-    return f"""
-    <div style="background-color: white; padding: 15px; border-radius: 8px; border: 2px solid {border_color}; margin: 10px 0;">
-        <h3 style="color: {title_color}; margin-top: 0;">{title}</h3>
-        <table style="width: 100%; border-collapse: collapse;">
-            {rows_html}
-        </table>
+    return RESULT_TEMPLATE.render(
+        title=title, rows_html="".join(rows), border_color=border_color, title_color=title_color
+    )
+
+MESSAGE_TEMPLATE = HtmlTemplate("""
+    <div style="background-color: {background_color}; color: {text_color}; 
+                padding: 10px; border-radius: 5px; margin: 10px 0; border: 1px solid {border_color};">
+        <strong>{icon} {message}</strong>
     </div>
-    """
+    """)
+
+VALIDATION_ERRORS_TEMPLATE = HtmlTemplate("""
+    <div style="background-color: #ffe6e6; color: #990000; padding: 10px; border-radius: 5px; margin: 10px 0;">
+        <strong>Input Validation Errors:</strong><br>
+        {error_list}
+    </div>
+    """)
 
 def create_error_html(message, message_type='error'):
     """
@@ -102,12 +126,7 @@ def create_error_html(message, message_type='error'):
     """
     style = MESSAGE_STYLES.get(message_type, MESSAGE_STYLES['error'])
     
-    return f"""
-    <div style="background-color: {style['background_color']}; color: {style['text_color']}; 
-                padding: 10px; border-radius: 5px; margin: 10px 0; border: 1px solid {style['border_color']};">
-        <strong>{style['icon']} {message}</strong>
-    </div>
-    """
+    return MESSAGE_TEMPLATE.render(message=message, **style)
 
 def create_validation_errors_html(errors):
     """
@@ -120,12 +139,7 @@ def create_validation_errors_html(errors):
         HTML string for display
     """
     error_list = "<br>".join([f"• {error}" for error in errors])
-    return f"""
-    <div style="background-color: #ffe6e6; color: #990000; padding: 10px; border-radius: 5px; margin: 10px 0;">
-        <strong>Input Validation Errors:</strong><br>
-        {error_list}
-    </div>
-    """
+    return VALIDATION_ERRORS_TEMPLATE.render(error_list=error_list)
 
 # =============================================================================
 # INPUT VALIDATION FUNCTIONS
@@ -350,40 +364,20 @@ def generate_smart_insights(analysis):
 def estimate_cost_per_mw(target_mw):
     """
     Estimate cost per MW for a target power size.
-    Based on your MW price data trends.
-    """
-    # Simplified estimation based on your price data
-    if target_mw <= 1:
-        return 21000
-    elif target_mw <= 2:
-        return 19000
-    elif target_mw <= 3:
-        return 17300
-    else:
-        return 16000
-
-def create_recommendations_html(recommendations, border_color="#4CAF50", title_color="#2E7D32"):
+    Interpolated from the MW price data (see core.economics).
     """
-    Create HTML for recommendations display matching cost analysis style.
-    
-    Args:
-        recommendations: List of recommendation strings
-        border_color: Border color for the box
-        title_color: Title color
+    from core.economics import estimate_cost_per_mw as _estimate_cost_per_mw
     
-    Returns:
-        HTML string for recommendations
-    """
-    rec_rows = ""
-    for rec in recommendations:
-        rec_rows += f"""
+    return _estimate_cost_per_mw(target_mw)
+
+RECOMMENDATION_ROW_TEMPLATE = HtmlTemplate("""
         <tr>
             <td style="padding: 8px 0; color: #333; font-size: 14px;">
-                {rec}
+                {recommendation}
             </td>
-        </tr>"""
-    
-    return f"""
+        </tr>""")
+
+RECOMMENDATIONS_TEMPLATE = HtmlTemplate("""
     <div style="border: 2px solid {border_color}; border-radius: 12px; padding: 20px; margin: 15px 0; background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%); box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
         <h3 style="color: {title_color}; margin: 0 0 15px 0; font-size: 18px; font-weight: bold; text-align: center;">
             Smart Recommendations
@@ -392,7 +386,23 @@ def create_recommendations_html(recommendations, border_color="#4CAF50", title_c
             {rec_rows}
         </table>
     </div>
+    """)
+
+def create_recommendations_html(recommendations, border_color="#4CAF50", title_color="#2E7D32"):
+    """
+    Create HTML for recommendations display matching cost analysis style.
+    
+    Args:
+        recommendations: List of recommendation strings
+        border_color: Border color for the box
+        title_color: Title color
+    
+    Returns:
+        HTML string for recommendations
     """
+    rec_rows = RECOMMENDATION_ROW_TEMPLATE.render_rows({'recommendation': rec} for rec in recommendations)
+    
+    return RECOMMENDATIONS_TEMPLATE.render(rec_rows=rec_rows, border_color=border_color, title_color=title_color)
     
 
 def generate_performance_rating(cost_per_mw, effectiveness):
@@ -455,9 +465,6 @@ def calculate_effectiveness(analysis):
     Returns:
         Float: Effectiveness value (0.0 to 1.0)
     """
-    # Import the heat exchanger function
-    from physics.heat_exchangers import heat_exchanger_for_heat_reuse_tool
-    
     # Extract parameters
     system = analysis['system']
     F1 = system['F1']  # TCS flow
@@ -467,16 +474,19 @@ def calculate_effectiveness(analysis):
     T3 = system['T3']  # FWS outlet
     T4 = system['T4']  # FWS inlet
     
-    # Calculate real effectiveness
-    hx_analysis = heat_exchanger_for_heat_reuse_tool(F1, F2, T1, T2, T3, T4)
+    # Calculate real effectiveness (charts and summary cards ask for the
+    # same operating point, so the HX analysis is only run once)
+    return _hx_effectiveness(F1, F2, T1, T2, T3, T4)
+
+@lru_cache(maxsize=256)
+def _hx_effectiveness(F1, F2, T1, T2, T3, T4):
+    # Import the heat exchanger function
+    from physics.heat_exchangers import heat_exchanger_for_heat_reuse_tool
     
+    hx_analysis = heat_exchanger_for_heat_reuse_tool(F1, F2, T1, T2, T3, T4)
     return hx_analysis['effectiveness']
 
-def create_summary_cards_html(power, total_cost, cost_per_mw, effectiveness, rating_info, eu_compliant):
-    """
-    Create HTML for visual summary cards.
-    """
-    return f"""
+SUMMARY_CARDS_TEMPLATE = HtmlTemplate("""
     <div style="margin: 20px 0;">
         <h3 style="color: #2E7D32; margin: 0 0 20px 0; font-size: 20px; font-weight: bold; text-align: center;">
             System Overview
@@ -494,14 +504,14 @@ def create_summary_cards_html(power, total_cost, cost_per_mw, effectiveness, rat
                 <div style="margin-bottom: 10px;">
                     Effectiveness: <strong>{effectiveness:.1%}</strong>
                     <div style="background: #e0e0e0; height: 8px; border-radius: 4px; margin-top: 5px;">
-                        <div style="background: #4CAF50; height: 8px; border-radius: 4px; width: {effectiveness*100}%;"></div>
+                        <div style="background: #4CAF50; height: 8px; border-radius: 4px; width: {effectiveness_pct}%;"></div>
                     </div>
                 </div>
                 <div style="margin-bottom: 10px;">
-                    EU Compliant: <strong>{"✅ Yes" if eu_compliant else "❌ No"}</strong>
+                    EU Compliant: <strong>{eu_label}</strong>
                 </div>
-                <div style="color: {rating_info['color']}; font-weight: bold; font-size: 12px;">
-                    {rating_info['rating']}
+                <div style="color: {rating_color}; font-weight: bold; font-size: 12px;">
+                    {rating}
                 </div>
             </div>
             
@@ -524,13 +534,29 @@ def create_summary_cards_html(power, total_cost, cost_per_mw, effectiveness, rat
                         </div>
                     </div>
                 </div>
-                <div style="color: {rating_info['color']}; font-weight: bold; font-size: 12px;">
-                    Performance Rating: {rating_info['cost_score']}/5 ⭐
+                <div style="color: {rating_color}; font-weight: bold; font-size: 12px;">
+                    Performance Rating: {cost_score}/5 ⭐
                 </div>
             </div>
             
         </div>
     </div>
+    """)
+
+def create_summary_cards_html(power, total_cost, cost_per_mw, effectiveness, rating_info, eu_compliant):
+    """
+    Create HTML for visual summary cards.
     """
+    return SUMMARY_CARDS_TEMPLATE.render(
+        power=power,
+        total_cost=total_cost,
+        cost_per_mw=cost_per_mw,
+        effectiveness=effectiveness,
+        effectiveness_pct=effectiveness * 100,
+        eu_label="✅ Yes" if eu_compliant else "❌ No",
+        rating=rating_info['rating'],
+        rating_color=rating_info['color'],
+        cost_score=rating_info['cost_score']
+    )
     
     
\ No newline at end of file
@@ -3,18 +3,239 @@ Event Handlers - Button click and interaction logic
 Extracted from Interactive Analysis Tool.ipynb
 """
 
+import asyncio
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from IPython.display import display, HTML
+
+from core.batch_analysis import ANALYSIS_COLUMNS, flatten_analysis, run_batch_analysis
+from core.result_export import export_results
+from .batch import BatchResultsTable, create_batch_progress, create_progress_callback
+from .config import BATCH_CONFIG, EXPORT_CONFIG
 from .inputs import get_widget_values, clear_all_outputs
 from .outputs import (
     display_complete_analysis, display_validation_errors, 
-    display_no_data_error, display_loading_message
+    display_no_data_error, display_loading_message, display_info_message
 )
 from .formatting import validate_user_inputs
+from .history import record_analysis
+from .templates import append_text
+
+# Background workers per interface; one keeps runs in submission order
+CALCULATION_WORKERS = 1
+
+# Quiet period before an automatic calculation after input changes
+AUTO_CALCULATE_DELAY_MS = 1000
+
+# =============================================================================
+# BACKGROUND CALCULATION
+# =============================================================================
+
+def _kernel_event_loop():
+    """Event loop of the calling (kernel) thread, or None outside a running loop."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+class _ThreadStdout:
+    """
+    sys.stdout stand-in that diverts the writes of capturing threads.
+    
+    Installed once by _call_capturing_stdout(); writes from every other
+    thread (e.g. the kernel's) go to the stream it replaced.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+    
+    def write(self, text):
+        buffer = self.buffers.get(threading.get_ident())
+        return (self.stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+_stdout_lock = threading.Lock()
+
+def _call_capturing_stdout(buffer, function, *args):
+    """Call function, collecting what it prints on this thread into buffer."""
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _ThreadStdout):
+            sys.stdout = _ThreadStdout(sys.stdout)
+        router = sys.stdout
+    
+    thread = threading.get_ident()
+    router.buffers[thread] = buffer
+    try:
+        return function(*args)
+    finally:
+        router.buffers.pop(thread, None)
+
+def render_analysis(outputs_dict, analysis, parameters=None):
+    """
+    Replace the output areas with an analysis result.
+    
+    Panels are replaced one by one; a panel whose content is unchanged
+    since the last render is not sent to the frontend again. A displayed
+    analysis is recorded in the session history.
+    
+    Args:
+        outputs_dict: Dictionary of output areas
+        analysis: Complete system analysis dictionary, or None if no data
+        parameters: Input values the analysis was run with
+    """
+    if analysis:
+        display_complete_analysis(outputs_dict, analysis)
+        record_analysis(analysis, parameters)
+    else:
+        clear_all_outputs(outputs_dict)
+        display_no_data_error(outputs_dict['system_params'])
+
+class CalculationRunner:
+    """
+    Run system analyses on a background executor and render the latest one.
+    
+    Each submit() supersedes the previous run: a queued run is cancelled,
+    and a run that is already computing finishes in the background but its
+    result is discarded. When submitted from the notebook kernel, results
+    are rendered back on the kernel's event loop, so the output widgets and
+    matplotlib are only touched from the kernel thread. What the analysis
+    prints on the worker is shown below the system parameters with its
+    result, as it would be for a calculation on the kernel thread.
+    """
+    
+    def __init__(self, outputs_dict, core_functions, max_workers=CALCULATION_WORKERS):
+        """
+        Args:
+            outputs_dict: Dictionary of output areas
+            core_functions: Dictionary of core calculation functions
+            max_workers: Number of background worker threads
+        """
+        self.outputs_dict = outputs_dict
+        self.core_functions = core_functions
+        self.stats = {'submitted': 0, 'completed': 0, 'discarded': 0}
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='heat-reuse-calc')
+        # Reentrant: Future.cancel() runs the done callback in the calling thread
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._future = None
+    
+    @property
+    def running(self):
+        """True while the latest submitted run has not finished."""
+        with self._lock:
+            return self._future is not None and not self._future.done()
+    
+    def submit(self, power, t1, temp_diff, approach):
+        """
+        Start an analysis in the background, superseding any earlier run.
+        
+        Args:
+            power: System power in MW
+            t1: Inlet temperature in °C
+            temp_diff: Temperature difference in °C
+            approach: Approach value
+        
+        Returns:
+            concurrent.futures.Future of the analysis
+        """
+        loop = _kernel_event_loop()
+        
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            if self._future is not None:
+                self._future.cancel()
+            
+            # The other panels keep the previous result until the new one arrives
+            display_loading_message(
+                self.outputs_dict['system_params'],
+                f"Running system analysis for {power} MW, T1={t1}°C, ΔT={temp_diff}°C, approach={approach}...",
+                replace=True
+            )
+            
+            printed = io.StringIO()
+            future = self._executor.submit(
+                _call_capturing_stdout, printed,
+                self.core_functions['get_complete_system_analysis'], power, t1, temp_diff, approach
+            )
+            self._future = future
+            self.stats['submitted'] += 1
+        
+        parameters = {'power': power, 't1': t1, 'temp_diff': temp_diff, 'approach': approach}
+        future.add_done_callback(lambda done: self._on_done(done, generation, loop, parameters, printed))
+        return future
+    
+    def cancel(self):
+        """
+        Cancel the current run so that its result is never rendered.
+        
+        Returns:
+            True if a run was still in progress
+        """
+        with self._lock:
+            self._generation += 1
+            active = self._future is not None and not self._future.done()
+            if active:
+                self._future.cancel()
+            self._future = None
+        return active
+    
+    def shutdown(self):
+        """Cancel the current run and stop the worker threads."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _is_current(self, generation):
+        with self._lock:
+            return generation == self._generation
+    
+    def _on_done(self, future, generation, loop, parameters, printed):
+        """Future callback (worker thread): hand a current result to the renderer."""
+        if future.cancelled() or not self._is_current(generation):
+            with self._lock:
+                self.stats['discarded'] += 1
+            return
+        
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._render, future, generation, parameters, printed)
+        else:
+            self._render(future, generation, parameters, printed)
+    
+    def _render(self, future, generation, parameters, printed):
+        # A newer run may have been submitted while this one was queued
+        if not self._is_current(generation):
+            with self._lock:
+                self.stats['discarded'] += 1
+            return
+        
+        try:
+            render_analysis(self.outputs_dict, future.result(), parameters)
+        except Exception as e:
+            clear_all_outputs(self.outputs_dict)
+            display_validation_errors(self.outputs_dict['system_params'], [f"Calculation error: {str(e)}"])
+        
+        if printed.getvalue():
+            append_text(self.outputs_dict['system_params'], printed.getvalue())
+        
+        with self._lock:
+            self.stats['completed'] += 1
 
 # =============================================================================
 # MAIN BUTTON HANDLER
 # =============================================================================
 
-def create_calculate_handler(widgets_dict, outputs_dict, core_functions):
+def create_calculate_handler(widgets_dict, outputs_dict, core_functions, background=True, runner=None):
     """
     Create the main calculate button handler.
     
@@ -22,10 +243,16 @@ def create_calculate_handler(widgets_dict, outputs_dict, core_functions):
         widgets_dict: Dictionary of input widgets
         outputs_dict: Dictionary of output areas
         core_functions: Dictionary of core calculation functions
+        background: Run the analysis on a background executor so the kernel
+                    stays responsive (False calculates on the kernel thread)
+        runner: CalculationRunner to submit to (default: a new one)
     
     Returns:
-        Button click handler function
+        Button click handler function; its ``runner`` attribute is the
+        CalculationRunner in use (None when not in background mode)
     """
+    if background and runner is None:
+        runner = CalculationRunner(outputs_dict, core_functions)
     
     def on_calculate_click(button):
         """
@@ -35,12 +262,6 @@ def create_calculate_handler(widgets_dict, outputs_dict, core_functions):
             button: The button widget that was clicked
         """
         try:
-            # Clear all previous outputs
-            clear_all_outputs(outputs_dict)
-            
-            # Show loading message
-            display_loading_message(outputs_dict['system_params'], "Calculating system parameters...")
-            
             # Get values from widgets
             values = get_widget_values(widgets_dict)
             power = values['power']
@@ -48,35 +269,35 @@ def create_calculate_handler(widgets_dict, outputs_dict, core_functions):
             temp_diff = values['temp_diff']
             approach = values['approach']
             
-            # Clear loading message and validate inputs
-            clear_all_outputs(outputs_dict)
-            
-            # Validate inputs
+            # Validate inputs; previous results stay until replaced
             errors = validate_user_inputs(power, t1, temp_diff, approach)
             if errors:
+                # A pending run must not overwrite the validation errors
+                if runner is not None:
+                    runner.cancel()
+                clear_all_outputs(outputs_dict)
                 display_validation_errors(outputs_dict['system_params'], errors)
                 return
             
+            if runner is not None:
+                runner.submit(power, t1, temp_diff, approach)
+                return
+            
             # Show calculation in progress
-            display_loading_message(outputs_dict['system_params'], "Running system analysis...")
+            display_loading_message(outputs_dict['system_params'], "Running system analysis...", replace=True)
             
             # Get complete system analysis using core functions
             analysis = core_functions['get_complete_system_analysis'](power, t1, temp_diff, approach)
             
-            # Clear loading message
-            clear_all_outputs(outputs_dict)
-            
             # Display results or error
-            if analysis:
-                display_complete_analysis(outputs_dict, analysis)
-            else:
-                display_no_data_error(outputs_dict['system_params'])
+            render_analysis(outputs_dict, analysis, values)
                 
         except Exception as e:
             # Clear any loading messages and show error
             clear_all_outputs(outputs_dict)
             display_validation_errors(outputs_dict['system_params'], [f"Calculation error: {str(e)}"])
     
+    on_calculate_click.runner = runner
     return on_calculate_click
 
 # =============================================================================
@@ -146,11 +367,149 @@ def create_real_time_validation_callback(outputs_dict):
     
     return validation_callback
 
+def create_stale_run_handler(runner, outputs_dict):
+    """
+    Create handler that cancels a background calculation when inputs change.
+    
+    Args:
+        runner: CalculationRunner used by the calculate handler
+        outputs_dict: Dictionary of output areas
+    
+    Returns:
+        Change handler function
+    """
+    
+    def on_input_change(change):
+        """
+        Cancel the running calculation; its inputs are no longer displayed.
+        
+        Args:
+            change: Widget change event
+        """
+        if runner.cancel():
+            clear_all_outputs(outputs_dict)
+            display_info_message(
+                outputs_dict['system_params'],
+                "Inputs changed - calculation cancelled. Press Calculate to run with the new values."
+            )
+    
+    return on_input_change
+
 # =============================================================================
 # ADVANCED HANDLERS
 # =============================================================================
 
-def create_auto_calculate_handler(widgets_dict, outputs_dict, core_functions, delay_ms=1000):
+class CalculationScheduler:
+    """
+    Debounced auto-calculation for one interface.
+    
+    Change events only (re)start a timer, so a burst of dropdown changes is
+    coalesced into a single calculation with the latest values once inputs
+    have been quiet for delay_ms. Calculations never overlap: a timer that
+    fires while one is running is folded into one rerun after it. The timer
+    runs on the kernel's event loop when there is one, otherwise on a
+    timer thread.
+    """
+    
+    def __init__(self, calculate, delay_ms=AUTO_CALCULATE_DELAY_MS):
+        """
+        Args:
+            calculate: Calculate handler, called with None as the button
+            delay_ms: Quiet period in milliseconds before calculating
+        """
+        self.calculate = calculate
+        self.delay_ms = delay_ms
+        self.stats = {'requests': 0, 'calculations': 0}
+        
+        self._lock = threading.Lock()
+        self._timer = None
+        self._busy = False
+        self._rerun = False
+    
+    @property
+    def pending(self):
+        """True while a requested calculation is waiting for its timer."""
+        with self._lock:
+            return self._timer is not None or self._rerun
+    
+    @property
+    def saved(self):
+        """Number of change events that did not need their own calculation."""
+        with self._lock:
+            return self.stats['requests'] - self.stats['calculations']
+    
+    def summary(self):
+        """One-line report of requests, calculations and calculations saved."""
+        with self._lock:
+            requests = self.stats['requests']
+            calculations = self.stats['calculations']
+        return f"{requests} input changes -> {calculations} calculations ({requests - calculations} saved)"
+    
+    def request(self, change=None):
+        """
+        Request a calculation; restarts the debounce timer.
+        
+        Args:
+            change: Widget change event (unused)
+        """
+        loop = _kernel_event_loop()
+        
+        with self._lock:
+            self.stats['requests'] += 1
+            self._cancel_timer()
+            
+            if loop is not None:
+                self._timer = loop.call_later(self.delay_ms / 1000.0, self._fire)
+            else:
+                self._timer = threading.Timer(self.delay_ms / 1000.0, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def flush(self):
+        """Run a pending calculation now instead of waiting for the timer."""
+        with self._lock:
+            pending = self._timer is not None
+            self._cancel_timer()
+        
+        if pending:
+            self._fire()
+    
+    def cancel(self):
+        """Drop any pending calculation (e.g. when calculating manually)."""
+        with self._lock:
+            self._cancel_timer()
+            self._rerun = False
+    
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+    
+    def _fire(self):
+        with self._lock:
+            self._timer = None
+            if self._busy:
+                self._rerun = True
+                return
+            self._busy = True
+        
+        try:
+            while True:
+                with self._lock:
+                    self.stats['calculations'] += 1
+                
+                self.calculate(None)  # Pass None since we don't have a button
+                
+                with self._lock:
+                    if not self._rerun:
+                        break
+                    self._rerun = False
+        finally:
+            with self._lock:
+                self._busy = False
+
+def create_auto_calculate_handler(widgets_dict, outputs_dict, core_functions, delay_ms=AUTO_CALCULATE_DELAY_MS,
+                                  calculate_handler=None):
     """
     Create handler for automatic calculation after input changes.
     
@@ -159,14 +518,17 @@ def create_auto_calculate_handler(widgets_dict, outputs_dict, core_functions, de
         outputs_dict: Dictionary of output areas
         core_functions: Dictionary of core calculation functions
         delay_ms: Delay in milliseconds before auto-calculation
+        calculate_handler: Calculate handler to run (default: a new
+                           background calculate handler)
     
     Returns:
-        Auto-calculate handler function
+        Auto-calculate handler function; its ``scheduler`` attribute is the
+        interface's CalculationScheduler
     """
-    import threading
-    import time
+    if calculate_handler is None:
+        calculate_handler = create_calculate_handler(widgets_dict, outputs_dict, core_functions)
     
-    last_change_time = [0]  # Use list to make it mutable in nested function
+    scheduler = CalculationScheduler(calculate_handler, delay_ms)
     
     def auto_calculate_handler(change):
         """
@@ -175,33 +537,28 @@ def create_auto_calculate_handler(widgets_dict, outputs_dict, core_functions, de
         Args:
             change: Widget change event
         """
-        last_change_time[0] = time.time()
-        
-        def delayed_calculate():
-            time.sleep(delay_ms / 1000.0)  # Convert to seconds
-            
-            # Check if there were any more recent changes
-            if time.time() - last_change_time[0] >= delay_ms / 1000.0 - 0.1:
-                # Trigger calculation
-                calculate_handler = create_calculate_handler(widgets_dict, outputs_dict, core_functions)
-                calculate_handler(None)  # Pass None since we don't have a button
-        
-        # Start delayed calculation in background thread
-        thread = threading.Thread(target=delayed_calculate)
-        thread.daemon = True
-        thread.start()
+        scheduler.request(change)
     
+    auto_calculate_handler.scheduler = scheduler
     return auto_calculate_handler
 
-def create_export_handler(analysis_data):
+def create_export_handler(analysis_data, path=None, fmt=None):
     """
     Create handler for exporting results.
     
     Args:
-        analysis_data: Current analysis data to export
+        analysis_data: What to export: an analysis dictionary, an
+                       AnalysisHistory, a batch results DataFrame, or a
+                       callable returning one of these at click time (e.g.
+                       lambda: batch_handler.results)
+        path: Target file (default: EXPORT_CONFIG['path']); the format's
+              extension is added if missing
+        fmt: 'csv', 'jsonl' or 'parquet' (default: from the extension of
+             path, else EXPORT_CONFIG['format'])
     
     Returns:
-        Export handler function
+        Export handler function; its .last_export attribute holds the last
+        export summary (path, format, rows, columns)
     """
     
     def export_handler(button):
@@ -212,20 +569,27 @@ def create_export_handler(analysis_data):
             button: Export button widget
         """
         try:
-            # This could be enhanced to actually export data
-            # For now, just show a message
-            print("Export functionality would be implemented here")
-            print(f"Analysis data available for export: {list(analysis_data.keys()) if analysis_data else 'No data'}")
+            data = analysis_data() if callable(analysis_data) else analysis_data
+            if data is None or (isinstance(data, pd.DataFrame) and data.empty):
+                print("⚠️ Nothing to export yet - run a calculation first")
+                return
+            
+            summary = export_results(data, path or EXPORT_CONFIG['path'],
+                                     fmt or (None if path else EXPORT_CONFIG['format']))
+            export_handler.last_export = summary
+            print(f"✅ Exported {summary['rows']} rows to {summary['path']}")
         except Exception as e:
-            print(f"Export error: {str(e)}")
+            print(f"❌ Export error: {str(e)}")
     
+    export_handler.last_export = None
     return export_handler
 
 # =============================================================================
 # WIDGET ATTACHMENT HELPERS
 # =============================================================================
 
-def attach_handlers_to_widgets(widgets_dict, outputs_dict, core_functions, enable_real_time=False):
+def attach_handlers_to_widgets(widgets_dict, outputs_dict, core_functions, enable_real_time=False,
+                               attach_calculate=True):
     """
     Attach all necessary event handlers to widgets.
     
@@ -234,6 +598,8 @@ def attach_handlers_to_widgets(widgets_dict, outputs_dict, core_functions, enabl
         outputs_dict: Dictionary of output areas
         core_functions: Dictionary of core calculation functions
         enable_real_time: Whether to enable real-time validation
+        attach_calculate: Whether to attach a calculate button handler
+                          (False when the button already has one)
     
     Returns:
         Dictionary of attached handlers
@@ -241,9 +607,10 @@ def attach_handlers_to_widgets(widgets_dict, outputs_dict, core_functions, enabl
     handlers = {}
     
     # Attach main calculate button handler
-    calculate_handler = create_calculate_handler(widgets_dict, outputs_dict, core_functions)
-    widgets_dict['calculate_button'].on_click(calculate_handler)
-    handlers['calculate'] = calculate_handler
+    if attach_calculate:
+        calculate_handler = create_calculate_handler(widgets_dict, outputs_dict, core_functions)
+        widgets_dict['calculate_button'].on_click(calculate_handler)
+        handlers['calculate'] = calculate_handler
     
     # Attach real-time validation if enabled
     if enable_real_time:
@@ -278,12 +645,19 @@ def detach_handlers_from_widgets(widgets_dict, handlers_dict):
         
         # Detach change handlers
         for widget_name in ['power', 't1', 'temp_diff', 'approach']:
-            handler_key = f"{widget_name}_change"
             widget_key = f"{widget_name}_widget"
             
-            if handler_key in handlers_dict and widget_key in widgets_dict:
-                # Remove observer
-                widgets_dict[widget_key].unobserve(handlers_dict[handler_key], names='value')
+            for handler_key in [f"{widget_name}_change", f"{widget_name}_stale", f"{widget_name}_auto"]:
+                if handler_key in handlers_dict and widget_key in widgets_dict:
+                    # Remove observer
+                    widgets_dict[widget_key].unobserve(handlers_dict[handler_key], names='value')
+        
+        # Drop pending automatic calculations and stop the background workers
+        if 'scheduler' in handlers_dict:
+            handlers_dict['scheduler'].cancel()
+        
+        if 'runner' in handlers_dict:
+            handlers_dict['runner'].shutdown()
                 
     except Exception as e:
         print(f"Error detaching handlers: {str(e)}")
@@ -399,7 +773,7 @@ def with_error_handling(handler_func, error_output=None):
     
     return wrapped_handler
 
-def create_safe_calculate_handler(widgets_dict, outputs_dict, core_functions):
+def create_safe_calculate_handler(widgets_dict, outputs_dict, core_functions, background=True):
     """
     Create calculate handler with enhanced error handling.
     
@@ -407,12 +781,15 @@ def create_safe_calculate_handler(widgets_dict, outputs_dict, core_functions):
         widgets_dict: Dictionary of input widgets
         outputs_dict: Dictionary of output areas
         core_functions: Dictionary of core calculation functions
+        background: Run the analysis on a background executor
     
     Returns:
         Safe calculate handler with error handling
     """
-    base_handler = create_calculate_handler(widgets_dict, outputs_dict, core_functions)
-    return with_error_handling(base_handler, outputs_dict.get('system_params'))
+    base_handler = create_calculate_handler(widgets_dict, outputs_dict, core_functions, background=background)
+    safe_handler = with_error_handling(base_handler, outputs_dict.get('system_params'))
+    safe_handler.runner = base_handler.runner
+    return safe_handler
 
 # =============================================================================
 # PERFORMANCE MONITORING
@@ -471,19 +848,29 @@ def create_performance_monitoring_handler(base_handler, performance_callback=Non
 # BATCH OPERATIONS
 # =============================================================================
 
-def create_batch_calculate_handler(widgets_dict, outputs_dict, core_functions, parameter_sets):
+def create_batch_calculate_handler(widgets_dict, outputs_dict, core_functions, parameter_sets, max_workers=None):
     """
     Create handler for batch calculations with multiple parameter sets.
     
+    Valid parameter sets are sent to run_batch_analysis in one call (each
+    distinct operating point analysed once, across worker processes);
+    progress is streamed to a progress bar widget. The finished results
+    are shown as a sortable, filterable table with CSV/JSON Lines/Parquet export.
+    
     Args:
         widgets_dict: Dictionary of input widgets
         outputs_dict: Dictionary of output areas
-        core_functions: Dictionary of core calculation functions
-        parameter_sets: List of parameter dictionaries to calculate
+        core_functions: Dictionary of core calculation functions (an optional
+                        'run_batch_analysis' entry replaces the batch engine)
+        parameter_sets: List of parameter dictionaries (or DataFrame) to calculate
+        max_workers: Worker processes (default: BATCH_CONFIG['max_workers'])
     
     Returns:
-        Batch calculate handler function
+        Batch calculate handler function; its .results attribute holds the
+        last results DataFrame
     """
+    run_batch = core_functions.get('run_batch_analysis', run_batch_analysis)
+    workers = BATCH_CONFIG['max_workers'] if max_workers is None else max_workers
     
     def batch_handler(button):
         """
@@ -493,56 +880,43 @@ def create_batch_calculate_handler(widgets_dict, outputs_dict, core_functions, p
             button: Batch calculate button widget
         """
         try:
+            params = pd.DataFrame(parameter_sets).reset_index(drop=True)
+            
+            # Validate every set up front; only valid ones are calculated
+            valid = pd.Series([
+                not validate_user_inputs(row['power'], row['t1'], row['temp_diff'], row['approach'])
+                for row in params.to_dict('records')
+            ], index=params.index, dtype=bool)
+            valid_params = params[valid]
+            
             clear_all_outputs(outputs_dict)
-            display_loading_message(outputs_dict['system_params'], f"Running batch calculation for {len(parameter_sets)} parameter sets...")
+            progress = create_batch_progress(len(valid_params))
+            with outputs_dict['system_params']:
+                display(HTML(f"<strong>⏳ Running batch calculation for {len(params)} parameter sets...</strong>"))
+                display(progress)
             
-            results = []
+            results = run_batch(valid_params, max_workers=workers,
+                                progress_callback=create_progress_callback(progress))
+            results.index = valid_params.index
             
-            for i, params in enumerate(parameter_sets):
-                # Update progress
-                progress_msg = f"Processing set {i+1}/{len(parameter_sets)}: Power={params['power']}MW, T1={params['t1']}°C"
-                clear_all_outputs(outputs_dict)
-                display_loading_message(outputs_dict['system_params'], progress_msg)
-                
-                # Validate parameters
-                errors = validate_user_inputs(
-                    params['power'], params['t1'], 
-                    params['temp_diff'], params['approach']
-                )
-                
-                if not errors:
-                    # Calculate
-                    analysis = core_functions['get_complete_system_analysis'](
-                        params['power'], params['t1'], 
-                        params['temp_diff'], params['approach']
-                    )
-                    
-                    if analysis:
-                        results.append({
-                            'parameters': params,
-                            'analysis': analysis,
-                            'status': 'success'
-                        })
-                    else:
-                        results.append({
-                            'parameters': params,
-                            'status': 'no_data'
-                        })
-                else:
-                    results.append({
-                        'parameters': params,
-                        'errors': errors,
-                        'status': 'validation_error'
-                    })
+            # Invalid sets keep their row, flagged as validation errors
+            if not valid.all():
+                invalid = pd.DataFrame([flatten_analysis(None, row) for row in params[~valid].to_dict('records')],
+                                       index=params.index[~valid], columns=ANALYSIS_COLUMNS)
+                invalid['status'] = 'validation_error'
+                results = pd.concat([results, invalid]).sort_index() if len(results) else invalid
+            
+            batch_handler.results = results.reset_index(drop=True)
             
             # Display batch results
             clear_all_outputs(outputs_dict)
-            display_batch_results(outputs_dict, results)
+            display_batch_results(outputs_dict, batch_handler.results)
             
         except Exception as e:
             clear_all_outputs(outputs_dict)
             display_validation_errors(outputs_dict['system_params'], [f"Batch calculation error: {str(e)}"])
     
+    batch_handler.results = None
     return batch_handler
 
 def display_batch_results(outputs_dict, results):
@@ -551,37 +925,39 @@ def display_batch_results(outputs_dict, results):
     
     Args:
         outputs_dict: Dictionary of output areas
-        results: List of calculation results
+        results: Batch results DataFrame (ANALYSIS_COLUMNS)
+    
+    Returns:
+        BatchResultsTable shown, or None on error
     """
     from .outputs import display_error
     
     try:
-        successful_results = [r for r in results if r['status'] == 'success']
+        successful = int((results['status'] == 'success').sum())
         
-        if successful_results:
-            # Display summary
+        if successful:
             summary_html = f"""
             <div style="background-color: #e8f5e8; color: #2e7d32; padding: 15px; 
                         border-radius: 8px; border: 2px solid #c8e6c9; margin: 10px 0;">
                 <h3 style="margin-top: 0;">📊 Batch Calculation Summary</h3>
                 <p><strong>Total Calculations:</strong> {len(results)}</p>
-                <p><strong>Successful:</strong> {len(successful_results)}</p>
-                <p><strong>Failed:</strong> {len(results) - len(successful_results)}</p>
+                <p><strong>Successful:</strong> {successful}</p>
+                <p><strong>Failed:</strong> {len(results) - successful}</p>
             </div>
             """
             
+            table = BatchResultsTable(results)
             with outputs_dict['system_params']:
-                from IPython.display import display, HTML
                 display(HTML(summary_html))
-            
-            # Display first successful result as example
-            if successful_results:
-                display_complete_analysis(outputs_dict, successful_results[0]['analysis'])
+                display(table.widget)
+            return table
         else:
             display_error(outputs_dict['system_params'], "No successful calculations in batch")
             
     except Exception as e:
         display_error(outputs_dict['system_params'], f"Error displaying batch results: {str(e)}")
+    
+    return None
 
 # =============================================================================
 # HANDLER FACTORY
@@ -604,19 +980,48 @@ def create_handlers_suite(widgets_dict, outputs_dict, core_functions, options=No
         options = {}
     
     handlers = {}
+    background = options.get('background_calculation', True)
+    auto_calculate = options.get('auto_calculate', False)
     
     # Always create main calculate handler
     if options.get('safe_mode', True):
-        handlers['calculate'] = create_safe_calculate_handler(widgets_dict, outputs_dict, core_functions)
+        handlers['calculate'] = create_safe_calculate_handler(
+            widgets_dict, outputs_dict, core_functions, background=background
+        )
     else:
-        handlers['calculate'] = create_calculate_handler(widgets_dict, outputs_dict, core_functions)
+        handlers['calculate'] = create_calculate_handler(
+            widgets_dict, outputs_dict, core_functions, background=background
+        )
+    
+    # Cancel a background run as soon as its inputs are changed (with
+    # auto-calculation the next scheduled run supersedes it instead)
+    runner = handlers['calculate'].runner
+    if runner is not None:
+        handlers['runner'] = runner
+    
+    if runner is not None and not auto_calculate:
+        stale_handler = create_stale_run_handler(runner, outputs_dict)
+        
+        for widget_name in ['power', 't1', 'temp_diff', 'approach']:
+            widget_key = f"{widget_name}_widget"
+            if widget_key in widgets_dict:
+                widgets_dict[widget_key].observe(stale_handler, names='value')
+                handlers[f"{widget_name}_stale"] = stale_handler
     
-    # Add performance monitoring if requested
+    # Add performance monitoring if requested (in background mode the click
+    # only submits, so time the analysis itself on the worker thread)
     if options.get('monitor_performance', False):
-        handlers['calculate'] = create_performance_monitoring_handler(
-            handlers['calculate'], 
-            options.get('performance_callback')
-        )
+        if runner is not None:
+            runner.core_functions = dict(core_functions)
+            runner.core_functions['get_complete_system_analysis'] = create_performance_monitoring_handler(
+                core_functions['get_complete_system_analysis'],
+                options.get('performance_callback')
+            )
+        else:
+            handlers['calculate'] = create_performance_monitoring_handler(
+                handlers['calculate'], 
+                options.get('performance_callback')
+            )
     
     # Create optional handlers
     if options.get('enable_reset', False):
@@ -628,10 +1033,29 @@ def create_handlers_suite(widgets_dict, outputs_dict, core_functions, options=No
     # Attach main handler to button
     widgets_dict['calculate_button'].on_click(handlers['calculate'])
     
+    # Attach one debounced scheduler to all dropdowns if requested
+    if auto_calculate:
+        auto_handler = create_auto_calculate_handler(
+            widgets_dict, outputs_dict, core_functions,
+            delay_ms=options.get('auto_calculate_delay_ms', AUTO_CALCULATE_DELAY_MS),
+            calculate_handler=handlers['calculate']
+        )
+        scheduler = auto_handler.scheduler
+        handlers['scheduler'] = scheduler
+        
+        # A manual calculation makes the pending automatic one redundant
+        widgets_dict['calculate_button'].on_click(lambda button: scheduler.cancel())
+        
+        for widget_name in ['power', 't1', 'temp_diff', 'approach']:
+            widget_key = f"{widget_name}_widget"
+            if widget_key in widgets_dict:
+                widgets_dict[widget_key].observe(auto_handler, names='value')
+                handlers[f"{widget_name}_auto"] = auto_handler
+    
     # Attach real-time validation if enabled
     if options.get('enable_real_time', False):
         validation_handlers = attach_handlers_to_widgets(
-            widgets_dict, outputs_dict, core_functions, enable_real_time=True
+            widgets_dict, outputs_dict, core_functions, enable_real_time=True, attach_calculate=False
         )
         handlers.update(validation_handlers)
     
@@ -0,0 +1,171 @@
+"""
+Session History Panel
+
+Every analysis shown by the calculate handlers is recorded in one session
+history (core.history.AnalysisHistory). The panel lists recent entries,
+lets the user pin them, and compares the selected (or pinned) entries in a
+side-by-side table and overlaid charts. Comparisons are drawn from the
+stored rows; nothing is recalculated.
+"""
+
+import ipywidgets as widgets
+from IPython.display import display
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.history import AnalysisHistory
+from .config import HISTORY_CONFIG
+from .charts import create_comparison_charts, canvas_png
+from .templates import show_html
+
+# Session history, created on first use
+_session_history = None
+
+def get_session_history():
+    """
+    Get the session history, creating it on first use.
+
+    Returns:
+        AnalysisHistory with HISTORY_CONFIG['capacity'] entries
+    """
+    global _session_history
+
+    if _session_history is None:
+        _session_history = AnalysisHistory(HISTORY_CONFIG['capacity'])
+    return _session_history
+
+def record_analysis(analysis, parameters):
+    """
+    Record a displayed analysis in the session history (if enabled).
+
+    Args:
+        analysis: Complete system analysis dictionary
+        parameters: Input values (power, t1, temp_diff, approach)
+
+    Returns:
+        Entry id, or None if not recorded
+    """
+    if not HISTORY_CONFIG['enabled'] or not analysis:
+        return None
+    return get_session_history().add(analysis, parameters)
+
+def entry_label(row):
+    """Short description of a history entry for lists and legends."""
+    pin = '📌 ' if row['pinned'] else ''
+    return (f"{pin}#{row['entry_id']}: {row['power']:g} MW, T1={row['t1']:g}°C, "
+            f"ΔT={row['temp_diff']:g}°C, approach={row['approach']:g} - €{row['total_cost']:,.0f}")
+
+def _legend_label(row):
+    return f"#{row['entry_id']} ({row['power']:g} MW, T1={row['t1']:g}, ΔT={row['temp_diff']:g}, app={row['approach']:g})"
+
+# =============================================================================
+# HISTORY PANEL
+# =============================================================================
+
+class HistoryPanel:
+    """
+    Entry list with pin/unpin and a multi-scenario comparison.
+
+    Example:
+        >>> panel = HistoryPanel()
+        >>> display(panel.widget)
+    """
+
+    def __init__(self, history=None):
+        """
+        Args:
+            history: AnalysisHistory (default: the session history)
+        """
+        self.history = history if history is not None else get_session_history()
+
+        self.entries_widget = widgets.SelectMultiple(
+            options=[], rows=8, description='History:',
+            layout=widgets.Layout(width='650px')
+        )
+        self.pin_button = widgets.Button(description='Pin', icon='thumb-tack')
+        self.unpin_button = widgets.Button(description='Unpin')
+        self.compare_button = widgets.Button(
+            description='Compare', icon='columns', button_style='info',
+            tooltip='Compare the selected entries (or all pinned entries if none are selected)'
+        )
+        self.table = widgets.Output()
+        self.chart = widgets.Image(format='png', layout=widgets.Layout(display='none'))
+
+        self.pin_button.on_click(lambda b: self._set_pinned(True))
+        self.unpin_button.on_click(lambda b: self._set_pinned(False))
+        self.compare_button.on_click(lambda b: self.compare())
+
+        self.history.add_listener(self._on_history_change)
+        self._widget = None
+        self.refresh()
+
+    def _on_history_change(self, history):
+        self.refresh()
+
+    def refresh(self):
+        """Reload the entry list, newest first, keeping the selection."""
+        frame = self.history.to_frame()
+        selected = set(self.entries_widget.value)
+        options = [(entry_label(row), int(row['entry_id'])) for row in reversed(frame.to_dict('records'))]
+
+        # Replacing the options resets the selection
+        self.entries_widget.options = options
+        self.entries_widget.value = tuple(i for _, i in options if i in selected)
+
+    def _set_pinned(self, pinned):
+        for entry_id in self.entries_widget.value:
+            (self.history.pin if pinned else self.history.unpin)(entry_id)
+
+    def compare(self, entry_ids=None):
+        """
+        Show the comparison table and overlaid charts.
+
+        Args:
+            entry_ids: Entries to compare (default: the selection, or all
+                       pinned entries if nothing is selected)
+        """
+        entry_ids = list(entry_ids or self.entries_widget.value or self.history.pinned_ids())
+        if not entry_ids:
+            show_html(self.table, "<p>ℹ️ Select or pin entries to compare.</p>")
+            self.chart.layout.display = 'none'
+            return
+
+        entry_ids = sorted(entry_ids)
+        comparison = self.history.compare(entry_ids)
+        show_html(self.table, comparison.to_html(float_format=lambda v: f'{v:,.2f}', border=0))
+
+        rows = self.history.to_frame(entry_ids).to_dict('records')
+        figure = Figure(figsize=HISTORY_CONFIG['figure_size'], dpi=HISTORY_CONFIG['dpi'])
+        canvas = FigureCanvasAgg(figure)
+        create_comparison_charts(figure, [self.history.analysis(i) for i in entry_ids],
+                                 [_legend_label(row) for row in rows])
+        canvas.draw()
+        self.chart.value = canvas_png(canvas)
+        self.chart.layout.display = None
+
+    def close(self):
+        """Stop following the history."""
+        self.history.remove_listener(self._on_history_change)
+
+    @property
+    def widget(self):
+        """Entry list and buttons above the comparison."""
+        if self._widget is None:
+            self._widget = widgets.VBox([
+                self.entries_widget,
+                widgets.HBox([self.pin_button, self.unpin_button, self.compare_button]),
+                self.table,
+                self.chart
+            ])
+        return self._widget
+
+def display_history_panel(history=None):
+    """
+    Display the session history panel.
+
+    Returns:
+        HistoryPanel
+    """
+    panel = HistoryPanel(history)
+    display(panel.widget)
+    return panel
@@ -5,6 +5,7 @@ Extracted from Interactive Analysis Tool.ipynb
 
 import ipywidgets as widgets
 from .config import UI_CONFIG
+from .templates import forget_shown
 
 # =============================================================================
 # WIDGET CREATION FUNCTIONS
@@ -60,6 +61,33 @@ def create_dropdown_widget(options, default, label, tooltip=""):
         layout=layout
     )
 
+def create_slider_widget(options, default, label, tooltip=""):
+    """
+    Create a selection slider over discrete values with consistent styling.
+    
+    Args:
+        options: Values the slider steps through
+        default: Initially selected value
+        label: Label text for the slider
+        tooltip: Tooltip text
+    
+    Returns:
+        ipywidgets.SelectionSlider widget
+    """
+    layout_config = UI_CONFIG['layout']
+    
+    style = {'description_width': layout_config['description_width']}
+    layout = widgets.Layout(width=layout_config['widget_width'])
+    
+    return widgets.SelectionSlider(
+        options=options,
+        value=default,
+        description=label,
+        tooltip=tooltip,
+        style=style,
+        layout=layout
+    )
+
 def create_calculate_button():
     """
     Create the calculate button with consistent styling.
@@ -155,6 +183,7 @@ def clear_all_outputs(outputs_dict):
     """
     for output_name, output_widget in outputs_dict.items():
         output_widget.clear_output(wait=True)  # wait=True ensures complete clearing
+        forget_shown(output_widget)
 
 # =============================================================================
 # WIDGET CONFIGURATION HELPERS
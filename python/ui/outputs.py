@@ -3,9 +3,8 @@ Output Display Functions
 Extracted from Interactive Analysis Tool.ipynb
 """
 
-from IPython.display import display, HTML
 import matplotlib.pyplot as plt  # Add this line
-from .config import OUTPUT_CONFIG
+from .config import OUTPUT_CONFIG, CHART_CONFIG
 from .formatting import (
     create_result_html, create_error_html, create_validation_errors_html,
     extract_formatted_system_params, extract_formatted_cost_analysis, 
@@ -14,7 +13,15 @@ from .formatting import (
     create_recommendations_html, create_summary_cards_html,
     calculate_effectiveness 
 )
-from .charts import create_system_charts
+from .charts import create_system_charts, get_chart_canvas, reset_chart_canvas
+from .templates import HtmlTemplate, show_html, show_widget, append_html, forget_shown
+
+LOADING_TEMPLATE = HtmlTemplate("""
+        <div style="background-color: #e3f2fd; color: #0d47a1; padding: 15px; 
+                    border-radius: 8px; border: 2px solid #bbdefb; margin: 10px 0; text-align: center;">
+            <strong>⏳ {message}</strong>
+        </div>
+        """)
 
 # =============================================================================
 # MAIN OUTPUT DISPLAY FUNCTIONS
@@ -28,34 +35,33 @@ def display_system_parameters(output_area, analysis):
         output_area: Output widget to display in
         analysis: Complete system analysis dictionary
     """
-    with output_area:
-        try:
-            system = analysis['system']
-            
-            # Extract and format basic parameters
-            basic_params = extract_formatted_system_params(system)
-            
-            # Extract and format Delta T values
-            delta_t_params = extract_delta_t_values(system)
-            
-            # Combine all parameters
-            all_params = basic_params + delta_t_params
-            
-            # Get styling configuration
-            config = OUTPUT_CONFIG['system_params']
-            
-            # Create and display HTML
-            html_content = create_result_html(
-                title=config['title'],
-                data_rows=all_params,
-                border_color=config['border_color'],
-                title_color=config['title_color']
-            )
-            
-            display(HTML(html_content))
-            
-        except Exception as e:
-            display_error(output_area, f"Error displaying system parameters: {str(e)}")
+    try:
+        system = analysis['system']
+        
+        # Extract and format basic parameters
+        basic_params = extract_formatted_system_params(system)
+        
+        # Extract and format Delta T values
+        delta_t_params = extract_delta_t_values(system)
+        
+        # Combine all parameters
+        all_params = basic_params + delta_t_params
+        
+        # Get styling configuration
+        config = OUTPUT_CONFIG['system_params']
+        
+        # Create and display HTML (not re-sent if unchanged)
+        html_content = create_result_html(
+            title=config['title'],
+            data_rows=all_params,
+            border_color=config['border_color'],
+            title_color=config['title_color']
+        )
+        
+        show_html(output_area, html_content)
+        
+    except Exception as e:
+        display_error(output_area, f"Error displaying system parameters: {str(e)}")
 
 def display_cost_analysis(output_area, analysis):
     """
@@ -65,40 +71,63 @@ def display_cost_analysis(output_area, analysis):
         output_area: Output widget to display in
         analysis: Complete system analysis dictionary
     """
-    with output_area:
-        try:
-            costs = analysis['costs']
-            sizing = analysis['sizing']
-            
-            # Extract and format cost data
-            cost_params = extract_formatted_cost_analysis(costs, sizing)
-            
-            # Get styling configuration
-            config = OUTPUT_CONFIG['cost_analysis']
-            
-            # Create and display HTML
-            html_content = create_result_html(
-                title=config['title'],
-                data_rows=cost_params,
-                border_color=config['border_color'],
-                title_color=config['title_color']
-            )
-            
-            display(HTML(html_content))
-            
-        except Exception as e:
-            display_error(output_area, f"Error displaying cost analysis: {str(e)}")
+    try:
+        costs = analysis['costs']
+        sizing = analysis['sizing']
+        
+        # Extract and format cost data
+        cost_params = extract_formatted_cost_analysis(costs, sizing)
+        
+        # Get styling configuration
+        config = OUTPUT_CONFIG['cost_analysis']
+        
+        # Create and display HTML (not re-sent if unchanged)
+        html_content = create_result_html(
+            title=config['title'],
+            data_rows=cost_params,
+            border_color=config['border_color'],
+            title_color=config['title_color']
+        )
+        
+        show_html(output_area, html_content)
+        
+    except Exception as e:
+        display_error(output_area, f"Error displaying cost analysis: {str(e)}")
 
-def display_charts(output_area, analysis):
+def display_charts(output_area, analysis, incremental=None):
     """
-    Display charts with guaranteed fresh creation.
+    Display charts.
+    
+    Incrementally, the output area keeps one persistent chart canvas whose
+    changed panels are updated in place; otherwise a fresh figure is
+    created every time.
     
     Args:
         output_area: Output widget to display in
         analysis: Complete system analysis dictionary
+        incremental: Update the persistent canvas (default:
+                     CHART_CONFIG['layout']['incremental_updates'])
     """
+    if incremental is None:
+        incremental = CHART_CONFIG['layout'].get('incremental_updates', True)
+    
+    if incremental:
+        try:
+            canvas = get_chart_canvas(output_area)
+            canvas.update(analysis)
+            # The canvas widget stays on screen; only changed panels are re-sent
+            show_widget(output_area, canvas.widget)
+            
+        except Exception as e:
+            # Start from a fresh canvas next time
+            reset_chart_canvas(output_area)
+            output_area.clear_output(wait=True)
+            display_error(output_area, f"Error creating charts: {str(e)}")
+        return
+    
     # Double-clear to ensure fresh start
     output_area.clear_output()
+    forget_shown(output_area)
     
     with output_area:
         try:
@@ -123,9 +152,7 @@ def display_validation_errors(output_area, errors):
         output_area: Output widget to display in
         errors: List of error messages
     """
-    with output_area:
-        html_content = create_validation_errors_html(errors)
-        display(HTML(html_content))
+    append_html(output_area, create_validation_errors_html(errors))
 
 def display_no_data_error(output_area):
     """
@@ -134,12 +161,11 @@ def display_no_data_error(output_area):
     Args:
         output_area: Output widget to display in
     """
-    with output_area:
-        html_content = create_error_html(
-            "No data found for the selected parameters. Please try a different combination.",
-            'error'
-        )
-        display(HTML(html_content))
+    html_content = create_error_html(
+        "No data found for the selected parameters. Please try a different combination.",
+        'error'
+    )
+    append_html(output_area, html_content)
 
 def display_error(output_area, message, message_type='error'):
     """
@@ -150,9 +176,7 @@ def display_error(output_area, message, message_type='error'):
         message: Error message to display
         message_type: Type of message ('error', 'warning', 'info')
     """
-    with output_area:
-        html_content = create_error_html(message, message_type)
-        display(HTML(html_content))
+    append_html(output_area, create_error_html(message, message_type))
 
 def display_success_message(output_area, message):
     """
@@ -211,27 +235,26 @@ def clear_all_displays(outputs_dict):
     """
     for output in outputs_dict.values():
         output.clear_output()
+        forget_shown(output)
 
 # =============================================================================
 # UTILITY FUNCTIONS FOR OUTPUT MANAGEMENT
 # =============================================================================
 
-def display_loading_message(output_area, message="Calculating..."):
+def display_loading_message(output_area, message="Calculating...", replace=False):
     """
     Display a loading message while calculations are in progress.
     
     Args:
         output_area: Output widget to display in
         message: Loading message to display
+        replace: Replace the area's contents instead of appending
     """
-    with output_area:
-        html_content = f"""
-        <div style="background-color: #e3f2fd; color: #0d47a1; padding: 15px; 
-                    border-radius: 8px; border: 2px solid #bbdefb; margin: 10px 0; text-align: center;">
-            <strong>⏳ {message}</strong>
-        </div>
-        """
-        display(HTML(html_content))
+    html_content = LOADING_TEMPLATE.render(message=message)
+    if replace:
+        show_html(output_area, html_content)
+    else:
+        append_html(output_area, html_content)
 
 def display_calculation_summary(output_area, summary_data):
     """
@@ -256,7 +279,7 @@ def display_calculation_summary(output_area, summary_data):
                 </p>
             </div>
             """
-            display(HTML(html_content))
+            append_html(output_area, html_content)
             
         except Exception as e:
             display_error(output_area, f"Error displaying summary: {str(e)}")
@@ -293,7 +316,7 @@ def display_detailed_breakdown(output_area, analysis, show_validation=True):
                     <p><strong>Approach:</strong> {validation.get('approach_calculated', 'N/A')}</p>
                 </div>
                 """
-                display(HTML(validation_html))
+                append_html(output_area, validation_html)
                 
         except Exception as e:
             display_error(output_area, f"Error displaying detailed breakdown: {str(e)}")
@@ -321,7 +344,7 @@ def display_export_options(output_area, analysis):
                 <p><small>Contact your system administrator for export functionality.</small></p>
             </div>
             """
-            display(HTML(export_html))
+            append_html(output_area, export_html)
             
         except Exception as e:
             display_error(output_area, f"Error displaying export options: {str(e)}")
@@ -374,34 +397,33 @@ def display_smart_recommendations(output_area, analysis):
         output_area: Output widget to display in
         analysis: Complete system analysis dictionary
     """
-    with output_area:
-        try:
-            # Extract key metrics for analysis
-            system = analysis['system']
-            costs = analysis['costs']
-            sizing = analysis['sizing']
-            
-            power = system['power']
-            total_cost = costs['total_cost']
-            cost_per_mw = total_cost / power
-            
-            # Generate smart insights
-            recommendations = generate_smart_insights(analysis)
-            
-            # Get styling configuration (reuse cost analysis style)
-            config = OUTPUT_CONFIG['cost_analysis']  # Reuse existing styling
-            
-            # Create recommendations HTML
-            rec_html = create_recommendations_html(
-                recommendations=recommendations,
-                border_color=config['border_color'],
-                title_color=config['title_color']
-            )
-            
-            display(HTML(rec_html))
-            
-        except Exception as e:
-            display_error(output_area, f"Error displaying recommendations: {str(e)}")
+    try:
+        # Extract key metrics for analysis
+        system = analysis['system']
+        costs = analysis['costs']
+        sizing = analysis['sizing']
+        
+        power = system['power']
+        total_cost = costs['total_cost']
+        cost_per_mw = total_cost / power
+        
+        # Generate smart insights
+        recommendations = generate_smart_insights(analysis)
+        
+        # Get styling configuration (reuse cost analysis style)
+        config = OUTPUT_CONFIG['cost_analysis']  # Reuse existing styling
+        
+        # Create recommendations HTML
+        rec_html = create_recommendations_html(
+            recommendations=recommendations,
+            border_color=config['border_color'],
+            title_color=config['title_color']
+        )
+        
+        show_html(output_area, rec_html)
+        
+    except Exception as e:
+        display_error(output_area, f"Error displaying recommendations: {str(e)}")
             
             
 def display_visual_summary_cards(output_area, analysis):
@@ -412,35 +434,34 @@ def display_visual_summary_cards(output_area, analysis):
         output_area: Output widget to display in
         analysis: Complete system analysis dictionary
     """
-    with output_area:
-        try:
-            # Extract key metrics
-            system = analysis['system']
-            costs = analysis['costs']
-            sizing = analysis['sizing']
-            
-            power = system['power']
-            total_cost = costs['total_cost']
-            cost_per_mw = total_cost / power
-            
-            # Get effectiveness estimate
-            effectiveness = calculate_effectiveness(analysis)
-            
-            # Generate performance rating
-            rating_info = generate_performance_rating(cost_per_mw, effectiveness)
-            
-            # Create cards HTML
-            cards_html = create_summary_cards_html(
-                power=power,
-                total_cost=total_cost,
-                cost_per_mw=cost_per_mw,
-                effectiveness=effectiveness,
-                rating_info=rating_info,
-                eu_compliant=True  # Based on your validation
-            )
-            
-            display(HTML(cards_html))
-            
-        except Exception as e:
-            display_error(output_area, f"Error displaying summary cards: {str(e)}")
+    try:
+        # Extract key metrics
+        system = analysis['system']
+        costs = analysis['costs']
+        sizing = analysis['sizing']
+        
+        power = system['power']
+        total_cost = costs['total_cost']
+        cost_per_mw = total_cost / power
+        
+        # Get effectiveness estimate
+        effectiveness = calculate_effectiveness(analysis)
+        
+        # Generate performance rating
+        rating_info = generate_performance_rating(cost_per_mw, effectiveness)
+        
+        # Create cards HTML
+        cards_html = create_summary_cards_html(
+            power=power,
+            total_cost=total_cost,
+            cost_per_mw=cost_per_mw,
+            effectiveness=effectiveness,
+            rating_info=rating_info,
+            eu_compliant=True  # Based on your validation
+        )
+        
+        show_html(output_area, cards_html)
+        
+    except Exception as e:
+        display_error(output_area, f"Error displaying summary cards: {str(e)}")
             
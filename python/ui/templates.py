@@ -0,0 +1,146 @@
+"""
+HTML Fragment Templates and Output Diffing
+
+HtmlTemplate parses an HTML fragment with {field} / {field:spec}
+placeholders once, at import time, into its static text and fields;
+rendering only formats the field values and joins the pieces.
+
+show_html() and show_widget() remember what each output area last showed.
+Content identical to the last render is not sent to the frontend again,
+which saves kernel -> browser traffic when a recalculation changes only
+some of the panels (e.g. in remote JupyterHub sessions).
+
+IPython is imported when a fragment is first shown, so the templates (and
+the formatting helpers built on them) can be used without it.
+"""
+
+import weakref
+from string import Formatter
+
+# =============================================================================
+# TEMPLATES
+# =============================================================================
+
+class HtmlTemplate:
+    """
+    Precompiled HTML fragment.
+
+    Placeholders use str.format syntax without indexing or attribute
+    access: {name}, {name:spec} or {name!r}. Literal braces are written
+    as {{ and }}.
+
+    Example:
+        >>> row = HtmlTemplate('<tr><td>{label}</td><td>{value:,.0f}</td></tr>')
+        >>> row.render(label='Total', value=1234.5)
+        '<tr><td>Total</td><td>1,234</td></tr>'
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._parts = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if field is not None and (not field.isidentifier()):
+                raise ValueError(f"❌ Unsupported template field '{field}'")
+            self._parts.append((literal, field, spec or '', conversion))
+        self.fields = tuple(field for _, field, _, _ in self._parts if field is not None)
+
+    def render(self, **values):
+        """Fill the placeholders (same result as source.format(**values))."""
+        pieces = []
+        for literal, field, spec, conversion in self._parts:
+            pieces.append(literal)
+            if field is not None:
+                value = values[field]
+                if conversion == 'r':
+                    value = repr(value)
+                elif conversion == 's':
+                    value = str(value)
+                elif conversion == 'a':
+                    value = ascii(value)
+                pieces.append(format(value, spec))
+        return ''.join(pieces)
+
+    def render_rows(self, rows):
+        """Render once per mapping in rows and join the results."""
+        return ''.join(self.render(**row) for row in rows)
+
+# =============================================================================
+# OUTPUT DIFFING
+# =============================================================================
+
+# Last content shown per output area (HTML string or widget)
+_shown = weakref.WeakKeyDictionary()
+
+render_stats = {'sent': 0, 'skipped': 0, 'bytes_sent': 0, 'bytes_skipped': 0}
+
+def show_html(output_area, html):
+    """
+    Replace the contents of an output area with an HTML fragment.
+
+    Nothing is sent if the area still shows exactly this fragment.
+
+    Args:
+        output_area: Output widget
+        html: HTML string
+
+    Returns:
+        True if the fragment was sent, False if it was unchanged
+    """
+    if _shown.get(output_area) == html:
+        render_stats['skipped'] += 1
+        render_stats['bytes_skipped'] += len(html)
+        return False
+
+    from IPython.display import display, HTML
+
+    output_area.clear_output(wait=True)
+    with output_area:
+        display(HTML(html))
+    _shown[output_area] = html
+
+    render_stats['sent'] += 1
+    render_stats['bytes_sent'] += len(html)
+    return True
+
+def show_widget(output_area, widget):
+    """
+    Replace the contents of an output area with a widget.
+
+    Nothing is sent if the area already shows this widget object.
+
+    Returns:
+        True if the widget was (re)displayed
+    """
+    if _shown.get(output_area) is widget:
+        render_stats['skipped'] += 1
+        return False
+
+    from IPython.display import display
+
+    output_area.clear_output(wait=True)
+    with output_area:
+        display(widget)
+    _shown[output_area] = widget
+
+    render_stats['sent'] += 1
+    return True
+
+def append_html(output_area, html):
+    """Add an HTML fragment below the current contents of an output area."""
+    from IPython.display import display, HTML
+
+    forget_shown(output_area)
+    with output_area:
+        display(HTML(html))
+
+    render_stats['sent'] += 1
+    render_stats['bytes_sent'] += len(html)
+
+def append_text(output_area, text):
+    """Add plain text (e.g. captured print output) below the current contents of an output area."""
+    forget_shown(output_area)
+    output_area.append_stdout(text)
+
+def forget_shown(output_area):
+    """Mark an output area's contents as unknown (e.g. after clearing it)."""
+    _shown.pop(output_area, None)
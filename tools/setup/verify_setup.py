@@ -6,6 +6,8 @@ import os
 import sys
 import subprocess
 import importlib
+import contextlib
+import tempfile
 from pathlib import Path
 import platform
 
@@ -265,6 +267,588 @@ def test_autostart_import():
         print_status(f"autostart.py error: {str(e)}", "FAIL")
         return False
 
+# Packages that must import without the GUI stack (scripts, batch runs)
+HEADLESS_IMPORTS = ['core', 'physics', 'data', 'ui']
+GUI_MODULES = ['matplotlib', 'ipywidgets', 'IPython']
+IMPORT_TIME_BUDGET = 3.0  # seconds, for all of HEADLESS_IMPORTS
+
+# Checks whose failure makes the full verification exit with status 1 (CI)
+BLOCKING_CHECKS = ["Headless Imports", "Engine Checks"]
+
+def check_import_budget():
+    """Check that the calculation packages import without the GUI stack, within the time budget"""
+    python_dir = os.path.join(os.getcwd(), "python")
+    if not os.path.isdir(python_dir):
+        print_status("python/ directory not found for import check", "FAIL")
+        return False
+    
+    # Fresh interpreter: this script may already have imported the GUI packages
+    probe = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"for name in {HEADLESS_IMPORTS!r}: __import__(name)\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {GUI_MODULES!r} if m in sys.modules]\n"
+        "print(f'{elapsed:.3f}', *loaded)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=python_dir,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print_status(f"Import check failed: {result.stderr.strip().splitlines()[-1:]}", "FAIL")
+        return False
+    
+    # Last line: elapsed seconds, then any GUI modules that were loaded
+    elapsed, *loaded = result.stdout.strip().splitlines()[-1].split()
+    elapsed = float(elapsed)
+    modules = ', '.join(HEADLESS_IMPORTS)
+    
+    if loaded:
+        print_status(f"Importing {modules} loads {', '.join(loaded)}", "FAIL")
+        return False
+    
+    if elapsed > IMPORT_TIME_BUDGET:
+        print_status(f"Importing {modules} took {elapsed:.2f}s, over the {IMPORT_TIME_BUDGET:.1f}s budget", "FAIL")
+        return False
+    
+    print_status(f"{modules} import without {', '.join(GUI_MODULES)} ({elapsed:.2f}s)", "PASS")
+    return True
+
+# =============================================================================
+# ENGINE CHECKS
+# =============================================================================
+
+def check_economics():
+    """Lifecycle economics on hand-checked cash flows"""
+    import numpy as np
+    import pandas as pd
+    from core.economics import (build_cash_flows, calculate_npv, calculate_irr,
+                                calculate_lcoh, calculate_payback, rank_designs)
+    
+    # -100 up front, then 25/year for 5 years
+    flows = build_cash_flows(100, 30, 5, lifetime_years=5)
+    assert flows.tolist() == [[-100, 25, 25, 25, 25, 25]], f"cash flows {flows.tolist()}"
+    
+    npv = calculate_npv(flows, [0.0, 0.10])
+    assert np.allclose(npv, [[25.0, -100 + 25 * sum(1.1 ** -y for y in range(1, 6))]]), f"NPV {npv}"
+    
+    irr = calculate_irr(flows)[0]
+    assert abs(calculate_npv(flows, irr)[0, 0]) < 1e-4, f"NPV at IRR {irr:.6f} is not zero"
+    assert np.isnan(calculate_irr(build_cash_flows(100, 5, 10, lifetime_years=5))[0]), "IRR of a loss-maker"
+    
+    # (100 + 5 * 5) / (10 * 5) at 0% discounting
+    lcoh = calculate_lcoh(100, 5, 10, [0.0], lifetime_years=5)[0, 0]
+    assert abs(lcoh - 2.5) < 1e-9, f"LCOH {lcoh}"
+    
+    payback = calculate_payback(flows)[0]
+    assert abs(payback - 4.0) < 1e-9, f"payback {payback}"
+    
+    # A metric typo fails before any design is evaluated
+    try:
+        rank_designs(pd.DataFrame({'unused': [1]}), metric='nvp')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("rank_designs accepted an unknown metric")
+
+def check_uncertainty():
+    """Monte Carlo seeding: same seed, same draws, for any worker count"""
+    from core.uncertainty import (run_cost_monte_carlo, run_monte_carlo_scenarios,
+                                  UNCERTAINTY_DISTRIBUTIONS)
+    import numpy as np
+    
+    costs = {'pipe_cost_per_meter': 285.4, 'total_pipe_length': 14.9, 'control_valve_cost': 1200.0,
+             'isolation_valve_cost': 800.0, 'hx_cost': 23242.0, 'pump_cost': 10000.0,
+             'installation_cost': 10000.0}
+    
+    first = run_cost_monte_carlo(costs, n_draws=2000, seed=42, return_samples=True)
+    again = run_cost_monte_carlo(costs, n_draws=2000, seed=42, return_samples=True)
+    other = run_cost_monte_carlo(costs, n_draws=2000, seed=43, return_samples=True)
+    assert np.array_equal(first['samples'], again['samples']), "same seed gave different draws"
+    assert not np.array_equal(first['samples'], other['samples']), "different seeds gave the same draws"
+    
+    # Fixed factors reproduce the point estimate exactly
+    fixed = {name: {'distribution': 'uniform', 'low': 1.0, 'high': 1.0} for name in UNCERTAINTY_DISTRIBUTIONS}
+    flat = run_cost_monte_carlo(costs, n_draws=10, seed=0, distributions=fixed, return_samples=True)
+    assert np.allclose(flat['samples'], flat['point_estimate']), "unit factors moved the total cost"
+    
+    # Two identical scenarios still get independent streams
+    scenarios = [costs, dict(costs)]
+    serial = run_monte_carlo_scenarios(scenarios, n_draws=2000, seed=7, max_workers=1)
+    parallel = run_monte_carlo_scenarios(scenarios, n_draws=2000, seed=7, max_workers=2)
+    assert [r['percentiles'] for r in serial] == [r['percentiles'] for r in parallel], \
+        "results depend on max_workers"
+    assert serial[0]['percentiles'] != serial[1]['percentiles'], "scenarios share a random stream"
+
+def check_surrogate():
+    """Catalog surrogate: exact on linear data, honest error bounds and flags"""
+    import itertools
+    import numpy as np
+    import pandas as pd
+    from core.surrogate import (GridSurrogate, validate_surrogate, get_allhx_surrogate,
+                                estimate_allhx_data, SURROGATE_INPUTS)
+    from core.lookup import lookup_allhx_data
+    
+    grid = [[1, 2, 3, 4], [20, 25, 30, 35], [10, 12, 14], [2, 3, 5]]
+    table = pd.DataFrame([dict(zip(SURROGATE_INPUTS, point)) for point in itertools.product(*grid)])
+    table['F1'] = 1250 * table['wha'] + 3 * table['T1']
+    table['F2'] = 0.96 * table['F1']
+    table['T3'] = table['T1'] + table['itdt'] - table['TCSapp']
+    table['T4'] = table['T1'] - table['TCSapp']
+    table['costHX'] = 9000 * table['wha'] ** 2     # not linear: must show an error
+    
+    # Held-out rows (edges included) of linear outputs are reproduced exactly
+    for seed in range(5):
+        errors = validate_surrogate(table, holdout_fraction=0.3, seed=seed)['errors']
+        for name in ('F1', 'F2', 'T3', 'T4'):
+            assert errors[name]['max_abs'] < 1e-6, f"seed {seed}: {name} held-out error {errors[name]['max_abs']}"
+        assert errors['costHX']['p95_abs'] > 0, "error bound of a non-linear output is zero"
+    
+    model = GridSurrogate.from_table(table.drop(index=0))
+    inside = model.predict(wha=1.5, T1=22, itdt=11, TCSapp=2.5)
+    assert not inside['extrapolated'][0] and inside['support'][0] < 1, "missing corner not reflected in support"
+    outside = model.predict(wha=6, T1=30, itdt=12, TCSapp=3)
+    assert outside['extrapolated'][0], "point beyond the grid not flagged"
+    
+    # On the catalog: grid points come back unchanged, with finite bounds
+    if get_allhx_surrogate() is not None:
+        exact = lookup_allhx_data(2, 30, 12, 3)
+        estimate = estimate_allhx_data(2, 30, 12, 3)
+        assert exact is not None and estimate is not None, "catalog point unavailable"
+        assert abs(estimate['F1'] - exact['F1']) < 1e-6 and estimate['support'] == 1.0, "catalog point not reproduced"
+        bounds = [b for b in estimate['error_bounds'].values()]
+        assert all(np.isfinite(b) and b >= 0 for b in bounds), f"error bounds {bounds}"
+
+def check_catalog_query():
+    """Multi-vendor catalog: store queries match the in-memory catalog"""
+    import numpy as np
+    from data.catalog import (get_catalog, query_operating_point, list_vendors,
+                              OPERATING_POINT_COLUMNS, RANK_METRICS, AREA_M2_PER_UNIT)
+    
+    catalog = get_catalog()
+    assert len(catalog) > 0 and list_vendors(), "no vendor tables loaded"
+    
+    points = catalog.index.unique()
+    for point in points[::max(1, len(points) // 25)]:
+        expected = catalog.loc[[point]].reset_index()
+        vendors = set(expected['vendor'].astype(str))
+        for rank_by, column in RANK_METRICS.items():
+            if column == 'areaHX' and len(vendors) > 1 and not vendors <= set(AREA_M2_PER_UNIT):
+                continue  # covered below
+            offers = query_operating_point(*point, rank_by=rank_by)
+            assert sorted(offers['vendor'].astype(str)) == sorted(expected['vendor'].astype(str)), \
+                f"vendors at {point}"
+            assert (offers[OPERATING_POINT_COLUMNS].to_numpy() == np.array(point)).all(), f"rows of another point at {point}"
+            assert list(offers['rank']) == list(range(1, len(offers) + 1)), f"ranks at {point}"
+            ranked = offers[column].to_numpy(float)
+            assert np.all(np.diff(ranked[~np.isnan(ranked)]) >= 0), f"not ranked by {column} at {point}"
+    
+    # areaHX units differ by vendor: areas rank across vendors only in m²
+    mixed = next((p for p in points if catalog.loc[[p]]['vendor'].nunique() > 1), None)
+    if mixed is not None:
+        expected = catalog.loc[[mixed]].reset_index()
+        labels = sorted(expected['vendor'].astype(str))
+        saved = dict(AREA_M2_PER_UNIT)
+        try:
+            AREA_M2_PER_UNIT.clear()
+            try:
+                query_operating_point(*mixed, rank_by='area')
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("areas in unknown vendor units ranked together")
+            single = query_operating_point(*mixed, rank_by='area', vendors=labels[:1])
+            assert list(single['vendor'].astype(str)) == labels[:1], "single-vendor area ranking"
+            
+            # Scale each vendor so that the largest reported area becomes the smallest in m²
+            areas = dict(zip(expected['vendor'].astype(str), expected['areaHX']))
+            AREA_M2_PER_UNIT.update({vendor: 1.0 / area ** 2 for vendor, area in areas.items()})
+            ranked = list(query_operating_point(*mixed, rank_by='area')['vendor'].astype(str))
+            assert ranked == sorted(areas, key=lambda v: 1.0 / areas[v]), f"areas not ranked in m²: {ranked}"
+        finally:
+            AREA_M2_PER_UNIT.clear()
+            AREA_M2_PER_UNIT.update(saved)
+    
+    assert query_operating_point(2.5, 30, 12, 3).empty, "off-grid point returned offers"
+    try:
+        query_operating_point(*points[0], rank_by='price')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown ranking accepted")
+
+def check_column_store():
+    """Column store: binary-search select matches a scan, rewrites swap atomically"""
+    import numpy as np
+    import pandas as pd
+    from data.columnar import ColumnStore, ColumnStoreWriter, STORE_POINTER_FILE
+    
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({'a': rng.integers(0, 5, 3000), 'b': rng.integers(0, 7, 3000),
+                          'c': rng.integers(0, 3, 3000).astype(float),
+                          'vendor': rng.choice(['X', 'Y'], 3000)}).sort_values(['a', 'b'], ignore_index=True)
+    frame.loc[5, 'c'] = np.nan
+    
+    with tempfile.TemporaryDirectory() as scratch:
+        store_dir = os.path.join(scratch, 'test.columns')
+        writer = ColumnStoreWriter(store_dir, 'TEST', sorted_by=['a', 'b', 'c'])
+        for start in range(0, len(frame), 1000):
+            writer.append(frame.iloc[start:start + 1000])
+        store = writer.close()
+        assert store.meta.get('sorted_by') == ['a', 'b'], f"sort order recorded as {store.meta.get('sorted_by')}"
+        
+        for query in [dict(a=2, b=3), dict(a=2), dict(b=3), dict(a=4, b=6, c=1.0), dict(a=1, vendor='Y'),
+                      dict(a=9), dict(a=2, b=3.5), dict(c=np.nan), dict(a=0, vendor='Z')]:
+            mask = np.ones(len(frame), dtype=bool)
+            for name, value in query.items():
+                mask &= (frame[name] == value).to_numpy()
+            rows = store.select(**query)
+            assert np.array_equal(rows, np.flatnonzero(mask)), f"select({query}) differs from a scan"
+        
+        # A rewrite never leaves the store unreadable, and open readers keep their version
+        writer = ColumnStoreWriter(store_dir, 'TEST', sorted_by=['a'])
+        writer.append(frame.iloc[:10])
+        assert len(ColumnStore.open(store_dir)) == len(frame), "store unreadable during a rewrite"
+        replaced = writer.close()
+        assert len(replaced) == 10 and len(ColumnStore.open(store_dir)) == 10, "rewrite not published"
+        assert np.array_equal(store.column('b'), frame['b'].to_numpy(float)), "open reader lost its version"
+        leftovers = sorted(set(os.listdir(store_dir)) - {STORE_POINTER_FILE, replaced.version})
+        assert not leftovers, f"old versions left behind: {leftovers}"
+
+def check_streamed_catalog():
+    """Streamed ALLHX: catalog and surrogate built from the column store match the in-memory table"""
+    import contextlib
+    import io
+    import shutil
+    import numpy as np
+    from data import loader
+    from data.catalog import build_catalog, OPERATING_POINT_COLUMNS
+    from core.surrogate import build_allhx_surrogate, SURROGATE_INPUTS
+    
+    assert loader.get_data_dir() and loader.is_csv_loaded('ALLHX'), "ALLHX not loaded"
+    source = os.path.join(loader.get_data_dir(), 'ALLHX.csv')
+    expected_catalog = build_catalog({'ALLHX': 'ALLHX'})
+    expected_model = build_allhx_surrogate(validate=False)
+    
+    threshold = loader.STREAMING_THRESHOLD_BYTES
+    with _scratch_data_dir() as data_dir:
+        shutil.copy(source, os.path.join(data_dir, 'ALLHX.csv'))
+        loader.STREAMING_THRESHOLD_BYTES = 0
+        try:
+            loader.load_csv_files(data_dir, use_snapshots=False)
+        finally:
+            loader.STREAMING_THRESHOLD_BYTES = threshold
+        
+        store = loader.get_column_store('ALLHX')
+        assert store is not None, "ALLHX not streamed into a column store"
+        
+        # The recorded order is the longest leading run of the operating point the file is sorted by
+        points = store.to_frame(columns=OPERATING_POINT_COLUMNS)
+        sorted_run = []
+        for name in OPERATING_POINT_COLUMNS:
+            columns = sorted_run + [name]
+            if not points[columns].equals(points[columns].sort_values(columns, kind='stable', ignore_index=True)):
+                break
+            sorted_run.append(name)
+        assert sorted_run and store.meta.get('sorted_by') == sorted_run, \
+            f"sort order recorded as {store.meta.get('sorted_by')}, rows sorted by {sorted_run}"
+        for point in points.drop_duplicates().itertuples(index=False):
+            rows = store.select(**point._asdict())
+            assert np.array_equal(rows, np.flatnonzero((points == tuple(point)).all(axis=1))), \
+                f"select{tuple(point)} differs from a scan"
+        chunks = list(store.iter_frames(['wha', 'Unit'], chunk_rows=7))
+        assert len(chunks) == -(-len(store) // 7), "chunk count"
+        assert all(len(chunk) == 7 for chunk in chunks[:-1]), "chunk sizes"
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            catalog = build_catalog({'ALLHX': 'ALLHX'})
+            model = build_allhx_surrogate(validate=False)
+        assert 'materializing' not in output.getvalue(), "the column store was materialized"
+        assert catalog.equals(expected_catalog), "catalog from the column store differs"
+        points = {name: axis for name, axis in zip(SURROGATE_INPUTS, np.meshgrid(*model.axes))}
+        for name, values in model.predict(**points).items():
+            assert np.allclose(values, expected_model.predict(**points)[name], equal_nan=True), \
+                f"surrogate {name} from the column store differs"
+
+def check_schema_typing():
+    """Unparseable numbers are typed as NaN (not 0.0) and dropped by row filters"""
+    import numpy as np
+    import pandas as pd
+    from data.schema import convert_column, apply_schema
+    
+    raw = pd.Series(['1,5', 'abc', '', 'n/a', None, '12'])
+    for locale in ('auto', 'us', 'eu'):
+        typed = convert_column(raw, locale=locale)
+        assert typed.iloc[1:5].isna().all(), f"junk typed as {list(typed.iloc[1:5])} ({locale})"
+        assert typed.iloc[5] == 12.0, f"'12' typed as {typed.iloc[5]} ({locale})"
+    assert convert_column(raw).iloc[0] == 1.5, "'1,5' not read as a decimal comma"
+    
+    table = apply_schema('MW PRICE DATA', pd.DataFrame({'MW': ['1', 'abc', '3'],
+                                                       'Price': ['100', '200', 'tbd']}))
+    assert list(table['MW']) == [1.0], f"rows with junk numbers kept: {table.to_dict('records')}"
+    assert not np.any(table.to_numpy(float) == 0), "junk typed as 0.0"
+
+CONVERTER_SPEEDUP = 2.0  # minimum, single-pass parser over the regex reference
+
+def check_converter():
+    """Number parsing: the single-pass parser matches the regex reference on a fuzz corpus, and is faster"""
+    import time
+    from data.converter import _convert_value, _convert_value_regex, _same_conversion, fuzz_corpus
+    
+    corpus = fuzz_corpus(4000) + ['1.234.567,89', '€1,375.2', '-3,5%', '1,493', '1 234,5', '$1,234']
+    mismatches = [v for v in corpus if not _same_conversion(_convert_value(v), _convert_value_regex(v))]
+    assert not mismatches, f"parser differs from regex reference on {mismatches[:5]!r}"
+    
+    def timed_pass(convert):
+        start = time.perf_counter()
+        for value in corpus:
+            convert(value)
+        return time.perf_counter() - start
+    
+    fast = min(timed_pass(_convert_value) for _ in range(3))
+    regex = min(timed_pass(_convert_value_regex) for _ in range(3))
+    assert fast * CONVERTER_SPEEDUP < regex, \
+        f"parser took {fast * 1000:.0f} ms, regex reference {regex * 1000:.0f} ms"
+
+def check_result_export():
+    """Result export: CSV and JSON Lines read back as written, failed exports leave no file, Parquet needs pyarrow"""
+    import importlib.util
+    import numpy as np
+    import pandas as pd
+    from core.batch_analysis import ANALYSIS_COLUMNS, INPUT_COLUMNS
+    from core.result_export import export_results
+    
+    frame = pd.DataFrame({column: np.arange(3, dtype=float) + i for i, column in enumerate(ANALYSIS_COLUMNS)})
+    frame['status'] = ['ok', 'no_data', 'ok']
+    frame.loc[1, [c for c in ANALYSIS_COLUMNS if c not in INPUT_COLUMNS + ['status']]] = np.nan
+    
+    with tempfile.TemporaryDirectory() as scratch:
+        readers = {'csv': pd.read_csv, 'jsonl': lambda path: pd.read_json(path, lines=True)}
+        for fmt, read in readers.items():
+            summary = export_results(frame, os.path.join(scratch, 'results'), fmt=fmt)
+            assert summary['rows'] == len(frame), f"{fmt}: {summary['rows']} rows written"
+            back = read(summary['path'])
+            assert list(back.columns) == ANALYSIS_COLUMNS, f"{fmt}: columns {list(back.columns)}"
+            pd.testing.assert_frame_equal(back, frame, check_dtype=False, obj=f"{fmt} export")
+            
+            # An export that fails midway leaves the earlier file as it was, and no temporary file
+            def failing_rows():
+                yield from frame.to_dict('records')[:2]
+                raise RuntimeError("batch failed")
+            try:
+                export_results(failing_rows(), os.path.join(scratch, 'results'), fmt=fmt)
+            except RuntimeError:
+                pass
+            else:
+                raise AssertionError(f"{fmt}: failing export did not raise")
+            pd.testing.assert_frame_equal(read(summary['path']), frame, check_dtype=False,
+                                          obj=f"{fmt} file after a failed export")
+            leftovers = [f for f in os.listdir(scratch) if f.endswith('.tmp')]
+            assert not leftovers, f"{fmt}: temporary files left: {leftovers}"
+        
+        path = os.path.join(scratch, 'results.parquet')
+        if importlib.util.find_spec('pyarrow') is not None:
+            export_results(frame, path)
+            pd.testing.assert_frame_equal(pd.read_parquet(path), frame, check_dtype=False, obj="parquet export")
+        else:
+            try:
+                export_results(frame, path)
+            except ImportError:
+                assert not os.path.exists(path), "partial Parquet file left without pyarrow"
+            else:
+                raise AssertionError("Parquet export succeeded without pyarrow")
+
+@contextlib.contextmanager
+def _scratch_data_dir():
+    """Empty temporary data directory, loaded on its own; the previous data is reloaded afterwards"""
+    from data import loader
+    
+    previous = loader.get_data_dir()
+    with tempfile.TemporaryDirectory() as data_dir:
+        try:
+            for name in loader.list_loaded_csvs():
+                loader._drop_table(name)
+            yield data_dir
+        finally:
+            for name in loader.list_loaded_csvs():
+                loader._drop_table(name)
+            if previous:
+                loader.load_csv_files(previous)
+
+def _write_dictionary(path, variables):
+    """Data dictionary workbook mapping 'Data Point Name' -> 'Variable Name'"""
+    import pandas as pd
+    rows = [{'Data Point Name': name, 'Variable Name': variable} for name, variable in variables.items()]
+    pd.DataFrame(rows).to_excel(path, index=False)
+
+def check_workbook_snapshots():
+    """Workbook snapshots: keyed on the data dictionary and the file version read, no temp files left behind"""
+    import pandas as pd
+    from data import loader
+    from data.snapshot import read_snapshot, write_snapshot, SNAPSHOT_DIR_NAME
+    
+    with _scratch_data_dir() as data_dir:
+        dictionary = os.path.join(data_dir, 'TEST_DATA_DICTIONARY.xlsx')
+        
+        # A dictionary on its own is still loaded
+        _write_dictionary(dictionary, {'Total Heat Available': 'wha'})
+        loader.load_csv_files(data_dir)
+        assert loader.is_csv_loaded(loader.DATA_DICTIONARY_TABLE), "dictionary-only directory not loaded"
+        
+        pd.DataFrame({'Total Heat Available': [1.0, 2.0]}).to_excel(os.path.join(data_dir, 'PLANT.xlsx'), index=False)
+        loader.load_csv_files(data_dir)
+        assert 'wha' in loader.get_csv_data('PLANT').columns, "column not mapped through the dictionary"
+        
+        # Same workbook, new dictionary: the snapshot from the old mapping is not reused
+        _write_dictionary(dictionary, {'Total Heat Available': 'heat_mw'})
+        loader.load_csv_files(data_dir)
+        columns = list(loader.get_csv_data('PLANT').columns)
+        assert columns == ['heat_mw'], f"stale snapshot served, columns {columns}"
+        
+        # An unpicklable table is not cached, and leaves no temporary file
+        source = os.path.join(data_dir, 'PLANT.xlsx')
+        assert not write_snapshot(source, {'BAD': pd.DataFrame({'x': [lambda: None]})}), "unpicklable snapshot written"
+        leftovers = [f for f in os.listdir(os.path.join(data_dir, SNAPSHOT_DIR_NAME)) if f.endswith('.tmp')]
+        assert not leftovers, f"temporary files left: {leftovers}"
+        
+        # A file edited while it is parsed is neither cached nor tracked as the edited version
+        edited = os.path.join(data_dir, 'EDITED.csv')
+        pd.DataFrame({'x': [1, 2]}).to_csv(edited, index=False)
+        read_csv_file = loader._read_csv_file
+        
+        def read_then_edit(path):
+            tables = read_csv_file(path)
+            if path == edited:
+                pd.DataFrame({'x': [1, 2, 3]}).to_csv(edited, index=False)
+            return tables
+        
+        loader._read_csv_file = read_then_edit
+        try:
+            loader.load_csv_files(data_dir)
+        finally:
+            loader._read_csv_file = read_csv_file
+        assert read_snapshot(edited, loader.schema_signature()) is None, "snapshot of the old contents served"
+        assert 'EDITED' in loader.reload_changed_files(), "edit made during parsing not detected"
+        assert len(loader.get_csv_data('EDITED')) == 3, "edited contents not loaded"
+
+def check_dictionary_reload():
+    """Hot reload: editing the data dictionary remaps already-loaded workbooks"""
+    import contextlib
+    import io
+    import pandas as pd
+    from data import loader
+    
+    with _scratch_data_dir() as data_dir:
+        dictionary = os.path.join(data_dir, 'TEST_DATA_DICTIONARY.xlsx')
+        _write_dictionary(dictionary, {'Total Heat Available': 'wha'})
+        pd.DataFrame({'Total Heat Available': [1.0, 2.0]}).to_excel(os.path.join(data_dir, 'PLANT.xlsx'), index=False)
+        pd.DataFrame({'MW': [1.0], 'Price': [2.0]}).to_csv(os.path.join(data_dir, 'HX.csv'), index=False)
+        loader.load_csv_files(data_dir)
+        assert list(loader.get_csv_data('PLANT').columns) == ['wha'], "column not mapped through the dictionary"
+        assert not loader.reload_changed_files(), "unchanged directory reported changes"
+        
+        # Rewrite the dictionary with a distinct mtime, as an editor save would
+        _write_dictionary(dictionary, {'Total Heat Available': 'heat_mw'})
+        stat = os.stat(dictionary)
+        os.utime(dictionary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        affected = loader.reload_changed_files()
+        
+        assert 'PLANT' in affected, f"workbook not reloaded, affected {sorted(affected)}"
+        assert 'HX' not in affected, "unchanged CSV reloaded"
+        columns = list(loader.get_csv_data('PLANT').columns)
+        assert columns == ['heat_mw'], f"stale mapping after reload, columns {columns}"
+        assert list(loader.get_csv_data('PLANT')['heat_mw']) == [1.0, 2.0], "workbook values changed"
+        
+        # A CSV caught mid-write keeps its old table until it parses again
+        hx = os.path.join(data_dir, 'HX.csv')
+        open(hx, 'w').close()
+        with contextlib.redirect_stdout(io.StringIO()):
+            affected = loader.reload_changed_files()
+        assert 'HX' not in affected, "unparseable CSV reported as reloaded"
+        assert list(loader.get_csv_data('HX')['Price']) == [2.0], "old table lost to an unparseable CSV"
+        pd.DataFrame({'MW': [1.0], 'Price': [3.0]}).to_csv(hx, index=False)
+        affected = loader.reload_changed_files()
+        assert 'HX' in affected, "fixed CSV not retried"
+        assert list(loader.get_csv_data('HX')['Price']) == [3.0], "new CSV values not loaded"
+
+# Time of a single-input chart update, as a fraction of drawing the charts afresh
+CHART_UPDATE_BUDGET = 0.5
+
+def check_chart_updates():
+    """System charts: a single input change redraws in place, as a fresh canvas would, within budget"""
+    import contextlib
+    import io
+    import statistics
+    import time
+    import numpy as np
+    from core.original_calculations import get_complete_system_analysis
+    from ui.charts import SystemChartCanvas
+    
+    # One dropdown change: the approach temperature
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyses = [get_complete_system_analysis(1, 20, 10, approach) for approach in (2, 3)]
+    assert all(analyses), "system analysis unavailable"
+    
+    def timed_update(canvas, analysis):
+        start = time.perf_counter()
+        canvas.update(analysis)
+        return time.perf_counter() - start
+    
+    builds = [timed_update(SystemChartCanvas(), analyses[0]) for _ in range(2)]
+    
+    # The first change may lay the figure out again; repeating it must not
+    canvas = SystemChartCanvas()
+    canvas.update(analyses[0])
+    canvas.update(analyses[1])
+    relayouts = canvas.stats['relayouts']
+    updates = [timed_update(canvas, analyses[i % 2]) for i in range(6)]
+    assert canvas.stats['relayouts'] == relayouts, "a repeated change laid the figure out again"
+    
+    fresh = SystemChartCanvas()
+    fresh.update(analyses[1])
+    assert np.array_equal(np.asarray(canvas.canvas.buffer_rgba()), np.asarray(fresh.canvas.buffer_rgba())), \
+        "updated canvas differs from a fresh one"
+    
+    update, build = statistics.median(updates), statistics.median(builds)
+    assert update < CHART_UPDATE_BUDGET * build, \
+        f"single change took {update * 1000:.0f} ms, fresh charts {build * 1000:.0f} ms"
+
+# Assertion-based checks of the calculation engines: (name, function)
+ENGINE_CHECKS = [
+    ("Lifecycle economics", check_economics),
+    ("Monte Carlo seeding", check_uncertainty),
+    ("ALLHX surrogate", check_surrogate),
+    ("HX catalog query", check_catalog_query),
+    ("Column store", check_column_store),
+    ("Streamed catalog", check_streamed_catalog),
+    ("Schema typing", check_schema_typing),
+    ("Number conversion", check_converter),
+    ("Result export", check_result_export),
+    ("Workbook snapshots", check_workbook_snapshots),
+    ("Dictionary hot reload", check_dictionary_reload),
+    ("Chart updates", check_chart_updates),
+]
+
+def run_engine_checks():
+    """Run ENGINE_CHECKS against the code in python/"""
+    python_dir = os.path.join(os.getcwd(), "python")
+    if python_dir not in sys.path:
+        sys.path.insert(0, python_dir)
+    
+    all_good = True
+    for name, check in ENGINE_CHECKS:
+        try:
+            check()
+            print_status(name, "PASS")
+        except AssertionError as e:
+            print_status(f"{name}: {e}", "FAIL")
+            all_good = False
+        except Exception as e:
+            print_status(f"{name}: {type(e).__name__}: {e}", "FAIL")
+            all_good = False
+    
+    return all_good
+
 def check_system_info():
     """Display system information"""
     print_status(f"Platform: {platform.platform()}", "INFO")
@@ -273,7 +857,7 @@ def check_system_info():
     print_status(f"PATH includes: {'; '.join(sys.path[:3])}...", "INFO")
 
 def run_full_verification():
-    """Run complete verification suite"""
+    """Run complete verification suite; False if one of BLOCKING_CHECKS failed"""
     print(f"{Colors.BOLD}Heat Reuse Tool - Setup Verification{Colors.END}")
     print("=" * 50)
     
@@ -307,6 +891,11 @@ def run_full_verification():
     print(f"\n{Colors.BOLD}Functionality Tests:{Colors.END}")
     data_load_ok = test_data_loading()
     autostart_ok = test_autostart_import()
+    imports_ok = check_import_budget()
+    
+    # Calculation Engines
+    print(f"\n{Colors.BOLD}Engine Checks:{Colors.END}")
+    engines_ok = run_engine_checks()
     
     # Summary
     print(f"\n{Colors.BOLD}Verification Summary:{Colors.END}")
@@ -321,7 +910,9 @@ def run_full_verification():
         ("Project Structure", structure_ok),
         ("CSV Data Files", csv_ok),
         ("Data Loading", data_load_ok),
-        ("Autostart Import", autostart_ok)
+        ("Autostart Import", autostart_ok),
+        ("Headless Imports", imports_ok),
+        ("Engine Checks", engines_ok)
     ]
     
     passed = sum(1 for _, status in all_checks if status)
@@ -335,15 +926,14 @@ def run_full_verification():
     
     if passed == total:
         print_status("🎉 All checks passed! Heat Reuse Tool should work correctly.", "PASS")
-        return True
     elif passed >= total * 0.8:  # 80% pass rate
         print_status("⚠️  Most checks passed. Minor issues may affect functionality.", "WARN")
         print_recommendations(all_checks)
-        return False
     else:
         print_status("❌ Multiple critical issues found. Setup needs attention.", "FAIL")
         print_recommendations(all_checks)
-        return False
+    
+    return all(status for name, status in all_checks if name in BLOCKING_CHECKS)
 
 def print_recommendations(all_checks):
     """Print specific recommendations based on failed checks"""
@@ -391,6 +981,14 @@ def print_recommendations(all_checks):
             "Verify python/autostart.py exists",
             "Check current working directory",
             "Run from project root directory"
+        ],
+        "Headless Imports": [
+            "Keep ipywidgets, IPython and matplotlib imports inside ui functions or ui submodules",
+            "Check which module loads them: python -X importtime -c \"import core\""
+        ],
+        "Engine Checks": [
+            "Run only the engine checks: python tools/setup/verify_setup.py checks",
+            "A failing check names the calculation and the value that was off"
         ]
     }
     
@@ -488,18 +1086,27 @@ def main():
             quick_check()
         elif sys.argv[1] == "export":
             export_environment()
+        elif sys.argv[1] == "checks":
+            if not run_engine_checks():
+                sys.exit(1)
+        elif sys.argv[1] == "imports":
+            if not check_import_budget():
+                sys.exit(1)
         elif sys.argv[1] == "help":
             print("Heat Reuse Tool Verification Script")
             print("Usage:")
-            print("  python verify_setup.py        - Full verification")
+            print("  python verify_setup.py        - Full verification (exit code 1 if imports or engine checks fail)")
             print("  python verify_setup.py quick  - Quick essential checks")
             print("  python verify_setup.py export - Export environment details")
+            print("  python verify_setup.py checks - Engine checks only (exit code 1 on failure)")
+            print("  python verify_setup.py imports - Headless import check only (exit code 1 on failure)")
             print("  python verify_setup.py help   - Show this help")
         else:
             print(f"Unknown option: {sys.argv[1]}")
             print("Use 'python verify_setup.py help' for usage")
     else:
-        run_full_verification()
+        if not run_full_verification():
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file